@@ -0,0 +1,75 @@
+####
+# This script compares the ways of reading the cursor from large Metadata API pages, and the cost of
+# decoding those pages with the standard json module and, if it is installed, with orjson.
+#
+# It builds synthetic GraphQL pages locally, so no server is needed.
+#
+# To run the script, you must have installed Python 3.9 or later.
+####
+
+import argparse
+import json
+import timeit
+
+from tableauserverclient.server.endpoint.metadata_endpoint import extract_values, get_page_info
+
+
+def make_page(nodes, depth):
+    def make_node(i):
+        node = {"id": f"field-{i}", "name": f"Field {i}", "description": "x" * 40}
+        inner = node
+        for level in range(depth):
+            inner["upstreamColumns"] = [{"id": f"column-{i}-{level}", "name": f"Column {level}", "table": {}}]
+            inner = inner["upstreamColumns"][0]["table"]
+        return node
+
+    return {
+        "data": {
+            "fieldsConnection": {
+                "nodes": [make_node(i) for i in range(nodes)],
+                "pageInfo": {"hasNextPage": True, "endCursor": "eyJsYXN0SWQiOiJmaWVsZC05OTkifQ=="},
+                "totalCount": nodes * 10,
+            }
+        }
+    }
+
+
+def recursive_page_info(result):
+    # the cursor extraction used before pageInfo was looked up directly
+    next_page = extract_values(result, "hasNextPage")
+    cursor = extract_values(result, "endCursor")
+    return next_page.pop() if next_page else None, cursor.pop() if cursor else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cursor extraction and decoding of Metadata API pages.")
+    parser.add_argument("--nodes", type=int, default=1000, help="number of nodes per page")
+    parser.add_argument("--depth", type=int, default=5, help="nesting depth of each node")
+    parser.add_argument("--repeat", type=int, default=20, help="number of timed runs for each case")
+    args = parser.parse_args()
+
+    page = make_page(args.nodes, args.depth)
+    content = json.dumps(page).encode()
+    print(f"Page with {args.nodes} nodes at depth {args.depth}: {len(content) / 1024:.0f} KiB")
+
+    assert recursive_page_info(page) == get_page_info(page) == get_page_info(page, "fieldsConnection")
+    cases = {
+        "recursive extract_values": lambda: recursive_page_info(page),
+        "pageInfo search": lambda: get_page_info(page),
+        "pageInfo path": lambda: get_page_info(page, "fieldsConnection"),
+        "json.loads": lambda: json.loads(content),
+    }
+    try:
+        import orjson
+
+        cases["orjson.loads"] = lambda: orjson.loads(content)
+    except ImportError:
+        print("orjson is not installed, skipping it")
+
+    for name, case in cases.items():
+        seconds = min(timeit.repeat(case, number=1, repeat=args.repeat))
+        print(f"{name:>26}: {seconds * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
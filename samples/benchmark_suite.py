@@ -0,0 +1,207 @@
+####
+# This script measures the client's hot paths: listing content with Pager and QuerySet, parsing pages with
+# from_response, building large requests with RequestFactory, chunked uploads and downloads, and job polling.
+#
+# It runs against a MockTableauServer started in a separate process, so no Tableau Server is needed and the
+# server's work does not count against the client. Results are written as JSON with --output, and --compare
+# reports the change from an earlier result file and exits with status 1 if any benchmark got slower by more
+# than --threshold, so that results can be compared across commits:
+#
+#   git checkout main && python samples/benchmark_suite.py --output main.json
+#   git checkout my-branch && python samples/benchmark_suite.py --compare main.json
+#
+# To run the script, you must have installed Python 3.9 or later.
+####
+
+import argparse
+import io
+import json
+import multiprocessing
+import platform
+import subprocess
+import sys
+import time
+import timeit
+from typing import Any, Callable
+
+import tableauserverclient as TSC
+from tableauserverclient.config import BYTES_PER_MB
+from tableauserverclient.server import RequestFactory
+
+# each result is a value, its unit and whether a larger value is better
+Results = dict[str, dict[str, Any]]
+
+
+def serve(options, connection):
+    with TSC.MockTableauServer(**options) as mock:
+        connection.send(mock.address)
+        # serve until the benchmarks are done
+        connection.recv()
+
+
+def best_time(case: Callable[[], Any], repeat: int) -> float:
+    return min(timeit.repeat(case, number=1, repeat=repeat))
+
+
+def record(results: Results, name: str, value: float, unit: str, higher_is_better: bool) -> None:
+    results[name] = {"value": value, "unit": unit, "higher_is_better": higher_is_better}
+    print(f"{name:>42}: {value:12.2f} {unit}")
+
+
+def bench_listing(server, results: Results, repeat: int) -> None:
+    for name in ("users", "projects", "workbooks", "views"):
+        endpoint = getattr(server, name)
+        for page_size in (100, 1000):
+            items = len(list(TSC.Pager(endpoint, TSC.RequestOptions(pagesize=page_size))))
+            seconds = best_time(lambda: list(TSC.Pager(endpoint, TSC.RequestOptions(pagesize=page_size))), repeat)
+            record(results, f"pager.{name}.pagesize_{page_size}", items / seconds, "items/s", True)
+
+    def query():
+        return list(server.users.filter(site_role="Viewer", page_size=1000).order_by("name"))
+
+    items = len(query())
+    seconds = best_time(query, repeat)
+    record(results, "queryset.users.filter_sort", items / seconds, "items/s", True)
+
+
+def bench_parsing(server, results: Results, repeat: int) -> None:
+    namespace = server.namespace
+    models: dict[str, Any] = {"users": TSC.UserItem, "workbooks": TSC.WorkbookItem, "views": TSC.ViewItem}
+    for name, model in models.items():
+        for page_size in (100, 1000):
+            url = getattr(server, name).baseurl
+            content = server.session.get(
+                url, params={"pageSize": page_size}, headers={"x-tableau-auth": server.auth_token}
+            ).content
+            seconds = best_time(lambda: model.from_response(content, namespace), repeat)
+            record(results, f"parse.{name}.{page_size}", seconds * 1000, "ms", False)
+
+
+def bench_requests(server, results: Results, repeat: int) -> None:
+    users = [user.id for user in TSC.Pager(server.users, TSC.RequestOptions(pagesize=1000))]
+    seconds = best_time(lambda: RequestFactory.Group.add_users_req(users), repeat)
+    record(results, f"request.group_add_users.{len(users)}", seconds * 1000, "ms", False)
+
+    capabilities = {TSC.Permission.Capability.Read: TSC.Permission.Mode.Allow}
+    rules = [TSC.PermissionsRule(TSC.UserItem.as_reference(user), capabilities) for user in users]
+    seconds = best_time(lambda: RequestFactory.Permission.add_req(rules), repeat)
+    record(results, f"request.permissions.{len(rules)}", seconds * 1000, "ms", False)
+
+    workbook = TSC.WorkbookItem("project-id", name="Large")
+    connections = [TSC.ConnectionItem() for _ in range(500)]
+    for number, connection in enumerate(connections):
+        connection.server_address = f"db{number}.example.com"
+        connection.connection_credentials = TSC.ConnectionCredentials("user", "password", embed=True)
+    seconds = best_time(lambda: RequestFactory.Workbook.publish_req_chunked(workbook, connections), repeat)
+    record(results, "request.workbook_publish.500_connections", seconds * 1000, "ms", False)
+
+
+def bench_transfers(server, results: Results, repeat: int, size_mb: int) -> None:
+    content = bytes(size_mb * BYTES_PER_MB)
+    seconds = best_time(lambda: server.fileuploads.upload(io.BytesIO(content)), repeat)
+    record(results, "upload.chunked", size_mb / seconds, "MB/s", True)
+
+    workbook = server.workbooks.get()[0][0]
+    seconds = best_time(lambda: server.workbooks.download(workbook.id, io.BytesIO()), repeat)
+    record(results, "download.workbook", size_mb / seconds, "MB/s", True)
+
+
+def bench_jobs(server, results: Results, repeat: int, job_duration: float) -> None:
+    workbook = server.workbooks.get()[0][0]
+    job = server.workbooks.refresh(workbook)
+    seconds = best_time(lambda: server.jobs.get_by_id(job.id), repeat * 10)
+    record(results, "jobs.get_by_id", seconds * 1000, "ms", False)
+
+    def wait():
+        server.jobs.wait_for_job(server.workbooks.refresh(workbook))
+
+    # the time spent waiting after the job completed, which depends on how often the job is polled
+    seconds = best_time(wait, repeat)
+    record(results, "jobs.wait_for_job.overshoot", (seconds - job_duration) * 1000, "ms", False)
+
+
+def compare(results: Results, baseline: Results, threshold: float) -> bool:
+    regressed = False
+    print(f"\n{'benchmark':>42}  {'baseline':>12}  {'current':>12}  change")
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before, after = baseline[name]["value"], result["value"]
+        if before <= 0:
+            continue
+        change = (after - before) / before
+        worse = -change if result["higher_is_better"] else change
+        flag = ""
+        if worse > threshold:
+            regressed = True
+            flag = "  REGRESSION"
+        print(f"{name:>42}  {before:12.2f}  {after:12.2f}  {change:+7.1%}{flag}")
+    return regressed
+
+
+def commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True).stdout.strip()
+    except OSError:
+        return ""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the client's hot paths against a local mock server.")
+    parser.add_argument("--users", type=int, default=5000, help="number of users on the mock server")
+    parser.add_argument("--workbooks", type=int, default=2000, help="number of workbooks on the mock server")
+    parser.add_argument("--transfer-mb", type=int, default=64, help="size of the uploaded and downloaded files")
+    parser.add_argument("--repeat", type=int, default=5, help="number of timed runs for each case")
+    parser.add_argument("--output", metavar="FILEPATH", help="write the results to this JSON file")
+    parser.add_argument("--compare", metavar="FILEPATH", help="compare the results with an earlier JSON file")
+    parser.add_argument("--threshold", type=float, default=0.1, help="slowdown reported as a regression")
+    args = parser.parse_args()
+
+    job_duration = 0.2
+    options = {
+        "users": args.users,
+        "workbooks": args.workbooks,
+        "views_per_workbook": 3,
+        "job_duration": job_duration,
+        "content_size_kb": args.transfer_mb * 1024,
+    }
+    connection, child_connection = multiprocessing.Pipe()
+    process = multiprocessing.Process(target=serve, args=(options, child_connection), daemon=True)
+    process.start()
+    address = connection.recv()
+
+    results: Results = {}
+    try:
+        server = TSC.Server(address, use_server_version=True)
+        server.auth.sign_in(TSC.TableauAuth("admin", "password"))
+        bench_listing(server, results, args.repeat)
+        bench_parsing(server, results, args.repeat)
+        bench_requests(server, results, args.repeat)
+        bench_transfers(server, results, args.repeat, args.transfer_mb)
+        bench_jobs(server, results, args.repeat, job_duration)
+        server.auth.sign_out()
+    finally:
+        connection.send("stop")
+        process.join(timeout=10)
+
+    report = {
+        "tsc_version": TSC.__version__,
+        "commit": commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "options": vars(args),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(results, baseline["results"], args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -63,16 +63,43 @@ from tableauserverclient.server import (
     ServerResponseError,
     Filter,
     Pager,
+    BulkPermissions,
+    Cassette,
+    ContentInventory,
+    FileMetadataCache,
+    FileResponseCache,
+    Fleet,
+    FleetResult,
+    FleetResults,
+    InMemoryMetadataCache,
+    InMemoryResponseCache,
+    MetadataCache,
+    MockTableauServer,
+    MultiSiteExecutor,
+    MultiSiteResults,
+    NameResolver,
+    PermissionsChange,
+    Profiler,
+    ProjectTree,
+    RefreshHistory,
+    RefreshOrchestrator,
+    RefreshResult,
+    ResponseCache,
     Server,
+    SessionCache,
+    SiteResult,
     Sort,
 )
 
 __all__ = [
     "BackgroundJobItem",
     "BackgroundJobItem",
+    "BulkPermissions",
+    "Cassette",
     "ColumnItem",
     "ConnectionCredentials",
     "ConnectionItem",
+    "ContentInventory",
     "CSVRequestOptions",
     "CustomViewItem",
     "DailyInterval",
@@ -85,8 +112,13 @@ __all__ = [
     "ExcelRequestOptions",
     "FailedSignInError",
     "FavoriteItem",
+    "FileMetadataCache",
+    "FileResponseCache",
     "FileuploadItem",
     "Filter",
+    "Fleet",
+    "FleetResult",
+    "FleetResults",
     "FlowItem",
     "FlowRunItem",
     "get_versions",
@@ -94,31 +126,47 @@ __all__ = [
     "GroupSetItem",
     "HourlyInterval",
     "ImageRequestOptions",
+    "InMemoryMetadataCache",
+    "InMemoryResponseCache",
     "IntervalItem",
     "JobItem",
     "JWTAuth",
     "LinkedTaskFlowRunItem",
     "LinkedTaskItem",
     "LinkedTaskStepItem",
+    "MetadataCache",
     "MetricItem",
     "MissingRequiredFieldError",
+    "MockTableauServer",
     "MonthlyInterval",
+    "MultiSiteExecutor",
+    "MultiSiteResults",
+    "NameResolver",
     "NotSignedInError",
     "Pager",
     "PaginationItem",
     "PDFRequestOptions",
     "Permission",
+    "PermissionsChange",
     "PermissionsRule",
     "PersonalAccessTokenAuth",
+    "Profiler",
     "ProjectItem",
+    "ProjectTree",
+    "RefreshHistory",
+    "RefreshOrchestrator",
+    "RefreshResult",
     "RequestOptions",
     "Resource",
+    "ResponseCache",
     "RevisionItem",
     "ScheduleItem",
     "Server",
     "ServerInfoItem",
     "ServerResponseError",
+    "SessionCache",
     "SiteItem",
+    "SiteResult",
     "Sort",
     "SubscriptionItem",
     "TableauAuth",
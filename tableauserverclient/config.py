@@ -6,6 +6,9 @@ BYTES_PER_MB = 1024 * 1024
 
 DELAY_SLEEP_SECONDS = 0.1
 
+# The largest page size the REST API accepts for paged requests
+MAX_PAGE_SIZE = 1000
+
 
 class Config:
     # The maximum size of a file that can be published in a single request is 64MB
@@ -1,9 +1,11 @@
+import datetime
 import logging
 import xml.etree.ElementTree as ET
 from typing import Optional
 
 from defusedxml.ElementTree import fromstring
 
+from tableauserverclient.datetime_helpers import parse_datetime
 from tableauserverclient.models.exceptions import UnpopulatedPropertyError
 from tableauserverclient.models.property_decorators import property_is_enum, property_not_empty
 
@@ -45,6 +47,12 @@ class ProjectItem:
     owner_id : str
         The unique identifier for the UserItem owner of the project.
 
+    created_at : datetime.datetime
+        The date and time the project was created.
+
+    updated_at : datetime.datetime
+        The date and time the project was last updated.
+
     """
 
     ERROR_MSG = "Project item must be populated with permissions first."
@@ -75,6 +83,8 @@ class ProjectItem:
         self.parent_id: Optional[str] = parent_id
         self._samples: Optional[bool] = samples
         self._owner_id: Optional[str] = None
+        self._created_at: Optional[datetime.datetime] = None
+        self._updated_at: Optional[datetime.datetime] = None
 
         self._permissions = None
         self._default_workbook_permissions = None
@@ -176,6 +186,14 @@ class ProjectItem:
     def owner_id(self, value: str) -> None:
         self._owner_id = value
 
+    @property
+    def created_at(self) -> Optional[datetime.datetime]:
+        return self._created_at
+
+    @property
+    def updated_at(self) -> Optional[datetime.datetime]:
+        return self._updated_at
+
     def is_default(self):
         return self.name.lower() == "default"
 
@@ -234,6 +252,8 @@ class ProjectItem:
     def from_xml(cls, project_xml, namespace=None) -> "ProjectItem":
         project_item = cls()
         project_item._set_values(*cls._parse_element(project_xml))
+        project_item._created_at = parse_datetime(project_xml.get("createdAt", None))
+        project_item._updated_at = parse_datetime(project_xml.get("updatedAt", None))
         return project_item
 
     @staticmethod
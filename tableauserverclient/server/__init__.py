@@ -11,6 +11,19 @@ from tableauserverclient.server.filter import Filter
 from tableauserverclient.server.sort import Sort
 from tableauserverclient.server.server import Server
 from tableauserverclient.server.pager import Pager
+from tableauserverclient.server.bulk_permissions import BulkPermissions, PermissionsChange
+from tableauserverclient.server.cassette import Cassette
+from tableauserverclient.server.fleet import Fleet, FleetResult, FleetResults
+from tableauserverclient.server.inventory import ContentInventory
+from tableauserverclient.server.metadata_cache import FileMetadataCache, InMemoryMetadataCache, MetadataCache
+from tableauserverclient.server.mock_server import MockTableauServer
+from tableauserverclient.server.multi_site import MultiSiteExecutor, MultiSiteResults, SiteResult
+from tableauserverclient.server.profiler import Profiler
+from tableauserverclient.server.project_tree import ProjectTree
+from tableauserverclient.server.resolver import NameResolver
+from tableauserverclient.server.response_cache import FileResponseCache, InMemoryResponseCache, ResponseCache
+from tableauserverclient.server.session_cache import SessionCache
+from tableauserverclient.server.refresh_orchestrator import RefreshHistory, RefreshOrchestrator, RefreshResult
 from tableauserverclient.server.endpoint.exceptions import FailedSignInError, NotSignedInError
 
 from tableauserverclient.server.endpoint import (
@@ -57,6 +70,30 @@ __all__ = [
     "Sort",
     "Server",
     "Pager",
+    "BulkPermissions",
+    "Cassette",
+    "ContentInventory",
+    "Fleet",
+    "FleetResult",
+    "FleetResults",
+    "PermissionsChange",
+    "FileMetadataCache",
+    "InMemoryMetadataCache",
+    "MetadataCache",
+    "MockTableauServer",
+    "MultiSiteExecutor",
+    "MultiSiteResults",
+    "SiteResult",
+    "NameResolver",
+    "Profiler",
+    "ProjectTree",
+    "RefreshHistory",
+    "RefreshOrchestrator",
+    "RefreshResult",
+    "FileResponseCache",
+    "InMemoryResponseCache",
+    "ResponseCache",
+    "SessionCache",
     "FailedSignInError",
     "NotSignedInError",
     "Auth",
@@ -0,0 +1,260 @@
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Iterable
+from typing import Optional, TYPE_CHECKING, Union
+
+from tableauserverclient.helpers.logging import logger
+from tableauserverclient.models import (
+    DatabaseItem,
+    DatasourceItem,
+    FlowItem,
+    MetricItem,
+    Permission,
+    PermissionsRule,
+    ProjectItem,
+    TableItem,
+    ViewItem,
+    VirtualConnectionItem,
+    WorkbookItem,
+)
+from tableauserverclient.server.endpoint.exceptions import (
+    InternalServerError,
+    MissingRequiredFieldError,
+    NonXMLResponseError,
+    ServerResponseError,
+)
+
+if TYPE_CHECKING:
+    from tableauserverclient.server.endpoint.permissions_endpoint import _PermissionsEndpoint
+    from tableauserverclient.server.server import Server
+
+PermissionedItem = Union[
+    DatabaseItem,
+    DatasourceItem,
+    FlowItem,
+    MetricItem,
+    ProjectItem,
+    TableItem,
+    ViewItem,
+    VirtualConnectionItem,
+    WorkbookItem,
+]
+
+# maps each item type with permissions to the name of its endpoint on the Server object
+_ENDPOINT_NAMES = {
+    DatabaseItem: "databases",
+    DatasourceItem: "datasources",
+    FlowItem: "flows",
+    MetricItem: "metrics",
+    ProjectItem: "projects",
+    TableItem: "tables",
+    ViewItem: "views",
+    VirtualConnectionItem: "virtual_connections",
+    WorkbookItem: "workbooks",
+}
+
+
+def _merge_by_grantee(rules: Iterable[PermissionsRule]) -> dict[tuple[str, str], PermissionsRule]:
+    # PermissionsRule's `&` and `|` drop capabilities that only one of the rules sets, so the
+    # capabilities are unioned here instead. A capability set to both modes resolves to Deny,
+    # the same way `&` and the server resolve it.
+    merged: dict[tuple[str, str], PermissionsRule] = {}
+    for rule in rules:
+        key = (rule.grantee.tag_name, rule.grantee.id)
+        if key not in merged:
+            merged[key] = PermissionsRule(rule.grantee, dict(rule.capabilities))
+            continue
+        capabilities = merged[key].capabilities
+        for capability, mode in rule.capabilities.items():
+            if capabilities.get(capability, mode) != mode:
+                mode = Permission.Mode.Deny
+            capabilities[capability] = mode
+    return merged
+
+
+class PermissionsChange:
+    """
+    The permission rules that have to be deleted from and added to one item
+    so that it has the desired permissions. `error` holds the exception
+    raised for the item, if any. If the current permissions of the item
+    could not be fetched, the change is empty and is skipped by apply.
+    """
+
+    def __init__(
+        self, item: PermissionedItem, additions: list[PermissionsRule], deletions: list[PermissionsRule]
+    ) -> None:
+        self.item = item
+        self.additions = additions
+        self.deletions = deletions
+        self.applied = False
+        self.error: Optional[Exception] = None
+
+    def __repr__(self):
+        return (
+            f"<PermissionsChange item={self.item.id} additions={self.additions} "
+            f"deletions={self.deletions} applied={self.applied} error={self.error!r}>"
+        )
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.additions or self.deletions)
+
+
+class BulkPermissions:
+    """
+    Plans and applies permission changes across many projects, workbooks, data
+    sources, views, flows and other content items.
+
+    `plan` fetches the current permissions of every item concurrently and
+    compares them, capability by capability, to the desired rules. Rules for
+    the same grantee are combined before comparing, with Deny winning when a
+    capability is given both modes. Only capabilities
+    that are missing, or set to the other mode, end up in the change. `apply`
+    then sends the deletions and additions for all items with bounded
+    parallelism.
+
+    Parameters
+    ----------
+    server : Server
+        A signed in Server object.
+
+    max_workers : int, default 8
+        The maximum number of items fetched or updated concurrently.
+
+    Examples
+    --------
+    >>> read = {TSC.Permission.Capability.Read: TSC.Permission.Mode.Allow}
+    >>> rule = TSC.PermissionsRule(TSC.GroupItem.as_reference(group.id), read)
+    >>> bulk = TSC.BulkPermissions(server)
+    >>> changes = bulk.plan((project, [rule]) for project in TSC.Pager(server.projects))
+    >>> bulk.apply(changes)
+    """
+
+    def __init__(self, server: "Server", max_workers: int = 8) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        self.parent_srv = server
+        self.max_workers = max_workers
+
+    def _endpoint_for(self, item: PermissionedItem) -> "_PermissionsEndpoint":
+        for item_type, name in _ENDPOINT_NAMES.items():
+            if isinstance(item, item_type):
+                return getattr(self.parent_srv, name)._permissions
+        raise TypeError(f"Permissions are not supported for {item.__class__.__name__}")
+
+    def plan(
+        self, targets: Iterable[tuple[PermissionedItem, Iterable[PermissionsRule]]], replace: bool = False
+    ) -> list[PermissionsChange]:
+        """
+        Computes the changes needed for each item to have the desired rules.
+
+        Parameters
+        ----------
+        targets : Iterable[tuple[item, Iterable[PermissionsRule]]]
+            Pairs of an item and the rules it should have.
+
+        replace : bool, default False
+            If True, existing capabilities that are not in the desired rules
+            are deleted as well, so each item ends up with exactly the desired
+            rules. Otherwise they are left untouched.
+
+        Returns
+        -------
+        list[PermissionsChange]
+            One change per item, in the order of the targets. Items that
+            already have the desired permissions get an empty change, and so
+            do items whose permissions could not be fetched, with the error
+            recorded on the change.
+        """
+        pairs = []
+        for item, rules in targets:
+            endpoint = self._endpoint_for(item)
+            if not item.id:
+                error = "Server item is missing ID. Item must be retrieved from server first."
+                raise MissingRequiredFieldError(error)
+            pairs.append((item, endpoint, list(rules)))
+
+        def plan_one(pair) -> PermissionsChange:
+            item, endpoint, desired = pair
+            try:
+                current = endpoint._get_permissions(item)
+            except (ServerResponseError, InternalServerError, NonXMLResponseError) as e:
+                logger.info(f"Could not get permissions for item (ID: {item.id}): {e}")
+                change = PermissionsChange(item, [], [])
+                change.error = e
+                return change
+            return self._diff(item, current, desired, replace)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            changes = list(executor.map(plan_one, pairs))
+        logger.info(f"Planned permission changes for {sum(c.has_changes for c in changes)} of {len(changes)} items")
+        return changes
+
+    @staticmethod
+    def _diff(item, current: list[PermissionsRule], desired: list[PermissionsRule], replace: bool) -> PermissionsChange:
+        current_by_grantee = _merge_by_grantee(current)
+        desired_by_grantee = _merge_by_grantee(desired)
+        additions = []
+        deletions = []
+
+        for key, rule in desired_by_grantee.items():
+            existing = current_by_grantee[key].capabilities if key in current_by_grantee else {}
+            to_add = {}
+            to_delete = {}
+            for capability, mode in rule.capabilities.items():
+                existing_mode = existing.get(capability)
+                if existing_mode == mode:
+                    continue
+                if existing_mode is not None:
+                    to_delete[capability] = existing_mode
+                to_add[capability] = mode
+            if replace:
+                for capability, mode in existing.items():
+                    if capability not in rule.capabilities:
+                        to_delete[capability] = mode
+            if to_delete:
+                deletions.append(PermissionsRule(rule.grantee, to_delete))
+            if to_add:
+                additions.append(PermissionsRule(rule.grantee, to_add))
+
+        if replace:
+            for key, rule in current_by_grantee.items():
+                if key not in desired_by_grantee:
+                    deletions.append(rule)
+
+        return PermissionsChange(item, additions, deletions)
+
+    def apply(self, changes: Iterable[PermissionsChange]) -> list[PermissionsChange]:
+        """
+        Applies planned changes concurrently. Conflicting capabilities are
+        deleted before the new rules are added. Errors returned by the server
+        are recorded on the change of the affected item and do not stop the
+        other items from being updated.
+
+        Returns
+        -------
+        list[PermissionsChange]
+            The changes, with `applied` and `error` set.
+        """
+        changes = [change for change in changes if change.has_changes]
+
+        def apply_one(change):
+            endpoint = self._endpoint_for(change.item)
+            try:
+                if change.deletions:
+                    endpoint.delete(change.item, change.deletions)
+                if change.additions:
+                    endpoint.update(change.item, change.additions)
+                change.applied = True
+            except (ServerResponseError, InternalServerError, NonXMLResponseError) as e:
+                logger.info(f"Could not update permissions for item (ID: {change.item.id}): {e}")
+                change.error = e
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(executor.map(apply_one, changes))
+        return changes
+
+    def sync(
+        self, targets: Iterable[tuple[PermissionedItem, Iterable[PermissionsRule]]], replace: bool = False
+    ) -> list[PermissionsChange]:
+        """Plans and applies the changes for the targets in one call. See `plan` for the parameters."""
+        return self.apply(self.plan(targets, replace=replace))
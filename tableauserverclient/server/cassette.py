@@ -0,0 +1,226 @@
+import base64
+import gzip
+import json
+import re
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Any, Callable, Optional
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from tableauserverclient.helpers.logging import logger
+from tableauserverclient.helpers.strings import redact_xml
+from tableauserverclient.server.exceptions import UnrecordedRequestError
+
+REDACTED = "********"
+
+# response headers worth replaying; everything else, including cookies, is left out
+_KEPT_HEADERS = ("Content-Type", "Content-Disposition", "Location", "ETag", "Last-Modified")
+
+# secrets that redact_xml does not cover: session tokens, personal access token secrets and JWTs
+_SECRET_ATTRIBUTES = re.compile(rb'\b(token|personalAccessTokenSecret|jwt)="[^"]*"')
+
+
+def _redact(content: Optional[bytes]) -> Optional[bytes]:
+    # sign in requests are sent without a content type, so XML is recognized by its first character
+    if not content or not content.lstrip().startswith(b"<"):
+        return content
+    if b"password" in content:
+        # redact_xml writes the document out again, so it is only used where there is a password to remove
+        content = bytes(redact_xml(content))
+    return _SECRET_ATTRIBUTES.sub(lambda match: match.group(1) + b'="' + REDACTED.encode() + b'"', content)
+
+
+def _encode_body(content: Optional[bytes]) -> dict[str, str]:
+    if not content:
+        return {}
+    try:
+        return {"body": content.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"body_b64": base64.b64encode(content).decode("ascii")}
+
+
+def _decode_body(interaction: dict[str, Any]) -> bytes:
+    if "body_b64" in interaction:
+        return base64.b64decode(interaction["body_b64"])
+    return interaction.get("body", "").encode("utf-8")
+
+
+class _RecordingAdapter(BaseAdapter):
+    def __init__(self, cassette: "Cassette", adapter: BaseAdapter) -> None:
+        super().__init__()
+        self.cassette = cassette
+        self.adapter = adapter
+
+    def send(self, request, **kwargs):
+        started = time.perf_counter()
+        response = self.adapter.send(request, **kwargs)
+        # downloads are read in full so that they can be written to the cassette
+        content = response.content
+        elapsed = time.perf_counter() - started
+
+        body = request.body.encode("utf-8") if isinstance(request.body, str) else request.body
+        if not isinstance(body, (bytes, type(None))):
+            # file uploads are streamed from a file object and are not kept
+            body = None
+        interaction = {
+            "method": request.method,
+            "url": request.url,
+            "request": _encode_body(_redact(body)),
+            "status": response.status_code,
+            "headers": {name: response.headers[name] for name in _KEPT_HEADERS if name in response.headers},
+            "elapsed": round(elapsed, 6),
+            **_encode_body(_redact(content)),
+        }
+        self.cassette._write(interaction)
+        return response
+
+    def close(self):
+        self.adapter.close()
+
+
+class _ReplayAdapter(BaseAdapter):
+    def __init__(self, cassette: "Cassette", latency: bool) -> None:
+        super().__init__()
+        self.cassette = cassette
+        self.latency = latency
+
+    def send(self, request, **kwargs):
+        interaction = self.cassette._next(request.method, request.url)
+        if self.latency:
+            time.sleep(interaction.get("elapsed", 0))
+
+        response = requests.Response()
+        response.status_code = interaction["status"]
+        response.headers = CaseInsensitiveDict(interaction.get("headers", {}))
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response._content = _decode_body(interaction)
+        # marks the content as read, so that streamed downloads are served from it
+        response._content_consumed = True
+        return response
+
+    def close(self):
+        pass
+
+
+class Cassette:
+    """
+    Records the HTTP requests a script makes and the responses it gets into
+    a file, and replays them later without a server, for benchmarking and
+    debugging client-side changes offline with realistic traffic.
+
+    A cassette plugs into the Server through `session_factory`. Use
+    `recorder` to make real requests and write each request and response
+    to the cassette as a line of gzipped JSON, and `player` to answer
+    requests from the cassette. Replayed requests are answered at full
+    speed, or after the time the original request took when `latency` is
+    True.
+
+    Requests are matched by method and URL, including the query string.
+    Responses recorded for the same request are replayed in the order they
+    were recorded, and the last one is repeated once they run out. A request
+    that was never recorded raises UnrecordedRequestError.
+
+    The auth header is not recorded. Passwords are removed from XML bodies
+    with `redact_xml`, and session tokens, personal access token secrets and
+    JWTs are replaced with asterisks, so replayed sessions sign in with a
+    placeholder token. Uploaded files are not kept, and downloads are read
+    in full while recording.
+
+    Parameters
+    ----------
+    path : str
+        The cassette file.
+
+    Examples
+    --------
+    >>> with TSC.Cassette("crawl.jsonl.gz") as cassette:
+    >>>     server = TSC.Server("https://MY-SERVER", session_factory=cassette.recorder())
+    >>>     server.auth.sign_in(tableau_auth)
+    >>>     inventory = list(TSC.Pager(server.workbooks))
+
+    >>> server = TSC.Server("https://MY-SERVER", session_factory=TSC.Cassette("crawl.jsonl.gz").player())
+    >>> server.auth.sign_in(tableau_auth)
+    >>> inventory = list(TSC.Pager(server.workbooks))
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.recorded = 0
+        self.replayed = 0
+        self._file: Optional[gzip.GzipFile] = None
+        self._interactions: Optional[dict[tuple[str, str], deque[dict[str, Any]]]] = None
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"<Cassette path={self.path} recorded={self.recorded} replayed={self.replayed}>"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def recorder(
+        self, session_factory: Callable[[], requests.Session] = requests.session
+    ) -> Callable[[], requests.Session]:
+        """Returns a session factory whose sessions record to this cassette."""
+
+        def factory() -> requests.Session:
+            session = session_factory()
+            for prefix in ("http://", "https://"):
+                session.mount(prefix, _RecordingAdapter(self, session.get_adapter(prefix)))
+            return session
+
+        return factory
+
+    def player(self, latency: bool = False) -> Callable[[], requests.Session]:
+        """Returns a session factory whose sessions answer requests from this cassette."""
+
+        def factory() -> requests.Session:
+            session = requests.session()
+            adapter = _ReplayAdapter(self, latency)
+            for prefix in ("http://", "https://"):
+                session.mount(prefix, adapter)
+            return session
+
+        return factory
+
+    def _write(self, interaction: dict[str, Any]) -> None:
+        line = json.dumps(interaction, separators=(",", ":")).encode("utf-8") + b"\n"
+        with self._lock:
+            if self._file is None:
+                self._file = gzip.open(self.path, "wb")
+            self._file.write(line)
+            self.recorded += 1
+
+    def _load(self) -> dict[tuple[str, str], deque[dict[str, Any]]]:
+        interactions: dict[tuple[str, str], deque[dict[str, Any]]] = defaultdict(deque)
+        with gzip.open(self.path, "rb") as f:
+            for line in f:
+                interaction = json.loads(line)
+                interactions[(interaction["method"], interaction["url"])].append(interaction)
+        logger.debug(f"Loaded {sum(len(queue) for queue in interactions.values())} interactions from {self.path}")
+        return interactions
+
+    def _next(self, method: str, url: str) -> dict[str, Any]:
+        with self._lock:
+            if self._interactions is None:
+                self._interactions = self._load()
+            queue = self._interactions.get((method, url))
+            if not queue:
+                raise UnrecordedRequestError(f"No recorded response for {method} {url} in {self.path}")
+            self.replayed += 1
+            return queue.popleft() if len(queue) > 1 else queue[0]
+
+    def close(self) -> None:
+        """Finishes writing the cassette."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
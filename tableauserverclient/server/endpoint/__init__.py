@@ -1,4 +1,5 @@
 from tableauserverclient.server.endpoint.auth_endpoint import Auth
+from tableauserverclient.server.endpoint.bulk_export import ExportManifest, ExportResult
 from tableauserverclient.server.endpoint.custom_views_endpoint import CustomViews
 from tableauserverclient.server.endpoint.data_acceleration_report_endpoint import DataAccelerationReport
 from tableauserverclient.server.endpoint.data_alert_endpoint import DataAlerts
@@ -15,7 +16,7 @@ from tableauserverclient.server.endpoint.groups_endpoint import Groups
 from tableauserverclient.server.endpoint.groupsets_endpoint import GroupSets
 from tableauserverclient.server.endpoint.jobs_endpoint import Jobs
 from tableauserverclient.server.endpoint.linked_tasks_endpoint import LinkedTasks
-from tableauserverclient.server.endpoint.metadata_endpoint import Metadata
+from tableauserverclient.server.endpoint.metadata_endpoint import Metadata, MetadataBatchResults
 from tableauserverclient.server.endpoint.metrics_endpoint import Metrics
 from tableauserverclient.server.endpoint.projects_endpoint import Projects
 from tableauserverclient.server.endpoint.schedules_endpoint import Schedules
@@ -23,7 +24,7 @@ from tableauserverclient.server.endpoint.server_info_endpoint import ServerInfo
 from tableauserverclient.server.endpoint.sites_endpoint import Sites
 from tableauserverclient.server.endpoint.subscriptions_endpoint import Subscriptions
 from tableauserverclient.server.endpoint.tables_endpoint import Tables
-from tableauserverclient.server.endpoint.resource_tagger import Tags
+from tableauserverclient.server.endpoint.resource_tagger import TagBuffer, Tags
 from tableauserverclient.server.endpoint.tasks_endpoint import Tasks
 from tableauserverclient.server.endpoint.users_endpoint import Users
 from tableauserverclient.server.endpoint.views_endpoint import Views
@@ -41,6 +42,8 @@ __all__ = [
     "QuerysetEndpoint",
     "MissingRequiredFieldError",
     "Endpoint",
+    "ExportManifest",
+    "ExportResult",
     "Favorites",
     "Fileuploads",
     "FlowRuns",
@@ -51,6 +54,7 @@ __all__ = [
     "Jobs",
     "LinkedTasks",
     "Metadata",
+    "MetadataBatchResults",
     "Metrics",
     "Projects",
     "Schedules",
@@ -59,6 +63,7 @@ __all__ = [
     "Sites",
     "Subscriptions",
     "Tables",
+    "TagBuffer",
     "Tags",
     "Tasks",
     "Users",
@@ -7,6 +7,7 @@ from defusedxml.ElementTree import fromstring
 from tableauserverclient.server.endpoint.endpoint import Endpoint, api
 from tableauserverclient.server.endpoint.exceptions import ServerResponseError
 from tableauserverclient.server.request_factory import RequestFactory
+from tableauserverclient.server.session_cache import parse_time_to_expiration
 
 from tableauserverclient.helpers.logging import logger
 
@@ -66,6 +67,13 @@ class Auth(Endpoint):
         >>> # call the sign-in method with the auth object
         >>> server.auth.sign_in(tableau_auth)
         """
+        cache = self.parent_srv.session_cache
+        if cache is not None and (session := cache.get_session(self.parent_srv.server_address, auth_req)):
+            self.parent_srv._set_auth(session["site_id"], session["user_id"], session["token"], session["site_url"])
+            self.parent_srv._cached_credentials = auth_req
+            logger.info(f"Reusing cached session for {self.parent_srv.server_address}")
+            return Auth.contextmgr(self.sign_out)
+
         url = f"{self.baseurl}/signin"
         signin_req = RequestFactory.Auth.signin_req(auth_req)
         server_response = self.parent_srv.session.post(
@@ -86,8 +94,15 @@ class Auth(Endpoint):
         site_id = parsed_response.find(".//t:site", namespaces=self.parent_srv.namespace).get("id", None)
         site_url = parsed_response.find(".//t:site", namespaces=self.parent_srv.namespace).get("contentUrl", None)
         user_id = parsed_response.find(".//t:user", namespaces=self.parent_srv.namespace).get("id", None)
-        auth_token = parsed_response.find("t:credentials", namespaces=self.parent_srv.namespace).get("token", None)
+        credentials = parsed_response.find("t:credentials", namespaces=self.parent_srv.namespace)
+        auth_token = credentials.get("token", None)
         self.parent_srv._set_auth(site_id, user_id, auth_token, site_url)
+        if cache is not None:
+            expires_in = parse_time_to_expiration(credentials.get("estimatedTimeToExpiration", None))
+            cache.set_session(
+                self.parent_srv.server_address, auth_req, site_id, user_id, auth_token, site_url, expires_in
+            )
+            self.parent_srv._cached_credentials = auth_req
         logger.info(f"Signed into {self.parent_srv.server_address} as user with id {user_id}")
         return Auth.contextmgr(self.sign_out)
 
@@ -110,6 +125,7 @@ class Auth(Endpoint):
         # If there are no auth tokens you're already signed out. No-op
         if not self.parent_srv.is_signed_in():
             return
+        self._forget_cached_session()
         self.post_request(url, "")
         self.parent_srv._clear_auth()
         logger.info("Signed out")
@@ -145,6 +161,8 @@ class Auth(Endpoint):
         """
         url = f"{self.baseurl}/switchSite"
         switch_req = RequestFactory.Auth.switch_req(site_item.content_url)
+        # switching sites invalidates the current token
+        self._forget_cached_session()
         try:
             server_response = self.post_request(url, switch_req)
         except ServerResponseError as e:
@@ -163,6 +181,12 @@ class Auth(Endpoint):
         logger.info(f"Signed into {self.parent_srv.server_address} as user with id {user_id}")
         return Auth.contextmgr(self.sign_out)
 
+    def _forget_cached_session(self) -> None:
+        credentials = self.parent_srv._cached_credentials
+        if credentials is not None and self.parent_srv.session_cache is not None:
+            self.parent_srv.session_cache.invalidate_session(self.parent_srv.server_address, credentials)
+        self.parent_srv._cached_credentials = None
+
     @api(version="3.10")
     def revoke_all_server_admin_tokens(self) -> None:
         """
@@ -0,0 +1,341 @@
+import copy
+import csv
+import hashlib
+import io
+import itertools
+import json
+import os
+import re
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from functools import partial
+from typing import Any, Callable, Optional, TYPE_CHECKING, Union
+
+from tableauserverclient.helpers.logging import logger
+from tableauserverclient.server.endpoint.exceptions import (
+    InternalServerError,
+    MissingRequiredFieldError,
+    NonXMLResponseError,
+    ServerResponseError,
+)
+from tableauserverclient.server.request_options import (
+    CSVRequestOptions,
+    ExcelRequestOptions,
+    ImageRequestOptions,
+    PDFRequestOptions,
+    RequestOptionsBase,
+    _DataExportOptions,
+)
+
+if TYPE_CHECKING:
+    from tableauserverclient.server.endpoint.endpoint import Endpoint
+
+# responses are written to disk in chunks of this many bytes
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+class _ExportFormat:
+    def __init__(self, path: str, extension: str, version: str, options_type: type) -> None:
+        self.path = path
+        self.extension = extension
+        self.version = version
+        self.options_type = options_type
+
+
+IMAGE = _ExportFormat("image", "png", "2.5", ImageRequestOptions)
+PDF = _ExportFormat("pdf", "pdf", "2.7", PDFRequestOptions)
+CSV = _ExportFormat("data", "csv", "2.7", CSVRequestOptions)
+EXCEL = _ExportFormat("crosstab/excel", "xlsx", "3.8", ExcelRequestOptions)
+
+VIEW_FORMATS = {"image": IMAGE, "pdf": PDF, "csv": CSV, "excel": EXCEL}
+CUSTOM_VIEW_FORMATS = {
+    "image": _ExportFormat("image", "png", "3.18", ImageRequestOptions),
+    "pdf": _ExportFormat("pdf", "pdf", "3.23", PDFRequestOptions),
+    "csv": _ExportFormat("data", "csv", "3.23", CSVRequestOptions),
+}
+WORKBOOK_FORMATS = {
+    "pdf": _ExportFormat("pdf", "pdf", "3.4", PDFRequestOptions),
+    "powerpoint": _ExportFormat("powerpoint", "pptx", "3.8", _DataExportOptions),
+}
+
+
+class ExportResult:
+    """
+    The outcome of exporting one item. `path` is the file written, or None
+    when the export failed, in which case `error` holds the exception.
+    `values` holds the filter and parameter values of a burst export.
+    `seconds` is the time from sending the request to writing the last byte.
+    """
+
+    def __init__(self, item_id: str, name: Optional[str], kind: str, values: Optional[dict[str, str]] = None) -> None:
+        self.item_id = item_id
+        self.name = name
+        self.kind = kind
+        self.values = values
+        self.path: Optional[str] = None
+        self.size = 0
+        self.seconds = 0.0
+        self.error: Optional[Exception] = None
+
+    def __repr__(self):
+        return f"<ExportResult item={self.item_id} kind={self.kind} path={self.path} seconds={self.seconds:.2f}>"
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None and self.path is not None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "item_id": self.item_id,
+            "name": self.name,
+            "kind": self.kind,
+            "values": self.values,
+            "path": self.path,
+            "size": self.size,
+            "seconds": self.seconds,
+            "error": str(self.error) if self.error is not None else None,
+        }
+
+
+class ExportManifest:
+    """The results of a bulk export, in the order the items were given."""
+
+    def __init__(self, results: list[ExportResult], seconds: float) -> None:
+        self.results = results
+        self.seconds = seconds
+
+    def __repr__(self):
+        return (
+            f"<ExportManifest exported={len(self.succeeded)} failed={len(self.failed)} " f"seconds={self.seconds:.2f}>"
+        )
+
+    def __iter__(self):
+        return iter(self.results)
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    @property
+    def succeeded(self) -> list[ExportResult]:
+        return [result for result in self.results if result.succeeded]
+
+    @property
+    def failed(self) -> list[ExportResult]:
+        return [result for result in self.results if not result.succeeded]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"seconds": self.seconds, "results": [result.to_dict() for result in self.results]}
+
+    def save(self, filepath: Union[str, os.PathLike]) -> None:
+        with open(filepath, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+
+def _check_export(
+    endpoint: "Endpoint", items: list[Any], formats: dict[str, _ExportFormat], kind: str, max_workers: int
+) -> _ExportFormat:
+    if kind not in formats:
+        raise ValueError(f"Cannot export {kind}. Expected one of {', '.join(formats)}.")
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1.")
+    export_format = formats[kind]
+    endpoint.parent_srv.assert_at_least_version(export_format.version, f"Exporting {kind}")
+    for item in items:
+        if not item.id:
+            error = "Item missing ID. Item must be retrieved from server first."
+            raise MissingRequiredFieldError(error)
+    return export_format
+
+
+def _with_max_age(
+    options: Optional[RequestOptionsBase], export_format: _ExportFormat, max_age: Optional[int]
+) -> Optional[RequestOptionsBase]:
+    # the caller's options are copied rather than changed
+    if max_age is None:
+        return options
+    options = copy.deepcopy(options) if options is not None else export_format.options_type()
+    options.max_age = max_age  # type: ignore[union-attr]
+    return options
+
+
+def _download(
+    endpoint: "Endpoint", url: str, options: Optional[RequestOptionsBase], path: str, result: ExportResult
+) -> ExportResult:
+    temp_path = f"{path}.part"
+    started = time.perf_counter()
+    try:
+        with closing(endpoint.get_request(url, request_object=options, parameters={"stream": True})) as response:
+            with open(temp_path, "wb") as f:
+                for chunk in response.iter_content(EXPORT_CHUNK_SIZE):
+                    f.write(chunk)
+                    result.size += len(chunk)
+        os.replace(temp_path, path)
+        result.path = path
+    except (ServerResponseError, InternalServerError, NonXMLResponseError, OSError) as e:
+        logger.info(f"Could not export {result.kind} for item (ID: {result.item_id}): {e}")
+        result.error = e
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    result.seconds = time.perf_counter() - started
+    return result
+
+
+def _run(jobs: list[Callable[[], ExportResult]], max_workers: int, kind: str) -> ExportManifest:
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(lambda job: job(), jobs))
+    manifest = ExportManifest(results, time.perf_counter() - started)
+    logger.info(f"Exported {len(manifest.succeeded)} of {len(results)} {kind} files in {manifest.seconds:.1f}s")
+    return manifest
+
+
+def export_many(
+    endpoint: "Endpoint",
+    baseurl: str,
+    items: Iterable[Any],
+    formats: dict[str, _ExportFormat],
+    kind: str,
+    options: Optional[RequestOptionsBase],
+    target_dir: Union[str, os.PathLike],
+    max_workers: int,
+    max_age: Optional[int],
+    filename: Optional[Callable[[Any], str]],
+) -> ExportManifest:
+    # Shared implementation of the export_many methods of the views, custom views and workbooks endpoints.
+    items = list(items)
+    export_format = _check_export(endpoint, items, formats, kind, max_workers)
+    options = _with_max_age(options, export_format, max_age)
+
+    # concurrent downloads to the same path would overwrite each other's partial file
+    paths: dict[str, str] = {}
+    exported: set[str] = set()
+    jobs: list[Callable[[], ExportResult]] = []
+    for item in items:
+        # an item listed more than once is exported once
+        if item.id in exported:
+            continue
+        exported.add(item.id)
+        file_name = filename(item) if filename is not None else f"{item.id}.{export_format.extension}"
+        path = os.path.join(target_dir, file_name)
+        _claim_path(paths, path, item.id)
+        url = f"{baseurl}/{item.id}/{export_format.path}"
+        result = ExportResult(item.id, getattr(item, "name", None), kind)
+        jobs.append(partial(_download, endpoint, url, options, path, result))
+    os.makedirs(target_dir, exist_ok=True)
+    return _run(jobs, max_workers, kind)
+
+
+def _claim_path(paths: dict[str, str], path: str, owner: str) -> None:
+    key = os.path.normcase(os.path.abspath(path))
+    if key in paths:
+        raise ValueError(f"{owner} and {paths[key]} would both be exported to {path}.")
+    paths[key] = owner
+
+
+def _slug(value: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", value).strip("_.") or "_"
+
+
+def burst(
+    endpoint: "Endpoint",
+    baseurl: str,
+    item: Any,
+    formats: dict[str, _ExportFormat],
+    kind: str,
+    filters: Optional[Mapping[str, Iterable[Any]]],
+    parameters: Optional[Mapping[str, Iterable[Any]]],
+    options: Optional[RequestOptionsBase],
+    target_dir: Union[str, os.PathLike],
+    max_workers: int,
+    max_age: Optional[int],
+    filename: Optional[Callable[[Any, dict[str, str]], str]],
+) -> ExportManifest:
+    # Shared implementation of the burst method of the views endpoint.
+    export_format = _check_export(endpoint, [item], formats, kind, max_workers)
+    base_options = _with_max_age(options, export_format, max_age) or export_format.options_type()
+    if not isinstance(base_options, _DataExportOptions):
+        raise TypeError(f"Burst exports need {export_format.options_type.__name__}, not {type(options).__name__}.")
+    dimensions = [("vf", name, values) for name, values in (filters or {}).items()]
+    dimensions += [("parameter", name, values) for name, values in (parameters or {}).items()]
+    if not dimensions:
+        raise ValueError("At least one filter or parameter is required.")
+    # (method, name, value) triples for every distinct value of each dimension
+    axes = [
+        [(method, name, str(value)) for value in dict.fromkeys(str(v) for v in values)]
+        for method, name, values in dimensions
+    ]
+    url = f"{baseurl}/{item.id}/{export_format.path}"
+    prefix = _slug(getattr(item, "name", None) or item.id)
+
+    jobs: list[Callable[[], ExportResult]] = []
+    seen_params: set[tuple] = set()
+    used_names: set[str] = set()
+    paths: dict[str, str] = {}
+    for combination in itertools.product(*axes):
+        job_options = copy.deepcopy(base_options)
+        for method, name, value in combination:
+            getattr(job_options, method)(name, value)
+        # combinations that send the same query, such as a repeated filter, are exported once
+        params = tuple(sorted((key, str(value)) for key, value in job_options.get_query_params().items()))
+        if params in seen_params:
+            continue
+        seen_params.add(params)
+
+        values = {name: value for _, name, value in combination}
+        if filename is not None:
+            file_name = filename(item, values)
+        else:
+            stem = "__".join([prefix, *(f"{_slug(key)}-{_slug(value)}" for key, value in values.items())])
+            file_name = f"{stem}.{export_format.extension}"
+            if file_name in used_names:
+                # values that only differ in characters dropped from file names get a hash suffix
+                digest = hashlib.sha1(json.dumps(values, sort_keys=True).encode("utf-8")).hexdigest()[:8]
+                file_name = f"{stem}-{digest}.{export_format.extension}"
+        used_names.add(file_name)
+        path = os.path.join(target_dir, file_name)
+        _claim_path(paths, path, json.dumps(values, sort_keys=True))
+
+        result = ExportResult(item.id, getattr(item, "name", None), kind, values)
+        jobs.append(partial(_download, endpoint, url, job_options, path, result))
+    os.makedirs(target_dir, exist_ok=True)
+    return _run(jobs, max_workers, kind)
+
+
+class _ChunkReader(io.RawIOBase):
+    # A read-only file over an iterator of byte chunks, so a streamed response
+    # can be decoded and parsed as it arrives.
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._buffer = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._buffer:
+            try:
+                self._buffer = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+def csv_batches(
+    chunks: Iterable[bytes], batch_rows: int, converter: Optional[Callable[[list[dict[str, str]]], Any]] = None
+) -> Iterator[Any]:
+    """
+    Parses CSV bytes as they arrive and yields lists of at most `batch_rows`
+    rows, each a dictionary keyed by the header row. `converter`, if given,
+    is applied to each list before it is yielded.
+    """
+    text = io.TextIOWrapper(
+        io.BufferedReader(_ChunkReader(chunks), EXPORT_CHUNK_SIZE), encoding="utf-8-sig", newline=""
+    )
+    reader = csv.DictReader(text)
+    while batch := list(itertools.islice(reader, batch_rows)):
+        yield converter(batch) if converter is not None else batch
@@ -3,11 +3,13 @@ import logging
 import os
 from contextlib import closing
 from pathlib import Path
-from typing import Optional, Union, TYPE_CHECKING
-from collections.abc import Iterator
+from typing import Callable, Optional, Union, TYPE_CHECKING
+from collections.abc import Iterable, Iterator
 
 from tableauserverclient.config import BYTES_PER_MB, config
 from tableauserverclient.filesys_helpers import get_file_object_size
+from tableauserverclient.server.endpoint import bulk_export
+from tableauserverclient.server.endpoint.bulk_export import ExportManifest
 from tableauserverclient.server.endpoint.endpoint import QuerysetEndpoint, api
 from tableauserverclient.server.endpoint.exceptions import MissingRequiredFieldError
 from tableauserverclient.models import CustomViewItem, PaginationItem
@@ -23,6 +25,7 @@ from tableauserverclient.helpers.logging import logger
 
 if TYPE_CHECKING:
     from tableauserverclient.server.query import QuerySet
+    from tableauserverclient.server.request_options import RequestOptionsBase
 
 """
 Get a list of custom views on a site
@@ -43,6 +46,8 @@ io_types_w = (io.BufferedWriter, io.BytesIO)
 
 
 class CustomViews(QuerysetEndpoint[CustomViewItem]):
+    PREFETCHABLE = ("image", "pdf")
+
     def __init__(self, parent_srv):
         super().__init__(parent_srv)
 
@@ -228,6 +233,39 @@ class CustomViews(QuerysetEndpoint[CustomViewItem]):
         with closing(self.get_request(url, request_object=req_options, parameters={"stream": True})) as server_response:
             yield from server_response.iter_content(1024)
 
+    @api(version="3.18")
+    def export_many(
+        self,
+        custom_view_items: Iterable[CustomViewItem],
+        kind: str = "image",
+        options: Optional["RequestOptionsBase"] = None,
+        target_dir: Union[str, os.PathLike] = ".",
+        max_workers: int = 4,
+        max_age: Optional[int] = None,
+        filename: Optional[Callable[[CustomViewItem], str]] = None,
+    ) -> ExportManifest:
+        """
+        Exports many custom views concurrently, streaming each response to a
+        file in `target_dir`. `kind` is "image", "pdf" or "csv". See
+        Views.export_many for the other parameters.
+
+        Examples
+        --------
+        >>> manifest = server.custom_views.export_many(custom_views, "image", target_dir="exports", max_age=60)
+        """
+        return bulk_export.export_many(
+            self,
+            self.baseurl,
+            custom_view_items,
+            bulk_export.CUSTOM_VIEW_FORMATS,
+            kind,
+            options,
+            target_dir,
+            max_workers,
+            max_age,
+            filename,
+        )
+
     @api(version="3.18")
     def update(self, view_item: CustomViewItem) -> Optional[CustomViewItem]:
         """
@@ -57,6 +57,8 @@ PathOrFileW = Union[FilePath, FileObjectW]
 
 
 class Datasources(QuerysetEndpoint[DatasourceItem], TaggingMixin[DatasourceItem]):
+    PREFETCHABLE = ("connections", "permissions", "revisions")
+
     def __init__(self, parent_srv: "Server") -> None:
         super().__init__(parent_srv)
         self._permissions = _PermissionsEndpoint(parent_srv, lambda: self.baseurl)
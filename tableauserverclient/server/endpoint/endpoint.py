@@ -2,13 +2,19 @@ from typing_extensions import Concatenate, ParamSpec
 from tableauserverclient import datetime_helpers as datetime
 
 import abc
+import json
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from packaging.version import Version
+from requests.utils import super_len
 from functools import wraps
+from time import perf_counter
 from xml.etree.ElementTree import ParseError
 from typing import (
     Any,
     Callable,
     Generic,
+    IO,
     Optional,
     TYPE_CHECKING,
     TypeVar,
@@ -47,6 +53,12 @@ TABLEAU_AUTH_HEADER = "x-tableau-auth"
 USER_AGENT_HEADER = "User-Agent"
 
 
+def _is_conditional(server_response: "Response") -> bool:
+    request = getattr(server_response, "request", None)
+    headers = getattr(request, "headers", None) or {}
+    return "If-None-Match" in headers or "If-Modified-Since" in headers
+
+
 class Endpoint:
     def __init__(self, parent_srv: "Server"):
         self.parent_srv = parent_srv
@@ -106,7 +118,7 @@ class Endpoint:
         self,
         method: Callable[..., "Response"],
         url: str,
-        content: Optional[bytes] = None,
+        content: Optional[Union[bytes, IO[bytes]]] = None,
         auth_token: Optional[str] = None,
         content_type: Optional[str] = None,
         parameters: Optional[dict[str, Any]] = None,
@@ -116,7 +128,8 @@ class Endpoint:
         )
 
         logger.debug(f"request method {method.__name__}, url: {url}")
-        if content:
+        # large bodies, such as user import files, are streamed from a file object
+        if content and isinstance(content, (bytes, str)):
             redacted = helpers.strings.redact_xml(content[:200])
             # this needs to be under a trace or something, it's a LOT
             # logger.debug("request content: {}".format(redacted))
@@ -124,6 +137,8 @@ class Endpoint:
         # a request can, for stuff like publishing, spin for ages waiting for a response.
         # we need some user-facing activity so they know it's not dead.
         request_timeout = self.parent_srv.http_options.get("timeout") or 0
+        sent = super_len(content) if content is not None and self.parent_srv.profiler is not None else 0
+        started = perf_counter()
         server_response: Optional[Union["Response", Exception]] = self.send_request_while_show_progress_threaded(
             method, url, parameters, request_timeout
         )
@@ -138,9 +153,41 @@ class Endpoint:
             raise RuntimeError
         if isinstance(server_response, Exception):
             raise server_response
-        self._check_status(server_response, url)
-
-        loggable_response = self.log_response_safely(server_response)
+        try:
+            self._check_status(server_response, url)
+        except FailedSignInError:
+            # a cached session may have expired since it was stored; sign in again and retry once
+            if auth_token is None or not self.parent_srv._reauthenticate(auth_token):
+                raise
+            parameters["headers"][TABLEAU_AUTH_HEADER] = self.parent_srv.auth_token
+            # a streamed body has been read by the first attempt
+            seek = getattr(content, "seek", None)
+            if seek is not None:
+                seek(0)
+            server_response = self._blocking_request(method, url, parameters)
+            if server_response is None or isinstance(server_response, Exception):
+                raise RuntimeError(f"Request to {url} failed after signing in again")
+            self._check_status(server_response, url)
+
+        # a change made through the library makes the cached responses for the changed resource stale
+        if method.__name__ != "get" and self.parent_srv.response_cache is not None:
+            self.parent_srv.response_cache.invalidate(url)
+
+        if self.parent_srv.profiler is not None:
+            # streamed responses have not been read yet, so their size is taken from the headers
+            if parameters.get("stream"):
+                received = int(server_response.headers.get("Content-Length") or 0)
+            else:
+                received = len(server_response.content)
+            self.parent_srv.profiler.add_request(
+                self.__class__.__name__,
+                perf_counter() - started,
+                server_response.elapsed.total_seconds(),
+                sent,
+                received,
+            )
+
+        loggable_response = self.log_response_safely(server_response, stream=bool(parameters.get("stream")))
         logger.debug(f"Server response from {url}")
         # uncomment the following to log full responses in debug mode
         # BE CAREFUL WHEN SHARING THESE RESULTS - MAY CONTAIN YOUR SENSITIVE DATA
@@ -157,6 +204,9 @@ class Endpoint:
             raise OSError("Response is not a http response?")
         if server_response.status_code >= 500:
             raise InternalServerError(server_response, url)
+        elif server_response.status_code == 304 and _is_conditional(server_response):
+            # the response cache asked whether a cached response is still current, and it is
+            return
         elif server_response.status_code not in Success_codes:
             try:
                 if server_response.status_code == 401:
@@ -173,9 +223,13 @@ class Endpoint:
                 # anything else re-raise here
                 raise
 
-    def log_response_safely(self, server_response: "Response") -> str:
+    def log_response_safely(self, server_response: "Response", stream: bool = False) -> str:
         # Checking the content type header prevents eager evaluation of streaming requests.
         content_type = server_response.headers.get("Content-Type")
+        if stream:
+            # the body of a streamed response is read by the caller, and reading it here
+            # would download all of it before the caller sees the first chunk
+            return f"A stream of type {content_type} [Streamed Contents]"
 
         # Response.content is a property. Calling it will load the entire response into memory. Checking if the
         # content-type is an octet-stream accomplishes the same goal without eagerly loading content.
@@ -188,8 +242,31 @@ class Endpoint:
             loggable_response = helpers.strings.redact_xml(server_response.content.decode(server_response.encoding))
         return loggable_response
 
+    def _coalesced_get(self, url: str, auth_token: Optional[str], parameters: Optional[dict[str, Any]]) -> "Response":
+        # Identical GETs made while one is in flight share its response. Streamed
+        # responses can only be read once, so they are always requested separately.
+        if not self.parent_srv.coalesce_requests or (parameters and parameters.get("stream")):
+            return self._make_request(self.parent_srv.session.get, url, auth_token=auth_token, parameters=parameters)
+        key = (url, json.dumps(parameters, sort_keys=True, default=str), auth_token)
+        return self.parent_srv._single_flight.do(
+            key,
+            lambda: self._make_request(self.parent_srv.session.get, url, auth_token=auth_token, parameters=parameters),
+        )
+
+    def _cached_get(self, url: str, auth_token: Optional[str], parameters: Optional[dict[str, Any]]) -> "Response":
+        cache = self.parent_srv.response_cache
+        if cache is None or (parameters and parameters.get("stream")):
+            return self._coalesced_get(url, auth_token, parameters)
+
+        def send(headers: dict[str, str]) -> "Response":
+            request_parameters = dict(parameters or {})
+            request_parameters["headers"] = {**request_parameters.get("headers", {}), **headers}
+            return self._coalesced_get(url, auth_token, request_parameters)
+
+        return cache.fetch(url, (parameters or {}).get("params"), self.parent_srv._user_id, send)
+
     def get_unauthenticated_request(self, url):
-        return self._make_request(self.parent_srv.session.get, url)
+        return self._cached_get(url, None, None)
 
     def get_request(self, url, request_object=None, parameters=None):
         if request_object is not None:
@@ -201,12 +278,7 @@ class Endpoint:
             except EndpointUnavailableError:
                 url = request_object.apply_query_params(url)
 
-        return self._make_request(
-            self.parent_srv.session.get,
-            url,
-            auth_token=self.parent_srv.auth_token,
-            parameters=parameters,
-        )
+        return self._cached_get(url, self.parent_srv.auth_token, parameters)
 
     def delete_request(self, url):
         # We don't return anything for a delete request
@@ -271,7 +343,11 @@ def api(version: str) -> Callable[[Callable[Concatenate[E, P], R]], Callable[Con
         @wraps(func)
         def wrapper(self: E, *args: P.args, **kwargs: P.kwargs) -> R:
             self.parent_srv.assert_at_least_version(version, self.__class__.__name__)
-            return func(self, *args, **kwargs)
+            profiler = getattr(self.parent_srv, "profiler", None)
+            if profiler is None:
+                return func(self, *args, **kwargs)
+            with profiler.call(f"{self.__class__.__name__}.{func.__name__}"):
+                return func(self, *args, **kwargs)
 
         return wrapper
 
@@ -324,6 +400,10 @@ T = TypeVar("T")
 
 
 class QuerysetEndpoint(Endpoint, Generic[T]):
+    # the related resources that prefetch can populate: each has a lazy populate_<name> method and is
+    # read from, and stored back on, the item as <name> and _set_<name>
+    PREFETCHABLE: tuple[str, ...] = ()
+
     @api(version="2.0")
     def all(self, *args, page_size: Optional[int] = None, **kwargs) -> QuerySet[T]:
         if args or kwargs:
@@ -353,3 +433,70 @@ class QuerysetEndpoint(Endpoint, Generic[T]):
     @abc.abstractmethod
     def get(self, request_options: Optional[RequestOptions] = None) -> tuple[list[T], PaginationItem]:
         raise NotImplementedError(f".get has not been implemented for {self.__class__.__qualname__}")
+
+    def check_prefetch(self, related: Iterable[str]) -> None:
+        for name in related:
+            if name not in self.PREFETCHABLE:
+                expected = ", ".join(self.PREFETCHABLE) or "nothing"
+                raise ValueError(f"{self.__class__.__name__} cannot prefetch {name}. Expected one of {expected}.")
+
+    def prefetch(self, items: Iterable[T], *related: str, max_workers: int = 8) -> list[T]:
+        """
+        Populates related resources of many items at once, running the
+        requests concurrently, so that reading them later makes no further
+        requests. Each name in `related` must be in the endpoint's
+        PREFETCHABLE names, for example "views", "connections",
+        "permissions" or "revisions" for workbooks. Related resources that
+        are read through a Pager, or that are not stored on the item under
+        the same name, cannot be prefetched.
+
+        If a request fails, the error is logged and the item is left populated
+        lazily, so that reading the attribute makes the request again and
+        raises the error.
+
+        Parameters
+        ----------
+        items : Iterable[T]
+            The items to populate. Each must have an ID.
+
+        related : str
+            The names of the related resources to populate.
+
+        max_workers : int, default 8
+            The number of requests run at the same time.
+
+        Returns
+        -------
+        list[T]
+            The items, populated.
+
+        Examples
+        --------
+        >>> workbooks = server.workbooks.prefetch(TSC.Pager(server.workbooks), "views", "connections")
+        >>> workbooks[0].connections
+        """
+        items = list(items)
+        self.check_prefetch(related)
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        for name in related:
+            populate = getattr(self, f"populate_{name}")
+            for item in items:
+                populate(item)
+
+        def fetch(task: tuple[T, str]) -> None:
+            item, name = task
+            try:
+                value = getattr(item, name)
+            except (ServerResponseError, InternalServerError, NonXMLResponseError) as e:
+                logger.info(f"Could not prefetch {name} for item (ID: {getattr(item, 'id', None)}): {e}")
+                return
+            # replace the lazy fetcher with one that returns the fetched value
+            getattr(item, f"_set_{name}")(lambda: value)
+
+        tasks = [(item, name) for item in items for name in related]
+        if tasks:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(fetch, tasks))
+        logger.debug(f"Prefetched {', '.join(related)} for {len(items)} items")
+        return items
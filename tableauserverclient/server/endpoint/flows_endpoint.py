@@ -53,6 +53,8 @@ PathOrFileW = Union[FilePath, FileObjectW]
 
 
 class Flows(QuerysetEndpoint[FlowItem], TaggingMixin[FlowItem]):
+    PREFETCHABLE = ("connections", "permissions")
+
     def __init__(self, parent_srv):
         super().__init__(parent_srv)
         self._resource_tagger = _ResourceTagger(parent_srv)
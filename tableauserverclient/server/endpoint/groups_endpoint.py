@@ -1,20 +1,23 @@
 import logging
+from functools import partial
 
+from tableauserverclient.config import MAX_PAGE_SIZE
 from tableauserverclient.server.endpoint.endpoint import QuerysetEndpoint, api
 from tableauserverclient.server.endpoint.exceptions import MissingRequiredFieldError
 from tableauserverclient.server import RequestFactory
 from tableauserverclient.models import GroupItem, UserItem, PaginationItem, JobItem
 from tableauserverclient.server.pager import Pager
+from tableauserverclient.server.request_options import RequestOptions
 
 from tableauserverclient.helpers.logging import logger
 
-from typing import Literal, Optional, TYPE_CHECKING, Union, overload
+from typing import Literal, Optional, Union, overload
 from collections.abc import Iterable
 
 from tableauserverclient.server.query import QuerySet
 
-if TYPE_CHECKING:
-    from tableauserverclient.server.request_options import RequestOptions
+# the bulk add and remove requests accept many users, but very large bodies are slow to process
+MEMBERSHIP_BATCH_SIZE = 1000
 
 
 class Groups(QuerysetEndpoint[GroupItem]):
@@ -171,6 +174,7 @@ class Groups(QuerysetEndpoint[GroupItem]):
         url = f"{self.baseurl}/{group_id}"
         self.delete_request(url)
         logger.info(f"Deleted single group (ID: {group_id})")
+        self.parent_srv.resolver.invalidate("groups", group_id)
 
     @overload
     def update(self, group_item: GroupItem, as_job: Literal[False]) -> GroupItem: ...
@@ -222,6 +226,7 @@ class Groups(QuerysetEndpoint[GroupItem]):
         update_req = RequestFactory.Group.update_req(group_item)
         server_response = self.put_request(url, update_req)
         logger.info(f"Updated group item (ID: {group_item.id})")
+        self.parent_srv.resolver.invalidate("groups", group_item.id)
         if as_job:
             return JobItem.from_response(server_response.content, self.parent_srv.namespace)[0]
         else:
@@ -255,7 +260,9 @@ class Groups(QuerysetEndpoint[GroupItem]):
         url = self.baseurl
         create_req = RequestFactory.Group.create_local_req(group_item)
         server_response = self.post_request(url, create_req)
-        return GroupItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        new_group = GroupItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        self.parent_srv.resolver.store("groups", new_group.name, new_group.id)
+        return new_group
 
     @overload
     def create_AD_group(self, group_item: GroupItem, asJob: Literal[False]) -> GroupItem: ...
@@ -480,6 +487,77 @@ class Groups(QuerysetEndpoint[GroupItem]):
         logger.info(f"Added users to group (ID: {group_item.id})")
         return users
 
+    @api(version="3.21")
+    def sync_members(
+        self,
+        group_item: GroupItem,
+        desired_users: Iterable[Union[str, UserItem]],
+        batch_size: int = MEMBERSHIP_BATCH_SIZE,
+    ) -> tuple[list[str], list[str]]:
+        """
+        Makes the membership of a group match the given set of users. The
+        current members are read once with the largest page size, the
+        difference is computed locally, and the users to add or remove are
+        sent with the bulk add and remove requests in batches of at most
+        `batch_size` users.
+
+        Parameters
+        ----------
+        group_item : GroupItem
+            The group to update. Must have an ID.
+
+        desired_users : Iterable[Union[str, UserItem]]
+            The IDs or UserItems with IDs of every user that should be a member
+            of the group after the sync.
+
+        batch_size : int, default 1000
+            The maximum number of users sent in a single add or remove request.
+
+        Returns
+        -------
+        tuple[list[str], list[str]]
+            The IDs of the users that were added and the IDs of the users that
+            were removed.
+
+        Raises
+        ------
+        MissingRequiredFieldError
+            If the group_item does not have an ID, the method raises an error.
+
+        ValueError
+            If one of the desired users does not have an ID.
+
+        Examples
+        --------
+        >>> group = server.groups.filter(name="Finance")[0]
+        >>> added, removed = server.groups.sync_members(group, idp_member_ids)
+        """
+        if not group_item.id:
+            error = "Group item missing ID. Group must be retrieved from server first."
+            raise MissingRequiredFieldError(error)
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+
+        desired: set[str] = set()
+        for user in desired_users:
+            if not (user_id := user.id if isinstance(user, UserItem) else user):
+                raise ValueError("User ID must be populated")
+            desired.add(user_id)
+
+        options = RequestOptions(pagesize=MAX_PAGE_SIZE)
+        current = {user.id for user in Pager(partial(self._get_users_for_group, group_item), options) if user.id}
+
+        # sorted so that the batches are deterministic between runs
+        to_add = sorted(desired - current)
+        to_remove = sorted(current - desired)
+        for start in range(0, len(to_remove), batch_size):
+            self.remove_users(group_item, to_remove[start : start + batch_size])
+        for start in range(0, len(to_add), batch_size):
+            self.add_users(group_item, to_add[start : start + batch_size])
+
+        logger.info(f"Synced group (ID: {group_item.id}): added {len(to_add)}, removed {len(to_remove)} users")
+        return to_add, to_remove
+
     def filter(self, *invalid, page_size: Optional[int] = None, **kwargs) -> QuerySet[GroupItem]:
         """
         Queries the Tableau Server for items using the specified filters. Page
@@ -1,10 +1,16 @@
 import json
 import logging
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
 
 from .endpoint import Endpoint, api
-from .exceptions import GraphQLError, InvalidGraphQLQuery
+from .exceptions import GraphQLError, InternalServerError, InvalidGraphQLQuery, NonXMLResponseError, ServerResponseError
 
 from tableauserverclient.helpers.logging import logger
+from tableauserverclient.server.metadata_cache import MetadataCache
 
 
 def is_valid_paged_query(parsed_query):
@@ -41,13 +47,150 @@ def extract_values(obj, key):
     return results
 
 
-def get_page_info(result):
+def find_page_info(result, path=None):
+    """Return the pageInfo object of a paged query result, or None.
+
+    With a dot-separated `path` to the connection (or to its pageInfo) under
+    `data`, the object is looked up directly. Otherwise the result is searched
+    breadth first through nested objects only: pageInfo sits next to the list
+    of nodes, so the nodes themselves never need to be walked."""
+    data = result.get("data") if isinstance(result, dict) else None
+    if path is not None:
+        value = data
+        for key in path.split("."):
+            value = value.get(key) if isinstance(value, dict) else None
+        if isinstance(value, dict) and "pageInfo" in value:
+            value = value["pageInfo"]
+        return value if isinstance(value, dict) else None
+
+    queue = deque([data])
+    while queue:
+        obj = queue.popleft()
+        if not isinstance(obj, dict):
+            continue
+        page_info = obj.get("pageInfo")
+        if isinstance(page_info, dict):
+            return page_info
+        queue.extend(value for value in obj.values() if isinstance(value, dict))
+    return None
+
+
+def get_page_info(result, path=None):
+    page_info = find_page_info(result, path)
+    if page_info is not None:
+        return page_info.get("hasNextPage"), page_info.get("endCursor")
+    # pageInfo nested inside a list, fall back to searching the whole result
     next_page = extract_values(result, "hasNextPage")
     cursor = extract_values(result, "endCursor")
     return next_page.pop() if next_page else None, cursor.pop() if cursor else None
 
 
+def merge_data(merged, data):
+    """Merge the `data` of one query result into another. Lists are
+    concatenated, as are the nodes of connections; other values are replaced."""
+    for key, value in (data or {}).items():
+        existing = merged.get(key)
+        if isinstance(existing, list) and isinstance(value, list):
+            existing.extend(value)
+        elif isinstance(existing, dict) and isinstance(value, dict) and "nodes" in existing:
+            existing["nodes"].extend(value.get("nodes") or [])
+        else:
+            merged[key] = value
+    return merged
+
+
+class MetadataBatchResults:
+    """
+    The merged results of a query run over batches of IDs. `data` holds the
+    merged `data` of every batch. `errors` holds a (batch_ids, exception)
+    tuple for each batch that returned GraphQL errors, as a GraphQLError, or
+    failed with a server error. The data of a batch with GraphQL errors is
+    still merged, as the Metadata API returns partial results.
+    """
+
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+        self.errors: list[tuple[list[str], Exception]] = []
+
+    def __repr__(self):
+        return f"<MetadataBatchResults keys={list(self.data)} errors={len(self.errors)}>"
+
+
 class Metadata(Endpoint):
+    """
+    The Metadata API endpoint.
+
+    `json_loads` decodes the body of every query response. It defaults to the
+    standard library decoder and can be replaced with a faster compatible
+    function for large results, for example `orjson.loads`.
+
+    >>> import orjson
+    >>> server.metadata.json_loads = orjson.loads
+
+    `cache` is an optional MetadataCache for query responses, used by query,
+    query_batches, iter_pages and paginated_query. With
+    `cache_check_interval` set, the cache is cleared whenever the backfill or
+    eventing status of the Metadata API has changed, checked at most once per
+    interval in seconds.
+
+    >>> server.metadata.cache = TSC.InMemoryMetadataCache(ttl=600)
+    >>> server.metadata.cache_check_interval = 60
+    """
+
+    def __init__(self, parent_srv):
+        super().__init__(parent_srv)
+        self.json_loads: Callable[[bytes], Any] = json.loads
+        self.cache: Optional[MetadataCache] = None
+        self.cache_check_interval: Optional[float] = None
+        self._status_fingerprint: Optional[str] = None
+        self._status_checked_at: Optional[float] = None
+
+    def _decode(self, server_response) -> Any:
+        return self.json_loads(server_response.content)
+
+    def _post_query(self, query: str, variables: Optional[dict], parameters=None) -> Any:
+        graphql_query = json.dumps({"query": query, "variables": variables})
+        # request parameters can change the response, so those requests are not cached
+        cache = self.cache if parameters is None else None
+        # results depend on the permissions of the signed in user, so users never share entries
+        scope = f"{self.parent_srv.server_address}/{self.parent_srv.site_id}/{self.parent_srv._user_id}"
+        if cache is not None:
+            if self.cache_check_interval is not None:
+                checked_at = self._status_checked_at
+                if checked_at is None or time.monotonic() - checked_at >= self.cache_check_interval:
+                    self.check_cache()
+            results = cache.get(query, variables, scope)
+            if results is not None:
+                logger.debug("Metadata query served from cache")
+                return results
+
+        # Setting content type because post_reuqest defaults to text/xml
+        server_response = self.post_request(
+            self.baseurl, graphql_query, content_type="application/json", parameters=parameters
+        )
+        results = self._decode(server_response)
+        if cache is not None and isinstance(results, dict) and not results.get("errors"):
+            cache.set(query, variables, results, scope)
+        return results
+
+    def check_cache(self) -> bool:
+        """
+        Clears the cache if the backfill or eventing status of the Metadata
+        API has changed since the last check, which means the metadata may
+        have changed. Returns True if the cache was cleared.
+        """
+        self._status_checked_at = time.monotonic()
+        if self.cache is None or not self.parent_srv.check_at_least_version("3.9"):
+            return False
+        status = {"backfill": self.backfill_status(), "eventing": self.eventing_status()}
+        fingerprint = json.dumps(status, sort_keys=True)
+        changed = self._status_fingerprint is not None and fingerprint != self._status_fingerprint
+        self._status_fingerprint = fingerprint
+        if changed:
+            logger.info("Metadata API status changed, clearing the metadata cache")
+            self.cache.clear()
+        return changed
+
     @property
     def baseurl(self):
         return f"{self.parent_srv.server_address}/api/metadata/graphql"
@@ -60,22 +203,94 @@ class Metadata(Endpoint):
     def query(self, query, variables=None, abort_on_error=False, parameters=None):
         logger.info("Querying Metadata API")
 
-        url = self.baseurl
-
         try:
-            graphql_query = json.dumps({"query": query, "variables": variables})
+            json.dumps({"query": query, "variables": variables})
         except Exception as e:
             raise InvalidGraphQLQuery("Must provide a string")
 
-        # Setting content type because post_reuqest defaults to text/xml
-        server_response = self.post_request(url, graphql_query, content_type="application/json", parameters=parameters)
-        results = server_response.json()
+        results = self._post_query(query, variables, parameters)
 
         if abort_on_error and results.get("errors", None):
             raise GraphQLError(results["errors"])
 
         return results
 
+    @api("3.5")
+    def query_batches(
+        self,
+        query: str,
+        ids: Iterable[str],
+        id_variable: str = "ids",
+        variables: Optional[dict] = None,
+        batch_size: int = 100,
+        max_workers: int = 4,
+    ) -> MetadataBatchResults:
+        """
+        Runs a query once for each batch of IDs, with up to `max_workers`
+        batches in flight, and merges the results.
+
+        The query must filter on a list variable, usually with `idWithin` or
+        `luidWithin`; each batch of IDs is passed in that variable.
+
+        Parameters
+        ----------
+        query : str
+            The GraphQL query.
+
+        ids : Iterable[str]
+            The IDs to query for.
+
+        id_variable : str, default "ids"
+            The name of the query variable that receives each batch of IDs.
+
+        variables : dict, optional
+            Other query variables, sent with every batch.
+
+        batch_size : int, default 100
+            The number of IDs in each batch.
+
+        max_workers : int, default 4
+            The maximum number of concurrent requests.
+
+        Returns
+        -------
+        MetadataBatchResults
+            The merged data, and the errors of the batches that failed.
+
+        Examples
+        --------
+        >>> query = '''
+        >>> query tables($ids: [ID]) {
+        >>>     tables(filter: {idWithin: $ids}) { id name downstreamWorkbooks { luid } }
+        >>> }'''
+        >>> results = server.metadata.query_batches(query, table_ids, max_workers=8)
+        >>> tables = results.data["tables"]
+        """
+        if batch_size < 1 or max_workers < 1:
+            raise ValueError("batch_size and max_workers must be at least 1.")
+        id_list = list(dict.fromkeys(ids))
+        batches = [id_list[i : i + batch_size] for i in range(0, len(id_list), batch_size)]
+
+        def run(batch):
+            try:
+                return self.query(query, {**(variables or {}), id_variable: batch}), None
+            except (ServerResponseError, InternalServerError, NonXMLResponseError) as e:
+                return None, e
+
+        results = MetadataBatchResults()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # map keeps the batches in order, so the merged lists follow the order of the IDs
+            for batch, (result, error) in zip(batches, executor.map(run, batches)):
+                if result is not None:
+                    if result.get("errors"):
+                        error = GraphQLError(result["errors"])
+                    merge_data(results.data, result.get("data"))
+                if error is not None:
+                    logger.info(f"Metadata query failed for a batch of {len(batch)} IDs: {error}")
+                    results.errors.append((batch, error))
+        logger.info(f"Ran metadata query for {len(id_list)} IDs in {len(batches)} batches")
+        return results
+
     @api("3.9")
     def backfill_status(self):
         url = self.control_baseurl + "/backfill/status"
@@ -89,16 +304,61 @@ class Metadata(Endpoint):
         return response.json()
 
     @api("3.5")
-    def paginated_query(self, query, variables=None, abort_on_error=False):
+    def paginated_query(self, query, variables=None, abort_on_error=False, page_info_path=None):
         logger.info("Querying Metadata API using a Paged Query")
-        url = self.baseurl
+        results_dict = {"pages": list(self.iter_pages(query, variables, abort_on_error, page_info_path))}
+        logger.info("Sucessfully got all results for paged query")
+        return results_dict
 
+    @api("3.5")
+    def iter_pages(
+        self,
+        query: str,
+        variables: Optional[dict] = None,
+        abort_on_error: bool = False,
+        page_info_path: Optional[str] = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Runs a paged query and yields each page of results as soon as it
+        arrives, so that only one page is held in memory at a time.
+
+        The query must accept the `$first` and `$afterToken` variables and
+        request the `pageInfo` object with `hasNextPage` and `endCursor`. The
+        query is validated when this method is called, before the first page
+        is requested.
+
+        Parameters
+        ----------
+        query : str
+            The GraphQL query.
+
+        variables : dict, optional
+            The query variables. Defaults to pages of 100 items.
+
+        abort_on_error : bool, default False
+            If True, raises GraphQLError as soon as a page contains errors.
+
+        page_info_path : str, optional
+            The dot-separated path under `data` to the paged connection, for
+            example "publishedDatasourcesConnection". The cursor is then read
+            from that connection directly instead of being searched for.
+
+        Yields
+        ------
+        dict
+            The JSON response for each page.
+
+        Examples
+        --------
+        >>> for page in server.metadata.iter_pages(query, {"first": 500}):
+        >>>     process(page["data"])
+        """
         if variables is None:
             # default paramaters
             variables = {"first": 100, "afterToken": None}
-        elif ("first" in variables) and ("afterToken" not in variables):
-            # they passed a page size but not a token, probably because they're starting at `null` token
-            variables.update({"afterToken": None})
+        else:
+            # they may pass a page size but not a token, probably because they're starting at `null` token
+            variables = {"afterToken": None, **variables}
 
         graphql_query = json.dumps({"query": query, "variables": variables})
         parsed_query = json.loads(graphql_query)
@@ -108,36 +368,65 @@ class Metadata(Endpoint):
                 "Paged queries must have a `$first` and `$afterToken` variables as well as "
                 "a pageInfo object with `endCursor` and `hasNextPage`"
             )
+        return self._iter_pages(query, variables, abort_on_error, page_info_path)
 
-        results_dict = {"pages": []}
-        paginated_results = results_dict["pages"]
-
-        # get first page
-        server_response = self.post_request(url, graphql_query, content_type="application/json")
-        results = server_response.json()
-
-        if abort_on_error and results.get("errors", None):
-            raise GraphQLError(results["errors"])
-
-        paginated_results.append(results)
-
-        # repeat
-        has_another_page, cursor = get_page_info(results)
-
+    def _iter_pages(
+        self, query: str, variables: dict, abort_on_error: bool, page_info_path: Optional[str]
+    ) -> Iterator[dict[str, Any]]:
+        has_another_page = True
         while has_another_page:
-            # Update the page
-            variables.update({"afterToken": cursor})
-            # make the call
-            logger.debug("Calling Token: " + cursor)
-            graphql_query = json.dumps({"query": query, "variables": variables})
-            server_response = self.post_request(url, graphql_query, content_type="application/json")
-            results = server_response.json()
+            results = self._post_query(query, variables)
             # verify response
             if abort_on_error and results.get("errors", None):
                 raise GraphQLError(results["errors"])
-            # save results and repeat
-            paginated_results.append(results)
-            has_another_page, cursor = get_page_info(results)
+            has_another_page, cursor = get_page_info(results, page_info_path)
+            yield results
+            if has_another_page:
+                logger.debug("Calling Token: " + cursor)
+                variables["afterToken"] = cursor
 
-        logger.info("Sucessfully got all results for paged query")
-        return results_dict
+    @api("3.5")
+    def iter_nodes(
+        self, query: str, path: str, variables: Optional[dict] = None, abort_on_error: bool = False
+    ) -> Iterator[Any]:
+        """
+        Runs a paged query and yields the nodes of every page one at a time.
+
+        Parameters
+        ----------
+        query : str
+            The GraphQL query, with the same requirements as for iter_pages.
+
+        path : str
+            The dot-separated path to the list of nodes within the `data` of
+            each page, for example "publishedDatasourcesConnection.nodes".
+
+        variables : dict, optional
+            The query variables. Defaults to pages of 100 items.
+
+        abort_on_error : bool, default False
+            If True, raises GraphQLError as soon as a page contains errors.
+
+        Yields
+        ------
+        The nodes found at the path, in the order returned by the server.
+
+        Examples
+        --------
+        >>> nodes = server.metadata.iter_nodes(query, "fieldsConnection.nodes")
+        >>> for field in nodes:
+        >>>     print(field["name"])
+        """
+        keys = path.split(".")
+        # the connection that holds the nodes also holds the pageInfo
+        connection_path = ".".join(keys[:-1]) or None
+        pages = self.iter_pages(query, variables, abort_on_error, connection_path)
+
+        def nodes():
+            for page in pages:
+                value = page.get("data")
+                for key in keys:
+                    value = value.get(key) if isinstance(value, dict) else None
+                yield from value or ()
+
+        return nodes()
@@ -25,6 +25,8 @@ class Projects(QuerysetEndpoint[ProjectItem]):
     API and operate on the ProjectItem class.
     """
 
+    PREFETCHABLE = ("permissions",)
+
     def __init__(self, parent_srv: "Server") -> None:
         super().__init__(parent_srv)
 
@@ -88,6 +90,7 @@ class Projects(QuerysetEndpoint[ProjectItem]):
         url = f"{self.baseurl}/{project_id}"
         self.delete_request(url)
         logger.info(f"Deleted single project (ID: {project_id})")
+        self.parent_srv.resolver.invalidate("projects", project_id)
 
     @api(version="2.0")
     def update(self, project_item: ProjectItem, samples: bool = False) -> ProjectItem:
@@ -130,6 +133,7 @@ class Projects(QuerysetEndpoint[ProjectItem]):
         update_req = RequestFactory.Project.update_req(project_item)
         server_response = self.put_request(url, update_req, XML_CONTENT_TYPE, params)
         logger.info(f"Updated project item (ID: {project_item.id})")
+        self.parent_srv.resolver.invalidate("projects", project_item.id)
         updated_project = ProjectItem.from_response(server_response.content, self.parent_srv.namespace)[0]
         return updated_project
 
@@ -169,6 +173,7 @@ class Projects(QuerysetEndpoint[ProjectItem]):
         server_response = self.post_request(url, create_req, XML_CONTENT_TYPE, params)
         new_project = ProjectItem.from_response(server_response.content, self.parent_srv.namespace)[0]
         logger.info(f"Created new project (ID: {new_project.id})")
+        self.parent_srv.resolver.store("projects", new_project.name, new_project.id)
         return new_project
 
     @api(version="2.0")
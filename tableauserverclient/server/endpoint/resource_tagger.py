@@ -1,24 +1,33 @@
 import abc
 import copy
+from concurrent.futures import ThreadPoolExecutor
 from typing import Generic, Optional, Protocol, TypeVar, Union, TYPE_CHECKING, runtime_checkable
 from collections.abc import Iterable
 import urllib.parse
 
 from tableauserverclient.server.endpoint.endpoint import Endpoint, api
-from tableauserverclient.server.endpoint.exceptions import ServerResponseError
+from tableauserverclient.server.endpoint.exceptions import (
+    InternalServerError,
+    NonXMLResponseError,
+    ServerResponseError,
+)
 from tableauserverclient.server.exceptions import EndpointUnavailableError
 from tableauserverclient.server import RequestFactory
-from tableauserverclient.models import TagItem
+from tableauserverclient.models import (
+    DatabaseItem,
+    DatasourceItem,
+    FlowItem,
+    TableItem,
+    TagItem,
+    ViewItem,
+    VirtualConnectionItem,
+    WorkbookItem,
+)
 
 from tableauserverclient.helpers.logging import logger
 
 if TYPE_CHECKING:
     from tableauserverclient.models.column_item import ColumnItem
-    from tableauserverclient.models.database_item import DatabaseItem
-    from tableauserverclient.models.datasource_item import DatasourceItem
-    from tableauserverclient.models.flow_item import FlowItem
-    from tableauserverclient.models.table_item import TableItem
-    from tableauserverclient.models.workbook_item import WorkbookItem
     from tableauserverclient.server.server import Server
 
 
@@ -182,3 +191,172 @@ class Tags(Endpoint):
         batch_delete_req = RequestFactory.Tag.batch_create(tag_set, content)
         server_response = self.put_request(url, batch_delete_req)
         return TagItem.from_response(server_response.content, self.parent_srv.namespace)
+
+    def buffer(self, batch_size: int = 100, max_workers: int = 8, max_pending: int = 10000) -> "TagBuffer":
+        """
+        Returns a TagBuffer that collects tag additions and deletions for many
+        items and sends them in as few requests as possible.
+
+        Parameters
+        ----------
+        batch_size : int, default 100
+            The maximum number of items in a single batch request.
+
+        max_workers : int, default 8
+            The number of concurrent requests when the server does not support
+            batch tagging (API 3.9) and each item is tagged separately.
+
+        max_pending : int, default 10000
+            The buffer is flushed automatically when this many items have
+            pending tag operations.
+
+        Examples
+        --------
+        >>> with server.tags.buffer() as tag_buffer:
+        >>>     for workbook in TSC.Pager(server.workbooks):
+        >>>         tag_buffer.add(workbook, "certified")
+        """
+        return TagBuffer(self, batch_size=batch_size, max_workers=max_workers, max_pending=max_pending)
+
+
+# the endpoint used to tag each item type separately when batch tagging is not available
+_TAGGING_ENDPOINT_NAMES = {
+    DatabaseItem: "databases",
+    DatasourceItem: "datasources",
+    FlowItem: "flows",
+    TableItem: "tables",
+    ViewItem: "views",
+    VirtualConnectionItem: "virtual_connections",
+    WorkbookItem: "workbooks",
+}
+
+
+class TagBuffer:
+    """
+    Collects tags to add to and delete from many workbooks, views, data
+    sources, tables, columns, flows and databases, then flushes them with
+    Tags.batch_add and Tags.batch_delete. Items that get the same set of tags
+    share a batch request, and batches hold at most `batch_size` items. On
+    servers before API 3.9 each item is tagged with its own endpoint instead,
+    using `max_workers` concurrent requests.
+
+    The last operation for an item and tag wins: adding a tag cancels a
+    pending deletion of the same tag and vice versa. Deletions are sent before
+    additions. After a successful flush, the `tags` of the buffered items are
+    updated to match. Failed requests are recorded in `errors` as
+    (operation, tags, items, exception) tuples instead of being raised.
+
+    Used as a context manager, the buffer is flushed on exit.
+    """
+
+    def __init__(self, tags_endpoint: Tags, batch_size: int = 100, max_workers: int = 8, max_pending: int = 10000):
+        if batch_size < 1 or max_workers < 1:
+            raise ValueError("batch_size and max_workers must be at least 1.")
+        self.tags_endpoint = tags_endpoint
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.errors: list[tuple[str, frozenset[str], list, Exception]] = []
+        self._items: dict[str, object] = {}
+        self._adds: dict[str, set[str]] = {}
+        self._deletes: dict[str, set[str]] = {}
+
+    def __repr__(self):
+        return f"<TagBuffer pending_items={len(self)} errors={len(self.errors)}>"
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __enter__(self) -> "TagBuffer":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.flush()
+
+    def add(self, items, tags: Union[Iterable[str], str]) -> None:
+        """Queues tags to be added to an item or an iterable of items."""
+        self._buffer(items, tags, self._adds, self._deletes)
+
+    def delete(self, items, tags: Union[Iterable[str], str]) -> None:
+        """Queues tags to be deleted from an item or an iterable of items."""
+        self._buffer(items, tags, self._deletes, self._adds)
+
+    def _buffer(self, items, tags, pending: dict[str, set[str]], opposite: dict[str, set[str]]) -> None:
+        tag_set = {tags} if isinstance(tags, str) else set(tags)
+        if getattr(items, "id", None) is not None or not isinstance(items, Iterable):
+            items = [items]
+        for item in items:
+            if (item_id := getattr(item, "id", None)) is None:
+                raise ValueError(f"Item {item} must have an ID to be tagged.")
+            self._items[item_id] = item
+            pending.setdefault(item_id, set()).update(tag_set)
+            if item_id in opposite:
+                opposite[item_id] -= tag_set
+        if len(self._items) >= self.max_pending:
+            self.flush()
+
+    def flush(self) -> None:
+        """Sends all pending tag operations and clears the buffer."""
+        items, deletes, adds = self._items, self._deletes, self._adds
+        self._items, self._deletes, self._adds = {}, {}, {}
+
+        for operation, pending in (("delete", deletes), ("add", adds)):
+            by_tags: dict[frozenset[str], list] = {}
+            for item_id, tag_set in pending.items():
+                if tag_set:
+                    by_tags.setdefault(frozenset(tag_set), []).append(items[item_id])
+            if self.tags_endpoint.parent_srv.check_at_least_version("3.9"):
+                self._flush_batches(operation, by_tags)
+            else:
+                self._flush_per_item(operation, by_tags)
+        logger.info(f"Flushed tags for {len(items)} items")
+
+    def _flush_batches(self, operation: str, by_tags: dict[frozenset[str], list]) -> None:
+        send = self.tags_endpoint.batch_add if operation == "add" else self.tags_endpoint.batch_delete
+        for tag_set, items in by_tags.items():
+            for start in range(0, len(items), self.batch_size):
+                batch = items[start : start + self.batch_size]
+                try:
+                    send(tag_set, batch)
+                except (ServerResponseError, InternalServerError, NonXMLResponseError) as e:
+                    logger.info(f"Could not {operation} tags {set(tag_set)} for {len(batch)} items: {e}")
+                    self.errors.append((operation, tag_set, batch, e))
+                    continue
+                for item in batch:
+                    self._update_local_tags(item, operation, tag_set)
+
+    def _flush_per_item(self, operation: str, by_tags: dict[frozenset[str], list]) -> None:
+        server = self.tags_endpoint.parent_srv
+
+        def send(pair) -> None:
+            tag_set, item = pair
+            try:
+                name = next(name for t, name in _TAGGING_ENDPOINT_NAMES.items() if isinstance(item, t))
+            except StopIteration:
+                error = f"Tagging {item.__class__.__name__} is only available with REST API version 3.9 and later."
+                self.errors.append((operation, tag_set, [item], EndpointUnavailableError(error)))
+                return
+            endpoint = getattr(server, name)
+            try:
+                if operation == "add":
+                    endpoint.add_tags(item, tag_set)
+                else:
+                    endpoint.delete_tags(item, tag_set)
+            except (ServerResponseError, InternalServerError, NonXMLResponseError, EndpointUnavailableError) as e:
+                logger.info(f"Could not {operation} tags {set(tag_set)} for item (ID: {item.id}): {e}")
+                self.errors.append((operation, tag_set, [item], e))
+                return
+            self._update_local_tags(item, operation, tag_set)
+
+        pairs = [(tag_set, item) for tag_set, items in by_tags.items() for item in items]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(executor.map(send, pairs))
+
+    @staticmethod
+    def _update_local_tags(item, operation: str, tag_set: frozenset[str]) -> None:
+        if not isinstance(item, Taggable):
+            return
+        tags = item.tags | tag_set if operation == "add" else item.tags - tag_set
+        item.tags = tags
+        item._initial_tags = copy.copy(tags)
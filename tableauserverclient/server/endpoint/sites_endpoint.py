@@ -236,6 +236,7 @@ class Sites(Endpoint):
         update_req = RequestFactory.Site.update_req(site_item, self.parent_srv)
         server_response = self.put_request(url, update_req)
         logger.info(f"Updated site item (ID: {site_item.id})")
+        self.parent_srv.resolver.invalidate("sites", site_item.id)
         update_site = copy.copy(site_item)
         return update_site._parse_common_tags(server_response.content, self.parent_srv.namespace)
 
@@ -275,6 +276,7 @@ class Sites(Endpoint):
         self.delete_request(url)
         self.parent_srv._clear_auth()
         logger.info(f"Deleted single site (ID: {site_id}) and signed out")
+        self.parent_srv.resolver.invalidate("sites", site_id)
 
     # Create new site
     @api(version="2.0")
@@ -330,6 +332,7 @@ class Sites(Endpoint):
         server_response = self.post_request(url, create_req)
         new_site = SiteItem.from_response(server_response.content, self.parent_srv.namespace)[0]
         logger.info(f"Created new site (ID: {new_site.id})")
+        self.parent_srv.resolver.store("sites", new_site.name, new_site.id)
         return new_site
 
     @api(version="3.5")
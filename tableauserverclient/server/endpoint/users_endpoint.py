@@ -1,18 +1,102 @@
 import copy
 import logging
-from typing import Optional
+import tempfile
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import IO, Optional
 
 from tableauserverclient.server.query import QuerySet
 
 from .endpoint import QuerysetEndpoint, api
-from .exceptions import MissingRequiredFieldError, ServerResponseError
+from .exceptions import InternalServerError, MissingRequiredFieldError, NonXMLResponseError, ServerResponseError
 from tableauserverclient.server import RequestFactory, RequestOptions
-from tableauserverclient.models import UserItem, WorkbookItem, PaginationItem, GroupItem
+from tableauserverclient.models import UserItem, WorkbookItem, PaginationItem, GroupItem, JobItem
 from ..pager import Pager
 
 from tableauserverclient.helpers.logging import logger
 
 
+class UserImportResult:
+    """
+    The outcome of importing a single line of a user import CSV file. The
+    password column of the line is never kept.
+
+    A line is PartiallyApplied when the user was added but setting the
+    display name, email or password afterwards failed. `user` is then the
+    user that now exists on the server and `error` the update error, so
+    the line should be retried with an update rather than another add.
+    """
+
+    class Status:
+        Created = "Created"
+        Failed = "Failed"
+        Invalid = "Invalid"
+        PartiallyApplied = "PartiallyApplied"
+        Queued = "Queued"
+
+    def __init__(
+        self,
+        line_number: int,
+        name: str,
+        status: str,
+        user: Optional[UserItem] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        self.line_number = line_number
+        self.name = name
+        self.status = status
+        self.user = user
+        self.error = error
+
+    def __repr__(self):
+        return f"<UserImportResult line={self.line_number} name={self.name} status={self.status} error={self.error!r}>"
+
+
+class UserImportReport:
+    """
+    Per-line results of Users.import_from_file, in file order. When the users
+    were submitted as a single import job, `job` holds the job and the
+    imported lines have the Queued status.
+    """
+
+    def __init__(self) -> None:
+        self.results: list[UserImportResult] = []
+        self.job: Optional[JobItem] = None
+
+    def __repr__(self):
+        counts = dict(Counter(result.status for result in self.results))
+        return f"<UserImportReport lines={len(self.results)} {counts} job={getattr(self.job, 'id', None)}>"
+
+    def __iter__(self):
+        return iter(self.results)
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def _with_status(self, status: str) -> list[UserImportResult]:
+        return [result for result in self.results if result.status == status]
+
+    @property
+    def created(self) -> list[UserItem]:
+        return [result.user for result in self._with_status(UserImportResult.Status.Created) if result.user]
+
+    @property
+    def failed(self) -> list[tuple[UserItem, Exception]]:
+        return [
+            (result.user, result.error)
+            for result in self._with_status(UserImportResult.Status.Failed)
+            if result.user and result.error
+        ]
+
+    @property
+    def invalid(self) -> list[UserImportResult]:
+        return self._with_status(UserImportResult.Status.Invalid)
+
+    @property
+    def partially_applied(self) -> list[UserImportResult]:
+        return self._with_status(UserImportResult.Status.PartiallyApplied)
+
+
 class Users(QuerysetEndpoint[UserItem]):
     """
     The user resources for Tableau Server are defined in the UserItem class.
@@ -201,6 +285,7 @@ class Users(QuerysetEndpoint[UserItem]):
         update_req = RequestFactory.User.update_req(user_item, password)
         server_response = self.put_request(url, update_req)
         logger.info(f"Updated user item (ID: {user_item.id})")
+        self.parent_srv.resolver.invalidate("users", user_item.id)
         updated_item = copy.copy(user_item)
         return updated_item._parse_common_tags(server_response.content, self.parent_srv.namespace)
 
@@ -240,6 +325,7 @@ class Users(QuerysetEndpoint[UserItem]):
             url += f"?mapAssetsTo={map_assets_to}"
         self.delete_request(url)
         logger.info(f"Removed single user (ID: {user_id})")
+        self.parent_srv.resolver.invalidate("users", user_id)
 
     # Add new user to site
     @api(version="2.0")
@@ -340,6 +426,7 @@ class Users(QuerysetEndpoint[UserItem]):
         logger.info(server_response)
         new_user = UserItem.from_response(server_response.content, self.parent_srv.namespace).pop()
         logger.info(f"Added new user (ID: {new_user.id})")
+        self.parent_srv.resolver.store("users", new_user.name, new_user.id)
         return new_user
 
     # Add new users to site. This does not actually perform a bulk action, it's syntactic sugar
@@ -358,26 +445,167 @@ class Users(QuerysetEndpoint[UserItem]):
     # helping the user by parsing a file they could have used to add users through the UI
     # line format: Username [required], password, display name, license, admin, publish
     @api(version="2.0")
-    def create_from_file(self, filepath: str) -> tuple[list[UserItem], list[tuple[UserItem, ServerResponseError]]]:
-        created = []
+    def create_from_file(
+        self, filepath: str, max_workers: int = 8
+    ) -> tuple[list[UserItem], list[tuple[UserItem, Exception]]]:
+        """
+        Adds the users listed in a user import CSV file to the site, one add
+        request per user. Returns the created users and the (user, error)
+        pairs for the lines that failed validation or were rejected by the
+        server. Use import_from_file for the full per-line report.
+        """
+        report = self.import_from_file(filepath, max_workers=max_workers, use_import_job=False)
         failed = []
-        if not filepath.find("csv"):
+        for result in report:
+            if result.error is not None:
+                failed.append((result.user or UserItem(result.name), result.error))
+        return report.created, failed
+
+    @api(version="2.0")
+    def import_from_file(
+        self, filepath: str, max_workers: int = 8, use_import_job: Optional[bool] = None
+    ) -> UserImportReport:
+        """
+        Adds the users listed in a CSV file in the Tableau user import format
+        (https://help.tableau.com/current/server/en-us/csvguidelines.htm) to
+        the site.
+
+        The file is read and validated one line at a time. On servers that
+        support it (API 3.15 and later) the valid lines are submitted as a
+        single asynchronous import job. Otherwise each user is added, and then
+        updated with the display name, email and password from the file, on a
+        pool of worker threads so that many users are in flight at once.
+
+        Parameters
+        ----------
+        filepath : str
+            The path to the CSV file. The file must not have a header row.
+
+        max_workers : int, default 8
+            The number of users added concurrently when not using an import job.
+
+        use_import_job : Optional[bool]
+            Whether to submit the users as an import job. By default an import
+            job is used when the server version supports it.
+
+        Returns
+        -------
+        UserImportReport
+            The result of each line of the file. If an import job was used,
+            the report's job can be passed to server.jobs.wait_for_job.
+
+        Examples
+        --------
+        >>> report = server.users.import_from_file("users.csv")
+        >>> for result in report.invalid:
+        >>>     print(result.line_number, result.name, result.error)
+        """
+        if not filepath.lower().endswith(".csv"):
             raise ValueError("Only csv files are accepted")
+        if use_import_job is None:
+            use_import_job = self.parent_srv.check_at_least_version("3.15")
 
         with open(filepath) as csv_file:
-            csv_file.seek(0)  # set to start of file in case it has been read earlier
-            line: str = csv_file.readline()
-            while line and line != "":
-                user: UserItem = UserItem.CSVImport.create_user_from_line(line)
+            if use_import_job:
+                return self._import_as_job(csv_file)
+            return self._import_per_user(csv_file, max_workers)
+
+    @staticmethod
+    def _parse_import_line(line_number: int, line: str) -> tuple[UserImportResult, list[str]]:
+        values = [value.strip() for value in line.split(",")]
+        result = UserImportResult(line_number, values[0], UserImportResult.Status.Queued)
+        try:
+            UserItem.CSVImport._validate_import_line_or_throw(line, logger)
+            result.user = UserItem.CSVImport.create_user_from_line(line)
+        except (AttributeError, ValueError) as e:
+            logger.info(f"Invalid user on line {line_number}: {e}")
+            result.status = UserImportResult.Status.Invalid
+            result.error = e
+        return result, values
+
+    def _import_as_job(self, csv_file) -> UserImportReport:
+        report = UserImportReport()
+        users: list[UserItem] = []
+        # the valid lines are spooled to disk, so that large files are never held in memory
+        with tempfile.TemporaryFile() as rows:
+            for line_number, line in enumerate(csv_file, start=1):
+                if not line.strip():
+                    continue
+                result, values = self._parse_import_line(line_number, line)
+                report.results.append(result)
+                if result.user is not None:
+                    # the auth column is not part of the import file format, it is sent in the request payload
+                    row = ",".join(values[: UserItem.CSVImport.ColumnType.EMAIL + 1])
+                    if users:
+                        rows.write(b"\n")
+                    rows.write(row.encode("utf-8"))
+                    users.append(result.user)
+
+            if users:
+                rows.seek(0)
+                report.job = self._import_csv(rows, users)
+        return report
+
+    @api(version="3.15")
+    def _import_csv(self, csv_file: IO[bytes], users: list[UserItem]) -> JobItem:
+        url = f"{self.baseurl}/import"
+        import_req, content_type = RequestFactory.User.import_from_csv_req(csv_file, users)
+        with import_req:
+            server_response = self.post_request(url, import_req, content_type)
+        new_job = JobItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        logger.info(f"Importing {len(users)} users (Job ID: {new_job.id})")
+        return new_job
+
+    def _import_per_user(self, csv_file, max_workers: int) -> UserImportReport:
+        report = UserImportReport()
+        pending: dict[Future, UserImportResult] = {}
+
+        def collect(futures) -> None:
+            for future in futures:
+                result = pending.pop(future)
                 try:
-                    print(user)
-                    result = self.add(user)
-                    created.append(result)
-                except ServerResponseError as serverError:
-                    print("failed")
-                    failed.append((user, serverError))
-                line = csv_file.readline()
-        return created, failed
+                    result.user, update_error = future.result()
+                except (ServerResponseError, InternalServerError, NonXMLResponseError, ValueError) as e:
+                    logger.info(f"Failed to add user on line {result.line_number}: {e}")
+                    result.status = UserImportResult.Status.Failed
+                    result.error = e
+                    continue
+                if update_error is None:
+                    result.status = UserImportResult.Status.Created
+                else:
+                    logger.info(f"Added user on line {result.line_number} but failed to update it: {update_error}")
+                    result.status = UserImportResult.Status.PartiallyApplied
+                    result.error = update_error
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for line_number, line in enumerate(csv_file, start=1):
+                if not line.strip():
+                    continue
+                result, values = self._parse_import_line(line_number, line)
+                report.results.append(result)
+                if result.user is None:
+                    continue
+                password = values[UserItem.CSVImport.ColumnType.PASS] if len(values) > 1 else None
+                pending[executor.submit(self._add_with_details, result.user, password or None)] = result
+                # only keep a bounded number of users in flight, so the file is never read ahead too far
+                if len(pending) >= 2 * max_workers:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+            collect(wait(pending).done)
+        return report
+
+    def _add_with_details(self, user_item: UserItem, password: Optional[str]) -> tuple[UserItem, Optional[Exception]]:
+        # the add request only accepts the name, site role and auth setting
+        new_user = self.add(user_item)
+        if not (user_item.fullname or user_item.email or password):
+            return new_user, None
+        new_user.fullname = user_item.fullname
+        new_user.email = user_item.email
+        try:
+            return self.update(new_user, password), None
+        except (ServerResponseError, InternalServerError, NonXMLResponseError, ValueError) as e:
+            # the user exists now, so the error is reported alongside it instead of as a failed add
+            return new_user, e
 
     # Get workbooks for user
     @api(version="2.0")
@@ -1,7 +1,10 @@
 import logging
+import os
 from contextlib import closing
 
 from tableauserverclient.models.permissions_item import PermissionsRule
+from tableauserverclient.server.endpoint import bulk_export
+from tableauserverclient.server.endpoint.bulk_export import ExportManifest
 from tableauserverclient.server.endpoint.endpoint import QuerysetEndpoint, api
 from tableauserverclient.server.endpoint.exceptions import MissingRequiredFieldError
 from tableauserverclient.server.endpoint.permissions_endpoint import _PermissionsEndpoint
@@ -12,8 +15,8 @@ from tableauserverclient.models import ViewItem, PaginationItem
 
 from tableauserverclient.helpers.logging import logger
 
-from typing import Optional, TYPE_CHECKING, Union
-from collections.abc import Iterable, Iterator
+from typing import Any, Callable, Optional, TYPE_CHECKING, Union
+from collections.abc import Iterable, Iterator, Mapping
 
 if TYPE_CHECKING:
     from tableauserverclient.server.request_options import (
@@ -22,6 +25,7 @@ if TYPE_CHECKING:
         PDFRequestOptions,
         ImageRequestOptions,
         ExcelRequestOptions,
+        RequestOptionsBase,
     )
 
 
@@ -32,6 +36,8 @@ class Views(QuerysetEndpoint[ViewItem], TaggingMixin[ViewItem]):
     in the Tableau Server REST API.
     """
 
+    PREFETCHABLE = ("image", "pdf", "permissions", "preview_image")
+
     def __init__(self, parent_srv):
         super().__init__(parent_srv)
         self._permissions = _PermissionsEndpoint(parent_srv, lambda: self.baseurl)
@@ -257,6 +263,69 @@ class Views(QuerysetEndpoint[ViewItem], TaggingMixin[ViewItem]):
         with closing(self.get_request(url, request_object=req_options, parameters={"stream": True})) as server_response:
             yield from server_response.iter_content(1024)
 
+    @api(version="2.7")
+    def iter_csv_batches(
+        self,
+        view_item: ViewItem,
+        req_options: Optional["CSVRequestOptions"] = None,
+        batch_rows: int = 10000,
+        converter: Optional[Callable[[list[dict[str, str]]], Any]] = None,
+    ) -> Iterator[Any]:
+        """
+        Streams the CSV data of a view and yields it in batches of rows as it
+        is downloaded, so that memory use is bounded by the batch size rather
+        than the size of the download.
+
+        REST API: https://help.tableau.com/current/api/rest_api/en-us/REST/rest_api_ref_workbooks_and_views.htm#query_view_data
+
+        Parameters
+        ----------
+        view_item: ViewItem
+            The view item whose data is downloaded.
+
+        req_options: Optional[CSVRequestOptions], default None
+            Optional request options for the request. These options can include
+            parameters such as view filters and max age.
+
+        batch_rows: int, default 10000
+            The largest number of rows in a batch.
+
+        converter: Optional[Callable[[list[dict[str, str]]], Any]], default None
+            Applied to each batch before it is yielded, for example
+            `pandas.DataFrame.from_records` or `pyarrow.RecordBatch.from_pylist`.
+            By default each batch is a list of dictionaries keyed by column name.
+
+        Returns
+        -------
+        Iterator[Any]
+            The batches of rows.
+
+        Examples
+        --------
+        >>> for frame in server.views.iter_csv_batches(view, converter=pandas.DataFrame.from_records):
+        ...     totals.append(frame.groupby("Region")["Sales"].sum())
+        """
+        if not view_item.id:
+            error = "View item missing ID."
+            raise MissingRequiredFieldError(error)
+        if batch_rows < 1:
+            raise ValueError("batch_rows must be at least 1.")
+        return self._iter_csv_batches(view_item, req_options, batch_rows, converter)
+
+    def _iter_csv_batches(
+        self,
+        view_item: ViewItem,
+        req_options: Optional["CSVRequestOptions"],
+        batch_rows: int,
+        converter: Optional[Callable[[list[dict[str, str]]], Any]],
+    ) -> Iterator[Any]:
+        url = f"{self.baseurl}/{view_item.id}/data"
+
+        with closing(self.get_request(url, request_object=req_options, parameters={"stream": True})) as server_response:
+            yield from bulk_export.csv_batches(
+                server_response.iter_content(bulk_export.EXPORT_CHUNK_SIZE), batch_rows, converter
+            )
+
     @api(version="3.8")
     def populate_excel(self, view_item: ViewItem, req_options: Optional["ExcelRequestOptions"] = None) -> None:
         """
@@ -296,6 +365,166 @@ class Views(QuerysetEndpoint[ViewItem], TaggingMixin[ViewItem]):
         with closing(self.get_request(url, request_object=req_options, parameters={"stream": True})) as server_response:
             yield from server_response.iter_content(1024)
 
+    @api(version="2.5")
+    def export_many(
+        self,
+        view_items: Iterable[ViewItem],
+        kind: str = "image",
+        options: Optional["RequestOptionsBase"] = None,
+        target_dir: Union[str, os.PathLike] = ".",
+        max_workers: int = 4,
+        max_age: Optional[int] = None,
+        filename: Optional[Callable[[ViewItem], str]] = None,
+    ) -> ExportManifest:
+        """
+        Exports many views concurrently, streaming each response straight to
+        a file in `target_dir` instead of holding it in memory. A failed
+        export is recorded in the manifest and does not stop the others.
+        The workbooks and custom views endpoints have the same method.
+
+        Parameters
+        ----------
+        view_items: Iterable[ViewItem]
+            The views to export. Each must have an ID. Items repeated in the
+            list are exported once.
+
+        kind: str, default "image"
+            The export to download, one of "image", "pdf", "csv" or "excel".
+
+        options: Optional[RequestOptionsBase], default None
+            The request options sent with every export, such as filters,
+            resolution or page type.
+
+        target_dir: Union[str, os.PathLike], default "."
+            The directory the files are written to. It is created if needed.
+
+        max_workers: int, default 4
+            The number of exports run at the same time.
+
+        max_age: Optional[int], default None
+            The number of minutes the server may serve a cached export
+            instead of rendering it again. Overrides the max age in `options`.
+
+        filename: Optional[Callable[[ViewItem], str]], default None
+            Returns the file name for an item. Files are named after the item
+            ID by default.
+
+        Returns
+        -------
+        ExportManifest
+            The path, size, time taken and error of each export.
+
+        Raises
+        ------
+        ValueError
+            If `filename` gives two items the same file, checked before
+            anything is exported.
+
+        Examples
+        --------
+        >>> manifest = server.views.export_many(all_views, "image", target_dir="exports", max_age=60)
+        >>> manifest.save("exports/manifest.json")
+        """
+        return bulk_export.export_many(
+            self,
+            self.baseurl,
+            view_items,
+            bulk_export.VIEW_FORMATS,
+            kind,
+            options,
+            target_dir,
+            max_workers,
+            max_age,
+            filename,
+        )
+
+    @api(version="2.5")
+    def burst(
+        self,
+        view_item: ViewItem,
+        filters: Optional[Mapping[str, Iterable[str]]] = None,
+        parameters: Optional[Mapping[str, Iterable[str]]] = None,
+        kind: str = "pdf",
+        options: Optional["RequestOptionsBase"] = None,
+        target_dir: Union[str, os.PathLike] = ".",
+        max_workers: int = 4,
+        max_age: Optional[int] = None,
+        filename: Optional[Callable[[ViewItem, dict[str, str]], str]] = None,
+    ) -> ExportManifest:
+        """
+        Exports a view once for every combination of filter and parameter
+        values, running the exports concurrently and streaming each one to a
+        file in `target_dir`. Repeated values, and combinations that would
+        send the same request, are exported once.
+
+        Files are named after the view and the values, for example
+        `Sales__Region-West__Segment-Consumer.pdf`, with characters that are
+        not safe in file names replaced by underscores.
+
+        Parameters
+        ----------
+        view_item: ViewItem
+            The view to export. It must have an ID.
+
+        filters: Optional[Mapping[str, Iterable[str]]], default None
+            The values of each view filter field, applied as `vf`.
+
+        parameters: Optional[Mapping[str, Iterable[str]]], default None
+            The values of each workbook parameter.
+
+        kind: str, default "pdf"
+            The export to download, one of "image", "pdf", "csv" or "excel".
+
+        options: Optional[RequestOptionsBase], default None
+            The request options every export starts from. Filters in
+            `options` are sent with every export.
+
+        target_dir: Union[str, os.PathLike], default "."
+            The directory the files are written to. It is created if needed.
+
+        max_workers: int, default 4
+            The number of exports run at the same time.
+
+        max_age: Optional[int], default None
+            The number of minutes the server may serve a cached export
+            instead of rendering it again.
+
+        filename: Optional[Callable[[ViewItem, dict[str, str]], str]], default None
+            Returns the file name for the view and a dictionary of the
+            filter and parameter values of one export.
+
+        Returns
+        -------
+        ExportManifest
+            One result per export, with the values it was filtered by.
+
+        Examples
+        --------
+        >>> manifest = server.views.burst(
+        ...     view,
+        ...     filters={"Region": ["East", "West"], "Segment": ["Consumer", "Corporate"]},
+        ...     kind="pdf",
+        ...     target_dir="bursts",
+        ...     max_workers=8,
+        ... )
+        >>> len(manifest)
+        4
+        """
+        return bulk_export.burst(
+            self,
+            self.baseurl,
+            view_item,
+            bulk_export.VIEW_FORMATS,
+            kind,
+            filters,
+            parameters,
+            options,
+            target_dir,
+            max_workers,
+            max_age,
+            filename,
+        )
+
     @api(version="3.2")
     def populate_permissions(self, item: ViewItem) -> None:
         """
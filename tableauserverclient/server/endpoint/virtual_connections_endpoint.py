@@ -20,6 +20,8 @@ if TYPE_CHECKING:
 
 
 class VirtualConnections(QuerysetEndpoint[VirtualConnectionItem], TaggingMixin):
+    PREFETCHABLE = ("permissions",)
+
     def __init__(self, parent_srv: "Server") -> None:
         super().__init__(parent_srv)
         self._permissions = _PermissionsEndpoint(parent_srv, lambda: self.baseurl)
@@ -10,6 +10,8 @@ from tableauserverclient.helpers.headers import fix_filename
 from tableauserverclient.models.permissions_item import PermissionsRule
 from tableauserverclient.server.query import QuerySet
 
+from tableauserverclient.server.endpoint import bulk_export
+from tableauserverclient.server.endpoint.bulk_export import ExportManifest
 from tableauserverclient.server.endpoint.endpoint import QuerysetEndpoint, api, parameter_added_in
 from tableauserverclient.server.endpoint.exceptions import InternalServerError, MissingRequiredFieldError
 from tableauserverclient.server.endpoint.permissions_endpoint import _PermissionsEndpoint
@@ -26,6 +28,7 @@ from tableauserverclient.models import WorkbookItem, ConnectionItem, ViewItem, P
 from tableauserverclient.server import RequestFactory
 
 from typing import (
+    Callable,
     Optional,
     TYPE_CHECKING,
     Union,
@@ -34,7 +37,7 @@ from collections.abc import Iterable, Sequence
 
 if TYPE_CHECKING:
     from tableauserverclient.server import Server
-    from tableauserverclient.server.request_options import RequestOptions
+    from tableauserverclient.server.request_options import RequestOptions, RequestOptionsBase
     from tableauserverclient.models import DatasourceItem
     from tableauserverclient.server.endpoint.schedules_endpoint import AddResponse
 
@@ -57,6 +60,8 @@ PathOrFileW = Union[FilePath, FileObjectW]
 
 
 class Workbooks(QuerysetEndpoint[WorkbookItem], TaggingMixin[WorkbookItem]):
+    PREFETCHABLE = ("connections", "pdf", "permissions", "powerpoint", "preview_image", "revisions", "views")
+
     def __init__(self, parent_srv: "Server") -> None:
         super().__init__(parent_srv)
         self._permissions = _PermissionsEndpoint(parent_srv, lambda: self.baseurl)
@@ -567,6 +572,39 @@ class Workbooks(QuerysetEndpoint[WorkbookItem], TaggingMixin[WorkbookItem]):
         pptx = server_response.content
         return pptx
 
+    @api(version="3.4")
+    def export_many(
+        self,
+        workbook_items: Iterable[WorkbookItem],
+        kind: str = "pdf",
+        options: Optional["RequestOptionsBase"] = None,
+        target_dir: Union[str, os.PathLike] = ".",
+        max_workers: int = 4,
+        max_age: Optional[int] = None,
+        filename: Optional[Callable[[WorkbookItem], str]] = None,
+    ) -> ExportManifest:
+        """
+        Exports many workbooks concurrently, streaming each response to a file
+        in `target_dir`. `kind` is "pdf" or "powerpoint". See Views.export_many
+        for the other parameters.
+
+        Examples
+        --------
+        >>> manifest = server.workbooks.export_many(all_workbooks, "pdf", target_dir="exports", max_age=60)
+        """
+        return bulk_export.export_many(
+            self,
+            self.baseurl,
+            workbook_items,
+            bulk_export.WORKBOOK_FORMATS,
+            kind,
+            options,
+            target_dir,
+            max_workers,
+            max_age,
+            filename,
+        )
+
     # Get preview image of workbook
     @api(version="2.0")
     def populate_preview_image(self, workbook_item: WorkbookItem) -> None:
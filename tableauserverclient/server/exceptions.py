@@ -7,3 +7,7 @@ class ServerInfoEndpointNotFoundError(Exception):
 
 class EndpointUnavailableError(Exception):
     pass
+
+
+class UnrecordedRequestError(Exception):
+    pass
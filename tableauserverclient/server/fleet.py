@@ -0,0 +1,243 @@
+import time
+from collections.abc import Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Optional, TYPE_CHECKING
+
+from tableauserverclient.helpers.logging import logger
+from tableauserverclient.models import Credentials
+from tableauserverclient.server.endpoint.exceptions import NotSignedInError
+
+if TYPE_CHECKING:
+    from tableauserverclient.server.server import Server
+
+# how often the running calls are checked against the timeout, in seconds
+_TIMEOUT_POLL_INTERVAL = 0.05
+
+
+class FleetResult:
+    """
+    The outcome of running a function on one server of a Fleet. `value` is
+    what the function returned, or None if it failed or timed out, in which
+    case `error` holds the exception (a TimeoutError for a timeout).
+    """
+
+    def __init__(self, name: str, server: "Server") -> None:
+        self.name = name
+        self.server = server
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+        self.seconds = 0.0
+
+    def __repr__(self):
+        return f"<FleetResult server={self.name} succeeded={self.succeeded} seconds={self.seconds:.2f}>"
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+    @property
+    def timed_out(self) -> bool:
+        return isinstance(self.error, TimeoutError)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "server": self.name,
+            "address": self.server.server_address,
+            "succeeded": self.succeeded,
+            "value": self.value,
+            "error": str(self.error) if self.error is not None else None,
+            "seconds": self.seconds,
+        }
+
+
+class FleetResults:
+    """The results of running a function across a Fleet, in the order the servers were added."""
+
+    def __init__(self, results: list[FleetResult], seconds: float) -> None:
+        self.results = results
+        self.seconds = seconds
+
+    def __repr__(self):
+        return f"<FleetResults servers={len(self.results)} failed={len(self.failed)} seconds={self.seconds:.2f}>"
+
+    def __iter__(self):
+        return iter(self.results)
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __getitem__(self, name: str) -> FleetResult:
+        for result in self.results:
+            if result.name == name:
+                return result
+        raise KeyError(name)
+
+    @property
+    def succeeded(self) -> list[FleetResult]:
+        return [result for result in self.results if result.succeeded]
+
+    @property
+    def failed(self) -> list[FleetResult]:
+        return [result for result in self.results if not result.succeeded]
+
+    @property
+    def values(self) -> dict[str, Any]:
+        """The value returned by each server that succeeded, keyed by name."""
+        return {result.name: result.value for result in self.succeeded}
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"seconds": self.seconds, "results": [result.to_dict() for result in self.results]}
+
+
+class Fleet:
+    """
+    Runs the same operation across many Tableau Servers at once, instead of
+    looping over them one after another.
+
+    Servers are added under a name, with the credentials to sign in with.
+    `connect` negotiates the REST API version of every server and signs in to
+    all of them concurrently, `map` runs a function on every signed in server
+    and `sign_out` signs out of all of them. Each of these returns a
+    FleetResults report, and a failure or timeout on one server does not stop
+    the others. A Fleet can be used as a context manager that connects on
+    entry and signs out on exit.
+
+    A call that runs longer than `timeout` seconds is reported as a
+    TimeoutError. Python threads cannot be stopped, so the call carries on in
+    the background and keeps its worker busy until it returns; set a timeout
+    in the servers' HTTP options as well to bound each request.
+
+    Parameters
+    ----------
+    max_workers : int, default 8
+        The number of servers called at the same time.
+
+    timeout : float, optional
+        The number of seconds a call may run on one server. No limit by default.
+
+    Examples
+    --------
+    >>> fleet = TSC.Fleet(timeout=120)
+    >>> fleet.add("prod", TSC.Server("https://prod.example.com"), TSC.PersonalAccessTokenAuth("ops", token))
+    >>> fleet.add("dev", TSC.Server("https://dev.example.com"), TSC.PersonalAccessTokenAuth("ops", dev_token))
+    >>> with fleet:
+    ...     report = fleet.map(lambda server: server.server_info.get().product_version)
+    >>> report.values
+    {'prod': '2024.2.0', 'dev': '2025.1.0'}
+    """
+
+    def __init__(self, max_workers: int = 8, timeout: Optional[float] = None) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._members: dict[str, tuple["Server", Credentials]] = {}
+
+    def __repr__(self):
+        return f"<Fleet servers={len(self._members)} max_workers={self.max_workers} timeout={self.timeout}>"
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __enter__(self) -> "Fleet":
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.sign_out()
+
+    @property
+    def servers(self) -> dict[str, "Server"]:
+        return {name: server for name, (server, _) in self._members.items()}
+
+    def add(self, name: str, server: "Server", credentials: Credentials) -> None:
+        if name in self._members:
+            raise ValueError(f"A server named {name} is already in the fleet.")
+        self._members[name] = (server, credentials)
+
+    def remove(self, name: str) -> None:
+        del self._members[name]
+
+    def connect(self, use_server_version: bool = True) -> FleetResults:
+        """
+        Signs in to every server that is not signed in, first switching each
+        to the highest REST API version it supports unless
+        `use_server_version` is False. The value of each result is the
+        version used.
+        """
+
+        def connect_member(server: "Server", credentials: Credentials) -> str:
+            if not server.is_signed_in():
+                if use_server_version:
+                    server.use_server_version()
+                server.auth.sign_in(credentials)
+            return server.version
+
+        return self._run(connect_member, list(self._members))
+
+    def map(self, fn: Callable[["Server"], Any], names: Optional[Iterable[str]] = None) -> FleetResults:
+        """
+        Calls `fn(server)` on every server, or on the servers named, and
+        collects what it returns. Servers that are not signed in are reported
+        with a NotSignedInError without calling `fn`.
+        """
+        selected = list(names) if names is not None else list(self._members)
+
+        def call(server: "Server", _: Credentials) -> Any:
+            if not server.is_signed_in():
+                raise NotSignedInError("Server is not signed in. Call connect first.")
+            return fn(server)
+
+        return self._run(call, selected)
+
+    def sign_out(self) -> FleetResults:
+        """Signs out of every signed in server."""
+
+        def sign_out_member(server: "Server", _: Credentials) -> None:
+            if server.is_signed_in():
+                server.auth.sign_out()
+
+        return self._run(sign_out_member, list(self._members))
+
+    def _run(self, fn: Callable[["Server", Credentials], Any], names: list[str]) -> FleetResults:
+        results = {name: FleetResult(name, self._members[name][0]) for name in names}
+        started_at: dict[str, float] = {}
+
+        def run(name: str) -> Any:
+            started_at[name] = time.monotonic()
+            try:
+                return fn(*self._members[name])
+            finally:
+                if not results[name].timed_out:
+                    results[name].seconds = time.monotonic() - started_at[name]
+
+        started = time.perf_counter()
+        # not used as a context manager, which would wait for calls that timed out
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            pending: dict[Future, str] = {executor.submit(run, name): name for name in names}
+            while pending:
+                done, _ = wait(pending, timeout=_TIMEOUT_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = pending.pop(future)
+                    try:
+                        results[name].value = future.result()
+                    except Exception as e:
+                        logger.info(f"Fleet call failed on {name}: {e}")
+                        results[name].error = e
+                if self.timeout is None:
+                    continue
+                now = time.monotonic()
+                for future, name in list(pending.items()):
+                    if name in started_at and now - started_at[name] > self.timeout:
+                        logger.info(f"Fleet call timed out on {name} after {self.timeout}s")
+                        results[name].error = TimeoutError(f"Timed out after {self.timeout} seconds")
+                        results[name].seconds = now - started_at[name]
+                        del pending[future]
+        finally:
+            executor.shutdown(wait=False)
+        report = FleetResults(list(results.values()), time.perf_counter() - started)
+        logger.info(
+            f"Fleet call succeeded on {len(report.succeeded)} of {len(report)} servers in {report.seconds:.1f}s"
+        )
+        return report
@@ -0,0 +1,350 @@
+import itertools
+import os
+import sqlite3
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional, TYPE_CHECKING, Union
+
+from tableauserverclient.config import MAX_PAGE_SIZE
+from tableauserverclient.datetime_helpers import format_datetime
+from tableauserverclient.helpers.logging import logger
+from tableauserverclient.server.filter import Filter
+from tableauserverclient.server.pager import Pager
+from tableauserverclient.server.request_options import RequestOptions
+
+if TYPE_CHECKING:
+    from tableauserverclient.server.server import Server
+
+
+class _Resource:
+    # How one listing endpoint is mirrored into a table. Resources with
+    # `incremental` set support the updatedAt filter, so later syncs only
+    # request the items updated since the watermark. Resources with
+    # `tracks_views` set derive a last_viewed_at column from total_views.
+    def __init__(
+        self,
+        table: str,
+        endpoint: str,
+        columns: dict[str, Callable[[Any], Any]],
+        incremental: bool = True,
+        tagged: bool = False,
+        get_kwargs: Optional[dict[str, Any]] = None,
+        tracks_views: bool = False,
+    ) -> None:
+        self.table = table
+        self.endpoint = endpoint
+        self.columns = columns
+        self.incremental = incremental
+        self.tagged = tagged
+        self.get_kwargs = get_kwargs or {}
+        self.tracks_views = tracks_views
+
+    @property
+    def table_columns(self) -> list[str]:
+        return [*self.columns, *(["last_viewed_at"] if self.tracks_views else [])]
+
+
+def _attr(name: str) -> Callable[[Any], Any]:
+    def get(item):
+        value = getattr(item, name, None)
+        return format_datetime(value) if isinstance(value, datetime) else value
+
+    return get
+
+
+def _last_viewed_at(
+    previous: Optional[tuple[Optional[int], Optional[str]]], total_views: Optional[int], synced_at: str
+) -> Optional[str]:
+    # the view was viewed since the last sync if its count went up; the first sync has nothing to compare to
+    if previous is None:
+        return None
+    previous_views, previous_last_viewed = previous
+    if total_views is not None and previous_views is not None and total_views > previous_views:
+        return synced_at
+    return previous_last_viewed
+
+
+RESOURCES: dict[str, _Resource] = {
+    resource.table: resource
+    for resource in (
+        _Resource(
+            "projects",
+            "projects",
+            {
+                "name": _attr("name"),
+                "description": _attr("description"),
+                "parent_id": _attr("parent_id"),
+                "owner_id": _attr("owner_id"),
+                "content_permissions": _attr("content_permissions"),
+                "created_at": _attr("created_at"),
+                "updated_at": _attr("updated_at"),
+            },
+        ),
+        _Resource(
+            "workbooks",
+            "workbooks",
+            {
+                "name": _attr("name"),
+                "content_url": _attr("content_url"),
+                "project_id": _attr("project_id"),
+                "owner_id": _attr("owner_id"),
+                "size": _attr("size"),
+                "show_tabs": _attr("show_tabs"),
+                "created_at": _attr("created_at"),
+                "updated_at": _attr("updated_at"),
+            },
+            tagged=True,
+        ),
+        _Resource(
+            "views",
+            "views",
+            {
+                "name": _attr("name"),
+                "content_url": _attr("content_url"),
+                "workbook_id": _attr("workbook_id"),
+                "project_id": _attr("project_id"),
+                "owner_id": _attr("owner_id"),
+                "total_views": _attr("_total_views"),
+                "created_at": _attr("created_at"),
+                "updated_at": _attr("updated_at"),
+            },
+            # usage changes do not move updatedAt, so views are listed in full to keep the counts current
+            incremental=False,
+            tagged=True,
+            get_kwargs={"usage": True},
+            tracks_views=True,
+        ),
+        _Resource(
+            "datasources",
+            "datasources",
+            {
+                "name": _attr("name"),
+                "content_url": _attr("content_url"),
+                "project_id": _attr("project_id"),
+                "owner_id": _attr("owner_id"),
+                "datasource_type": _attr("datasource_type"),
+                "size": _attr("size"),
+                "has_extracts": _attr("has_extracts"),
+                "certified": _attr("certified"),
+                "created_at": _attr("created_at"),
+                "updated_at": _attr("updated_at"),
+            },
+            tagged=True,
+        ),
+        _Resource(
+            "users",
+            "users",
+            {
+                "name": _attr("name"),
+                "fullname": _attr("fullname"),
+                "email": _attr("email"),
+                "site_role": _attr("site_role"),
+                "auth_setting": _attr("auth_setting"),
+                "domain_name": _attr("domain_name"),
+                "last_login": _attr("last_login"),
+            },
+            incremental=False,
+        ),
+        _Resource(
+            "groups",
+            "groups",
+            {
+                "name": _attr("name"),
+                "domain_name": _attr("domain_name"),
+                "minimum_site_role": _attr("minimum_site_role"),
+                "license_mode": _attr("license_mode"),
+            },
+            incremental=False,
+        ),
+    )
+}
+
+
+class ContentInventory:
+    """
+    Mirrors the projects, workbooks, views, data sources, users and groups of
+    the signed in site into a local SQLite database, so that ownership, size,
+    usage and tag reports can be answered with SQL instead of crawling the
+    server each time.
+
+    Each table is keyed by site ID and item ID, so several sites can be synced
+    into the same database by signing in to each of them in turn. Tags are
+    kept in the `tags` table, and `sync_state` holds a watermark per site and
+    resource. After the first sync, projects, workbooks and data sources are
+    only requested when their `updatedAt` is at or after the watermark, and
+    items deleted on the server are only removed by a full sync. Users and
+    groups cannot be filtered that way, and the usage counts of views change
+    without changing their `updatedAt`, so these are fully listed on every
+    sync. Every page of results is written with bulk upserts in a single
+    transaction.
+
+    The REST API does not report when a view was last viewed, so the views
+    table derives `last_viewed_at` from the usage counts: it is the time of
+    the first sync that saw `total_views` go up. It is accurate to the
+    interval between syncs, and NULL until an increase has been seen.
+
+    Parameters
+    ----------
+    server : Server
+        A signed in Server object.
+
+    database : str | os.PathLike | sqlite3.Connection, default ":memory:"
+        The SQLite database file, or an open connection.
+
+    Examples
+    --------
+    >>> inventory = TSC.ContentInventory(server, "inventory.db")
+    >>> inventory.sync()
+    >>> inventory.connection.execute("SELECT owner_id, SUM(size) FROM workbooks GROUP BY owner_id").fetchall()
+    >>> inventory.connection.execute("SELECT workbook_id, MAX(last_viewed_at) FROM views GROUP BY workbook_id")
+    """
+
+    def __init__(self, server: "Server", database: Union[str, os.PathLike, sqlite3.Connection] = ":memory:") -> None:
+        self.parent_srv = server
+        if isinstance(database, sqlite3.Connection):
+            self.connection = database
+        else:
+            self.connection = sqlite3.connect(database)
+        self._create_schema()
+
+    def __repr__(self):
+        return f"<ContentInventory site={self.parent_srv.site_id}>"
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def _create_schema(self) -> None:
+        with self.connection:
+            for resource in RESOURCES.values():
+                columns = "".join(f", {column}" for column in resource.table_columns)
+                self.connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS {resource.table} "
+                    f"(site_id TEXT NOT NULL, id TEXT NOT NULL{columns}, synced_at TEXT, PRIMARY KEY (site_id, id))"
+                )
+                # databases created by earlier versions are missing the columns added since
+                existing = {row[1] for row in self.connection.execute(f"PRAGMA table_info({resource.table})")}
+                for column in resource.table_columns:
+                    if column not in existing:
+                        self.connection.execute(f"ALTER TABLE {resource.table} ADD COLUMN {column}")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS tags (site_id TEXT NOT NULL, content_type TEXT NOT NULL, "
+                "content_id TEXT NOT NULL, tag TEXT NOT NULL, PRIMARY KEY (site_id, content_type, content_id, tag))"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS sync_state (site_id TEXT NOT NULL, resource TEXT NOT NULL, "
+                "watermark TEXT, synced_at TEXT, PRIMARY KEY (site_id, resource))"
+            )
+
+    def watermark(self, resource: str) -> Optional[str]:
+        """Returns the newest `updated_at` seen for a resource on the signed in site."""
+        row = self.connection.execute(
+            "SELECT watermark FROM sync_state WHERE site_id = ? AND resource = ?",
+            (self.parent_srv.site_id, resource),
+        ).fetchone()
+        return row[0] if row else None
+
+    def sync(self, resources: Optional[Iterable[str]] = None, full: bool = False) -> dict[str, int]:
+        """
+        Brings the local tables up to date with the signed in site.
+
+        Parameters
+        ----------
+        resources : Iterable[str], optional
+            The tables to sync, out of projects, workbooks, views,
+            datasources, users and groups. All of them by default.
+
+        full : bool, default False
+            If True, every item is requested regardless of the watermark, and
+            rows for items no longer on the server are deleted.
+
+        Returns
+        -------
+        dict[str, int]
+            The number of items fetched for each resource.
+        """
+        names = list(resources) if resources is not None else list(RESOURCES)
+        for name in names:
+            if name not in RESOURCES:
+                raise ValueError(f"Unknown resource {name}. Expected one of {', '.join(RESOURCES)}.")
+        return {name: self._sync_resource(RESOURCES[name], full) for name in names}
+
+    def _sync_resource(self, resource: _Resource, full: bool) -> int:
+        site_id = self.parent_srv.site_id
+        synced_at = format_datetime(datetime.now(timezone.utc))
+        watermark = self.watermark(resource.table)
+        incremental = resource.incremental and not full and watermark is not None
+
+        options = RequestOptions(pagesize=MAX_PAGE_SIZE)
+        if incremental:
+            options.filter.add(
+                Filter(RequestOptions.Field.UpdatedAt, RequestOptions.Operator.GreaterThanOrEqual, watermark)
+            )
+
+        columns = ["site_id", "id", *resource.table_columns, "synced_at"]
+        updates = ", ".join(f"{column} = excluded.{column}" for column in columns[2:])
+        upsert = (
+            f"INSERT INTO {resource.table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+            f"ON CONFLICT (site_id, id) DO UPDATE SET {updates}"
+        )
+
+        previous_views = self._view_counts(resource.table) if resource.tracks_views else {}
+
+        count = 0
+        newest = watermark
+        seen: set[str] = set()
+        items = iter(Pager(getattr(self.parent_srv, resource.endpoint), options, **resource.get_kwargs))
+        while page := list(itertools.islice(items, MAX_PAGE_SIZE)):
+            rows = []
+            for item in page:
+                row = [site_id, item.id, *(get(item) for get in resource.columns.values())]
+                if resource.tracks_views:
+                    total_views = resource.columns["total_views"](item)
+                    row.append(_last_viewed_at(previous_views.get(item.id), total_views, synced_at))
+                row.append(synced_at)
+                rows.append(row)
+                seen.add(item.id)
+                updated_at = resource.columns["updated_at"](item) if "updated_at" in resource.columns else None
+                if updated_at is not None and (newest is None or updated_at > newest):
+                    newest = updated_at
+            with self.connection:
+                self.connection.executemany(upsert, rows)
+                if resource.tagged:
+                    self._write_tags(resource.table, page)
+            count += len(page)
+
+        with self.connection:
+            if not incremental:
+                stored = self.connection.execute(f"SELECT id FROM {resource.table} WHERE site_id = ?", (site_id,))
+                deleted = [(site_id, item_id) for (item_id,) in stored.fetchall() if item_id not in seen]
+                self.connection.executemany(f"DELETE FROM {resource.table} WHERE site_id = ? AND id = ?", deleted)
+                if resource.tagged:
+                    self.connection.execute(
+                        f"DELETE FROM tags WHERE site_id = ? AND content_type = ? "
+                        f"AND content_id NOT IN (SELECT id FROM {resource.table} WHERE site_id = ?)",
+                        (site_id, resource.table, site_id),
+                    )
+            self.connection.execute(
+                "INSERT INTO sync_state (site_id, resource, watermark, synced_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (site_id, resource) DO UPDATE SET watermark = excluded.watermark, "
+                "synced_at = excluded.synced_at",
+                (site_id, resource.table, newest, synced_at),
+            )
+        logger.info(f"Synced {count} {resource.table} ({'incremental' if incremental else 'full'})")
+        return count
+
+    def _view_counts(self, table: str) -> dict[str, tuple[Optional[int], Optional[str]]]:
+        rows = self.connection.execute(
+            f"SELECT id, total_views, last_viewed_at FROM {table} WHERE site_id = ?", (self.parent_srv.site_id,)
+        )
+        return {item_id: (total_views, last_viewed_at) for item_id, total_views, last_viewed_at in rows}
+
+    def _write_tags(self, content_type: str, items: list) -> None:
+        site_id = self.parent_srv.site_id
+        self.connection.executemany(
+            "DELETE FROM tags WHERE site_id = ? AND content_type = ? AND content_id = ?",
+            ((site_id, content_type, item.id) for item in items),
+        )
+        self.connection.executemany(
+            "INSERT INTO tags (site_id, content_type, content_id, tag) VALUES (?, ?, ?, ?)",
+            ((site_id, content_type, item.id, tag) for item in items for tag in sorted(getattr(item, "tags", ()))),
+        )
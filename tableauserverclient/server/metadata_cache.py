@@ -0,0 +1,158 @@
+import abc
+import copy
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Union
+
+from tableauserverclient.helpers.logging import logger
+
+
+class MetadataCache(abc.ABC):
+    """
+    Base class for caches of Metadata API responses. Responses are keyed by
+    the query text, with runs of whitespace collapsed, the variables and the
+    server, site and user queried, so the same query formatted differently
+    shares an entry. Only responses without GraphQL errors are cached.
+
+    Assign a cache to `server.metadata.cache` to use it. `hits` and `misses`
+    count the lookups.
+
+    Parameters
+    ----------
+    ttl : float, default 600
+        The number of seconds a response is kept.
+    """
+
+    def __init__(self, ttl: float = 600) -> None:
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} ttl={self.ttl} hits={self.hits} misses={self.misses}>"
+
+    @staticmethod
+    def key(query: str, variables: Optional[dict] = None, scope: str = "") -> str:
+        normalized = re.sub(r"\s+", " ", query).strip()
+        payload = json.dumps({"scope": scope, "query": normalized, "variables": variables or {}}, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, query: str, variables: Optional[dict] = None, scope: str = "") -> Optional[dict]:
+        value = self._get(self.key(query, variables, scope))
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, query: str, variables: Optional[dict], value: dict, scope: str = "") -> None:
+        self._set(self.key(query, variables, scope), value)
+
+    @abc.abstractmethod
+    def _get(self, key: str) -> Optional[dict]:
+        pass
+
+    @abc.abstractmethod
+    def _set(self, key: str, value: dict) -> None:
+        pass
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        pass
+
+
+class InMemoryMetadataCache(MetadataCache):
+    """
+    Keeps Metadata API responses in memory, evicting the least recently used
+    response once `max_size` responses are held.
+
+    >>> server.metadata.cache = TSC.InMemoryMetadataCache(ttl=300, max_size=100)
+    """
+
+    def __init__(self, ttl: float = 600, max_size: int = 256) -> None:
+        super().__init__(ttl)
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        # copies keep callers that modify a response from changing the cached one
+        return copy.deepcopy(value)
+
+    def _set(self, key: str, value: dict) -> None:
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class FileMetadataCache(MetadataCache):
+    """
+    Keeps Metadata API responses as JSON files in a directory, so that they
+    are shared between runs and between processes. The files are only
+    readable by the user that wrote them.
+
+    >>> server.metadata.cache = TSC.FileMetadataCache("~/.cache/tsc-metadata", ttl=3600)
+    """
+
+    def __init__(self, directory: Union[str, os.PathLike], ttl: float = 600) -> None:
+        super().__init__(ttl)
+        self.directory = os.path.expanduser(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _get(self, key: str) -> Optional[dict]:
+        try:
+            with open(self._path(key)) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get("expires_at", 0) < time.time():
+            return None
+        return entry.get("value")
+
+    def _set(self, key: str, value: dict) -> None:
+        path = self._path(key)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump({"expires_at": time.time() + self.ttl, "value": value}, f)
+            # replacing the file in one step keeps readers from seeing a partial response
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.info(f"Could not write metadata cache entry {path}: {e}")
+
+    def clear(self) -> None:
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
@@ -0,0 +1,597 @@
+import random
+import re
+import socketserver
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Optional
+from urllib.parse import parse_qs
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+from xml.etree.ElementTree import Element, SubElement, tostring
+
+from tableauserverclient.helpers.logging import logger
+
+NAMESPACE = "http://tableau.com/api"
+
+_SITE_ROLES = ("Creator", "Explorer", "ExplorerCanPublish", "SiteAdministratorCreator", "Viewer")
+_JOB_TYPES = ("refresh_extracts", "single_subscription_notify", "publish_workbook", "run_flow")
+_STATUS = {
+    200: "OK",
+    204: "No Content",
+    400: "Bad Request",
+    401: "Unauthorized",
+    403: "Forbidden",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+}
+
+
+def _timestamp(value: datetime) -> str:
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class _Response(Exception):
+    # raised by handlers to answer with an error, and used to carry normal answers
+    def __init__(self, status: int, body: bytes = b"", content_type: str = "text/xml", headers=None) -> None:
+        self.status = status
+        self.body = body
+        self.content_type = content_type
+        self.headers = headers or []
+
+
+def _error(status: int, code: str, summary: str, detail: str) -> _Response:
+    root = Element("tsResponse", xmlns=NAMESPACE)
+    error = SubElement(root, "error", code=code)
+    SubElement(error, "summary").text = summary
+    SubElement(error, "detail").text = detail
+    return _Response(status, tostring(root))
+
+
+def _split_terms(value: str) -> list[str]:
+    # commas separate terms, except inside the brackets of an "in" list
+    return [term for term in re.split(r",(?![^\[]*\])", value) if term]
+
+
+def _compare(left: Any, right: str) -> tuple[Any, Any]:
+    try:
+        return float(left), float(right)
+    except (TypeError, ValueError):
+        return str(left), right
+
+
+_OPERATORS: dict[str, Callable[[Any, str], bool]] = {
+    "eq": lambda value, operand: operand in value if isinstance(value, list) else str(value) == operand,
+    "in": lambda value, operand: str(value) in operand.strip("[]").split(","),
+    "has": lambda value, operand: operand in value if isinstance(value, list) else operand in str(value),
+    "gt": lambda value, operand: (lambda a, b: a > b)(*_compare(value, operand)),
+    "gte": lambda value, operand: (lambda a, b: a >= b)(*_compare(value, operand)),
+    "lt": lambda value, operand: (lambda a, b: a < b)(*_compare(value, operand)),
+    "lte": lambda value, operand: (lambda a, b: a <= b)(*_compare(value, operand)),
+}
+
+
+def _field(record: dict[str, Any], name: str) -> Any:
+    # filter fields are either attributes of the element or names of related items, kept with a leading underscore
+    if name in record:
+        return record[name]
+    if f"_{name}" in record:
+        return record[f"_{name}"]
+    if name == "tags":
+        return record.get("_tags", [])
+    raise _error(400, "400065", "Bad Request", f"The field '{name}' is not a valid filter or sort field.")
+
+
+class _ThreadingWSGIServer(socketserver.ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        logger.debug(f"Mock server: {format % args}")
+
+
+class MockTableauServer:
+    """
+    A local stand-in for the Tableau REST API with generated content, for
+    load and scale testing of client code without a real server.
+
+    The server is a WSGI application. `serve` runs it on a local port in a
+    background thread, answering requests concurrently, and returns the
+    address to pass to `Server`. Each site is filled with `users` users,
+    `workbooks` workbooks with `views_per_workbook` views each, five
+    projects and `jobs` finished background jobs, all generated from `seed`
+    so that every run sees the same content.
+
+    Supported calls: server info, sign in and sign out, sites, and for each
+    site the lists and single items of users, projects, workbooks and views,
+    workbook views and content, view data as CSV, background jobs, extract
+    refreshes, publishing workbooks in one request or through chunked file
+    uploads, and cancelling jobs. Lists honour pageSize and pageNumber, the
+    eq, in, has, gt, gte, lt and lte filter operators and sorting by any
+    attribute. Jobs started by a refresh or a publish with asJob run for
+    `job_duration` seconds, reporting progress until they complete.
+
+    Every request waits `latency` seconds. A share of requests given by
+    `throttle_rate` is refused with 429 Too Many Requests and a Retry-After
+    header, and a share given by `error_rate` fails with 500 Internal Server
+    Error. Sign in accepts any credentials.
+
+    Parameters
+    ----------
+    sites : int, default 1
+        The number of sites. The first is the default site.
+
+    users, workbooks, views_per_workbook, jobs : int
+        The amount of content generated on each site.
+
+    latency : float, default 0
+        Seconds each request waits before it is answered.
+
+    error_rate, throttle_rate : float, default 0
+        The share of requests, between 0 and 1, answered with a 500 or a 429.
+
+    job_duration : float, default 1
+        Seconds a job started through the server takes to complete.
+
+    content_size_kb : int, optional
+        The size in KiB of every workbook's content. By default workbooks
+        are between 1 and 500 KiB.
+
+    version : str, default "3.24"
+        The REST API version reported by server info.
+
+    seed : int, default 0
+        Seeds the generated content and the injected errors.
+
+    Examples
+    --------
+    >>> with TSC.MockTableauServer(users=50000, latency=0.05, throttle_rate=0.01) as mock:
+    >>>     server = TSC.Server(mock.address, use_server_version=True)
+    >>>     server.auth.sign_in(TSC.TableauAuth("admin", "password"))
+    >>>     users = list(TSC.Pager(server.users))
+    """
+
+    def __init__(
+        self,
+        sites: int = 1,
+        users: int = 100,
+        workbooks: int = 100,
+        views_per_workbook: int = 3,
+        jobs: int = 10,
+        latency: float = 0,
+        error_rate: float = 0,
+        throttle_rate: float = 0,
+        job_duration: float = 1,
+        content_size_kb: Optional[int] = None,
+        version: str = "3.24",
+        seed: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.job_duration = job_duration
+        self.content_size_kb = content_size_kb
+        self.version = version
+        self.requests = 0
+        self.injected_errors = 0
+        self.address: Optional[str] = None
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens: dict[str, str] = {}
+        self._uploads: dict[str, int] = {}
+        self._httpd: Optional[WSGIServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+        self.sites: list[dict[str, Any]] = []
+        # the users, projects, workbooks and views, and the jobs, of each site by site ID
+        self._collections: dict[str, dict[str, list[dict[str, Any]]]] = {}
+        self._jobs: dict[str, dict[str, dict[str, Any]]] = {}
+        for index in range(sites):
+            self._generate_site(index, users, workbooks, views_per_workbook, jobs)
+
+    def __repr__(self):
+        return f"<MockTableauServer address={self.address} sites={len(self.sites)} requests={self.requests}>"
+
+    def __enter__(self):
+        self.serve()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Starts answering requests in a background thread and returns the server address."""
+        self._httpd = make_server(host, port, self, server_class=_ThreadingWSGIServer, handler_class=_QuietHandler)
+        self.address = f"http://{host}:{self._httpd.server_port}"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="MockTableauServer", daemon=True)
+        self._thread.start()
+        logger.info(f"Mock Tableau server listening on {self.address}")
+        return self.address
+
+    def shutdown(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    # generated content
+
+    def _uuid(self) -> str:
+        return str(uuid.UUID(int=self._random.getrandbits(128), version=4))
+
+    def _date(self) -> str:
+        start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        return _timestamp(start + timedelta(seconds=self._random.randrange(4 * 365 * 24 * 3600)))
+
+    def _generate_site(self, index: int, users: int, workbooks: int, views_per_workbook: int, jobs: int):
+        content_url = f"site{index}" if index else ""
+        site = {"id": self._uuid(), "name": f"Site {index}" if index else "Default", "contentUrl": content_url}
+        collections: dict[str, list[dict[str, Any]]] = {}
+        collections["users"] = [
+            {
+                "id": self._uuid(),
+                "name": f"user{number}",
+                "fullName": f"User {number}",
+                "email": f"user{number}@example.com",
+                "siteRole": self._random.choice(_SITE_ROLES),
+                "lastLogin": self._date(),
+            }
+            for number in range(users)
+        ]
+        collections["projects"] = [
+            {"id": self._uuid(), "name": name, "description": "", "contentPermissions": "ManagedByOwner"}
+            for name in ("default", "Finance", "Sales", "Operations", "Marketing")
+        ]
+        collections["workbooks"] = []
+        collections["views"] = []
+        for number in range(workbooks):
+            workbook = self._new_workbook(site, collections, f"Workbook {number}", None)
+            for sheet in range(views_per_workbook):
+                self._new_view(collections, workbook, f"Sheet {sheet}")
+        self.sites.append(site)
+        self._collections[site["id"]] = collections
+        self._jobs[site["id"]] = {}
+        for _ in range(jobs):
+            created = self._date()
+            job: dict[str, Any] = {"id": self._uuid(), "type": self._random.choice(_JOB_TYPES), "createdAt": created}
+            job.update({"started": 0.0, "finishCode": "0", "completedAt": created})
+            self._jobs[site["id"]][job["id"]] = job
+
+    def _owner(self, collections) -> dict[str, Any]:
+        if collections["users"]:
+            return self._random.choice(collections["users"])
+        return {"id": self._uuid(), "name": "admin"}
+
+    def _new_workbook(self, site, collections, name: str, project_id: Optional[str]) -> dict[str, Any]:
+        projects = collections["projects"]
+        project = next((p for p in projects if p["id"] == project_id), None) or self._random.choice(projects)
+        owner = self._owner(collections)
+        content_url = re.sub(r"\W", "", name)
+        created = self._date()
+        workbook = {
+            "id": self._uuid(),
+            "name": name,
+            "contentUrl": content_url,
+            "webpageUrl": f"{self.address or 'http://localhost'}/#/site/{site['contentUrl']}/workbooks/{content_url}",
+            "showTabs": "true",
+            "size": str(self.content_size_kb or self._random.randint(1, 500)),
+            "createdAt": created,
+            "updatedAt": created,
+            "_project": project,
+            "_owner": owner,
+            "_projectName": project["name"],
+            "_ownerName": owner["name"],
+            "_tags": self._random.sample(["finance", "sales", "certified", "draft"], k=self._random.randint(0, 2)),
+        }
+        collections["workbooks"].append(workbook)
+        return workbook
+
+    def _new_view(self, collections, workbook: dict[str, Any], name: str) -> dict[str, Any]:
+        view = {
+            "id": self._uuid(),
+            "name": name,
+            "contentUrl": f"{workbook['contentUrl']}/sheets/{re.sub(r'[^0-9A-Za-z]', '', name)}",
+            "createdAt": workbook["createdAt"],
+            "updatedAt": workbook["updatedAt"],
+            "sheetType": "view",
+            "_workbook": workbook,
+            "_project": workbook["_project"],
+            "_owner": workbook["_owner"],
+            "_workbookName": workbook["name"],
+            "_projectName": workbook["_projectName"],
+            "_ownerName": workbook["_ownerName"],
+            "_tags": [],
+        }
+        collections["views"].append(view)
+        return view
+
+    def _new_job(self, site, job_type: str, workbook: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+        job_id = str(uuid.uuid4())
+        job = {
+            "id": job_id,
+            "type": job_type,
+            "createdAt": _timestamp(datetime.now(timezone.utc)),
+            "started": time.monotonic(),
+            "_workbook": workbook,
+        }
+        with self._lock:
+            self._jobs[site["id"]][job_id] = job
+        return job
+
+    # WSGI
+
+    def __call__(self, environ, start_response):
+        try:
+            response = self._respond(environ)
+        except _Response as answer:
+            response = answer
+        except Exception as e:
+            logger.debug(f"Mock server failed to answer: {e!r}")
+            response = _error(500, "500000", "Internal Server Error", str(e))
+        headers = [("Content-Type", response.content_type), ("Content-Length", str(len(response.body)))]
+        start_response(f"{response.status} {_STATUS.get(response.status, '')}", headers + response.headers)
+        return [response.body]
+
+    def _respond(self, environ) -> _Response:
+        with self._lock:
+            self.requests += 1
+            roll = self._random.random()
+        if self.latency:
+            time.sleep(self.latency)
+        if roll < self.throttle_rate:
+            self._count_error()
+            error = _error(429, "429000", "Too Many Requests", "The request rate limit was exceeded.")
+            error.headers = [("Retry-After", "1")]
+            raise error
+        if roll < self.throttle_rate + self.error_rate:
+            self._count_error()
+            raise _Response(500, b"Injected server error", "text/plain")
+
+        method = environ["REQUEST_METHOD"]
+        match = re.fullmatch(r"/api/[^/]+/(.+?)/?", environ.get("PATH_INFO", ""))
+        if match is None:
+            raise _error(404, "404000", "Resource Not Found", "Unknown resource.")
+        path = match.group(1)
+        query = {key: values[-1] for key, values in parse_qs(environ.get("QUERY_STRING", "")).items()}
+        length = int(environ.get("CONTENT_LENGTH") or 0)
+        body = environ["wsgi.input"].read(length) if length else b""
+
+        if path == "serverInfo":
+            return self._server_info()
+        if path == "auth/signin" and method == "POST":
+            return self._sign_in(body)
+        if path == "auth/signout" and method == "POST":
+            with self._lock:
+                self._tokens.pop(environ.get("HTTP_X_TABLEAU_AUTH", ""), None)
+            return _Response(204)
+
+        site_id = self._authenticate(environ)
+        if path == "sites" and method == "GET":
+            return self._list("sites", "site", self.sites, query)
+        parts = path.split("/")
+        if parts[0] != "sites" or len(parts) < 2:
+            raise _error(404, "404000", "Resource Not Found", f"Unknown resource {path}.")
+        site = self._site(parts[1], site_id)
+        if len(parts) == 2:
+            return self._item("site", site)
+        return self._site_request(method, site, parts[2:], query, body)
+
+    def _count_error(self) -> None:
+        with self._lock:
+            self.injected_errors += 1
+
+    def _authenticate(self, environ) -> str:
+        with self._lock:
+            site_id = self._tokens.get(environ.get("HTTP_X_TABLEAU_AUTH", ""))
+        if site_id is None:
+            raise _error(401, "401002", "Unauthorized Access", "Invalid authentication credentials were provided.")
+        return site_id
+
+    def _site(self, site_id: str, signed_in_site_id: str) -> dict[str, Any]:
+        if site_id != signed_in_site_id:
+            raise _error(403, "403069", "Forbidden", "The site in the URL is not the site signed in to.")
+        return next(site for site in self.sites if site["id"] == site_id)
+
+    def _site_request(self, method: str, site, parts: list[str], query: dict[str, str], body: bytes) -> _Response:
+        collections = self._collections[site["id"]]
+        resource = parts[0]
+
+        if resource == "fileUploads":
+            return self._upload(method, parts, body)
+        if resource == "jobs":
+            return self._job_request(method, site, parts, query)
+        if resource not in collections:
+            raise _error(404, "404000", "Resource Not Found", f"Unknown resource {resource}.")
+        singular = resource[:-1]
+
+        if len(parts) == 1:
+            if method == "GET":
+                return self._list(resource, singular, collections[resource], query)
+            if method == "POST" and resource == "workbooks":
+                return self._publish(site, query, body)
+            raise _error(405, "405000", "Method Not Allowed", f"{method} is not supported on {resource}.")
+
+        item = next((record for record in collections[resource] if record["id"] == parts[1]), None)
+        if item is None:
+            raise _error(404, "404000", "Resource Not Found", f"No {singular} with the ID {parts[1]}.")
+        action = "/".join(parts[2:])
+        if method == "GET" and not action:
+            return self._item(singular, item)
+        if method == "GET" and resource == "workbooks" and action == "views":
+            views = [view for view in collections["views"] if view["_workbook"] is item]
+            return self._list("views", "view", views, query)
+        if method == "GET" and resource == "workbooks" and action == "content":
+            disposition = f'name="tableau_workbook"; filename="{item["contentUrl"]}.twbx"'
+            content = bytes(int(item["size"]) * 1024)
+            return _Response(200, content, "application/octet-stream", [("Content-Disposition", disposition)])
+        if method == "GET" and resource == "views" and action == "data":
+            rows = "".join(f"Region {row % 4},{row},{row * 1.5}\n" for row in range(100))
+            return _Response(200, f"Region,Orders,Sales\n{rows}".encode(), "text/csv")
+        if method == "POST" and resource == "workbooks" and action == "refresh":
+            job = self._new_job(site, "RefreshExtract", item)
+            return self._job(site, job)
+        raise _error(405, "405000", "Method Not Allowed", f"{method} is not supported on {resource}/{action}.")
+
+    # answers
+
+    def _document(self) -> Element:
+        return Element("tsResponse", xmlns=NAMESPACE)
+
+    def _element(self, parent: Element, tag: str, record: dict[str, Any]) -> Element:
+        element = SubElement(parent, tag, {k: v for k, v in record.items() if not k.startswith("_")})
+        for related in ("project", "owner", "workbook"):
+            if (value := record.get(f"_{related}")) is not None:
+                SubElement(element, related, id=value["id"], name=value["name"])
+        if "_tags" in record:
+            tags = SubElement(element, "tags")
+            for label in record["_tags"]:
+                SubElement(tags, "tag", label=label)
+        return element
+
+    def _item(self, tag: str, record: dict[str, Any]) -> _Response:
+        root = self._document()
+        self._element(root, tag, record)
+        return _Response(200, tostring(root))
+
+    def _list(self, plural: str, singular: str, records: list[dict[str, Any]], query: dict[str, str]) -> _Response:
+        records = self._filter(records, query.get("filter", ""))
+        for term in reversed(_split_terms(query.get("sort", ""))):
+            name, _, direction = term.partition(":")
+            records = sorted(records, key=lambda record: str(_field(record, name)), reverse=direction == "desc")
+
+        page_size = min(int(query.get("pageSize", 100)), 1000)
+        page_number = int(query.get("pageNumber", 1))
+        if page_size < 1 or page_number < 1:
+            raise _error(400, "400006", "Bad Request", "pageSize and pageNumber must be positive.")
+        page = records[(page_number - 1) * page_size : page_number * page_size]
+
+        root = self._document()
+        pagination = {"pageNumber": str(page_number), "pageSize": str(page_size), "totalAvailable": str(len(records))}
+        SubElement(root, "pagination", pagination)
+        container = SubElement(root, plural)
+        for record in page:
+            self._element(container, singular, record)
+        return _Response(200, tostring(root))
+
+    def _filter(self, records: list[dict[str, Any]], expression: str) -> list[dict[str, Any]]:
+        for term in _split_terms(expression):
+            try:
+                name, operator, operand = term.split(":", 2)
+                test = _OPERATORS[operator]
+            except (ValueError, KeyError):
+                raise _error(400, "400065", "Bad Request", f"The filter expression '{term}' is not valid.")
+            records = [record for record in records if test(_field(record, name), operand)]
+        return records
+
+    def _server_info(self) -> _Response:
+        root = self._document()
+        info = SubElement(root, "serverInfo")
+        SubElement(info, "productVersion", build="20242.0.0000.0000").text = "2024.2.0"
+        SubElement(info, "restApiVersion").text = self.version
+        return _Response(200, tostring(root))
+
+    def _sign_in(self, body: bytes) -> _Response:
+        match = re.search(rb'<site[^>]*contentUrl="([^"]*)"', body)
+        content_url = match.group(1).decode() if match else ""
+        site = next((site for site in self.sites if site["contentUrl"] == content_url), None)
+        if site is None:
+            raise _error(401, "401001", "Signin Error", f"There is no site with the content URL '{content_url}'.")
+        token = uuid.uuid4().hex
+        with self._lock:
+            self._tokens[token] = site["id"]
+        root = self._document()
+        credentials = SubElement(root, "credentials", token=token)
+        SubElement(credentials, "site", id=site["id"], contentUrl=site["contentUrl"])
+        users = self._collections[site["id"]]["users"]
+        SubElement(credentials, "user", id=users[0]["id"] if users else self._uuid())
+        return _Response(200, tostring(root))
+
+    def _upload(self, method: str, parts: list[str], body: bytes) -> _Response:
+        with self._lock:
+            if method == "POST" and len(parts) == 1:
+                upload_id = uuid.uuid4().hex
+                self._uploads[upload_id] = 0
+            elif method == "PUT" and len(parts) == 2 and parts[1] in self._uploads:
+                upload_id = parts[1]
+                self._uploads[upload_id] += len(body)
+            else:
+                raise _error(404, "404000", "Resource Not Found", "Unknown upload session.")
+            size = self._uploads[upload_id]
+        root = self._document()
+        SubElement(root, "fileUpload", uploadSessionId=upload_id, fileSize=str(size // (1024 * 1024)))
+        return _Response(200, tostring(root))
+
+    def _publish(self, site, query: dict[str, str], body: bytes) -> _Response:
+        upload_id = query.get("uploadSessionId")
+        if upload_id is not None:
+            with self._lock:
+                if self._uploads.pop(upload_id, None) is None:
+                    raise _error(404, "404000", "Resource Not Found", f"No upload session {upload_id}.")
+        name = re.search(rb'<workbook[^>]*\sname="([^"]*)"', body)
+        project = re.search(rb'<project[^>]*\sid="([^"]*)"', body)
+        if name is None:
+            raise _error(400, "400000", "Bad Request", "The publish request has no workbook name.")
+        collections = self._collections[site["id"]]
+        with self._lock:
+            workbook = self._new_workbook(
+                site, collections, name.group(1).decode(), project.group(1).decode() if project else None
+            )
+            self._new_view(collections, workbook, "Sheet 1")
+        if query.get("asJob") == "true":
+            return self._job(site, self._new_job(site, "PublishWorkbook", workbook))
+        return self._item("workbook", workbook)
+
+    def _job_request(self, method: str, site, parts: list[str], query: dict[str, str]) -> _Response:
+        if len(parts) == 1 and method == "GET":
+            with self._lock:
+                background = [self._background_job(job) for job in self._jobs[site["id"]].values()]
+            return self._list("backgroundJobs", "backgroundJob", background, query)
+        with self._lock:
+            job = self._jobs[site["id"]].get(parts[1]) if len(parts) == 2 else None
+            if job is None:
+                raise _error(404, "404000", "Resource Not Found", "Unknown job.")
+            if method == "PUT" and self._state(job)[1] is None:
+                job["finishCode"] = "2"
+                job["completedAt"] = _timestamp(datetime.now(timezone.utc))
+        return self._job(site, job)
+
+    def _state(self, job: dict[str, Any]) -> tuple[int, Optional[str]]:
+        # returns the progress and the finish code, which is None while the job runs;
+        # must be called with self._lock held, as it completes jobs that ran long enough
+        if "finishCode" in job:
+            return 100, job["finishCode"]
+        progress = (time.monotonic() - job["started"]) / self.job_duration if self.job_duration > 0 else 1
+        if progress >= 1:
+            job["finishCode"] = "0"
+            job["completedAt"] = _timestamp(datetime.now(timezone.utc))
+            return 100, "0"
+        return int(progress * 100), None
+
+    def _job(self, site, job: dict[str, Any]) -> _Response:
+        with self._lock:
+            progress, finish_code = self._state(job)
+        record = {"id": job["id"], "mode": "Asynchronous", "type": job["type"], "createdAt": job["createdAt"]}
+        record["progress"] = str(progress)
+        if finish_code is not None:
+            record.update({"finishCode": finish_code, "completedAt": job["completedAt"]})
+        root = self._document()
+        element = self._element(root, "job", record)
+        if job.get("_workbook") is not None:
+            details = SubElement(element, "extractRefreshJob")
+            SubElement(details, "workbook", id=job["_workbook"]["id"], name=job["_workbook"]["name"])
+        return _Response(200, tostring(root))
+
+    def _background_job(self, job: dict[str, Any]) -> dict[str, Any]:
+        # called with self._lock held
+        progress, finish_code = self._state(job)
+        status = {None: "InProgress", "0": "Success", "1": "Failed", "2": "Cancelled"}[finish_code]
+        record = {"id": job["id"], "status": status, "createdAt": job["createdAt"], "jobType": job["type"]}
+        if finish_code is not None:
+            record["endedAt"] = job["completedAt"]
+        return record
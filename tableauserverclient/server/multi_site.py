@@ -0,0 +1,223 @@
+import copy
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TYPE_CHECKING, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from tableauserverclient.config import MAX_PAGE_SIZE
+from tableauserverclient.helpers.logging import logger
+from tableauserverclient.models import Credentials, SiteItem
+from tableauserverclient.server.endpoint.exceptions import FailedSignInError
+from tableauserverclient.server.pager import Pager
+from tableauserverclient.server.request_options import RequestOptions
+
+if TYPE_CHECKING:
+    from tableauserverclient.server.server import Server
+
+
+class SiteResult:
+    """
+    The outcome of running a function against one site. `value` is what the
+    function returned, or None if it failed, in which case `error` holds the
+    exception raised. `attempts` counts the sign ins made for the site.
+    """
+
+    def __init__(self, site: SiteItem) -> None:
+        self.site = site
+        self.value: Any = None
+        self.error: Optional[Exception] = None
+        self.seconds = 0.0
+        self.attempts = 0
+
+    def __repr__(self):
+        return f"<SiteResult site={self.site.content_url} succeeded={self.succeeded} seconds={self.seconds:.2f}>"
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+class MultiSiteResults:
+    """The results of a MultiSiteExecutor run, in the order the sites were given."""
+
+    def __init__(self, results: list[SiteResult], seconds: float) -> None:
+        self.results = results
+        self.seconds = seconds
+
+    def __repr__(self):
+        return f"<MultiSiteResults sites={len(self.results)} failed={len(self.failed)} seconds={self.seconds:.2f}>"
+
+    def __iter__(self):
+        return iter(self.results)
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    @property
+    def succeeded(self) -> list[SiteResult]:
+        return [result for result in self.results if result.succeeded]
+
+    @property
+    def failed(self) -> list[SiteResult]:
+        return [result for result in self.results if not result.succeeded]
+
+    @property
+    def values(self) -> dict[str, Any]:
+        """The value returned for each site that succeeded, keyed by content URL."""
+        return {result.site.content_url: result.value for result in self.succeeded}
+
+
+class MultiSiteExecutor:
+    """
+    Runs a function against many sites at once, each with its own signed in
+    Server object, instead of switching one Server from site to site.
+
+    Each site is signed in to separately with credentials for that site, the
+    function is called with the site's Server and SiteItem, and the session is
+    signed out afterwards. At most `max_workers` sites are signed in at a
+    time. The sessions share one connection pool, so connections to the
+    server are reused across sites. If the function fails because the session
+    expired, the site is signed in to again and the function is run again, up
+    to `retries` times, so it should be safe to repeat.
+
+    Sites are listed with Sites.get on the given server, which must be signed
+    in as a server administrator, unless the sites are passed to `map`.
+
+    Parameters
+    ----------
+    server : Server
+        The Server object used to list sites. Its address, version and HTTP
+        options are copied to the per-site servers.
+
+    credentials : Credentials | Callable[[SiteItem], Credentials]
+        The credentials to sign in with. A credentials object is copied for
+        each site with its `site_id` set to the site's content URL. A function
+        is called with each site and returns its credentials. Personal access
+        tokens can only have one session at a time, so give each site its own
+        token, or use another kind of credentials, when running sites at once.
+
+    max_workers : int, default 4
+        The number of sites processed at the same time.
+
+    retries : int, default 1
+        The number of times a site is signed in to again after its session
+        expires.
+
+    Examples
+    --------
+    >>> def count_workbooks(site_server, site):
+    ...     return len(list(TSC.Pager(site_server.workbooks)))
+    >>> executor = TSC.MultiSiteExecutor(server, TSC.TableauAuth("admin", "password"), max_workers=8)
+    >>> results = executor.map(count_workbooks)
+    >>> results.values
+    {'': 12, 'finance': 48, ...}
+    """
+
+    def __init__(
+        self,
+        server: "Server",
+        credentials: Union[Credentials, Callable[[SiteItem], Credentials]],
+        max_workers: int = 4,
+        retries: int = 1,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        self.parent_srv = server
+        self.credentials = credentials
+        self.max_workers = max_workers
+        self.retries = retries
+        # the connection pool shared by the sessions of every site
+        self._adapter = HTTPAdapter(pool_maxsize=max_workers)
+
+    def __repr__(self):
+        return f"<MultiSiteExecutor server={self.parent_srv.server_address} max_workers={self.max_workers}>"
+
+    def sites(self) -> list[SiteItem]:
+        """Lists every site on the server."""
+        return list(Pager(self.parent_srv.sites, RequestOptions(pagesize=MAX_PAGE_SIZE)))
+
+    def _session(self) -> requests.Session:
+        session = self.parent_srv._session_factory()
+        session.mount("http://", self._adapter)
+        session.mount("https://", self._adapter)
+        return session
+
+    def _credentials_for(self, site: SiteItem) -> Credentials:
+        if isinstance(self.credentials, Credentials):
+            credentials = copy.copy(self.credentials)
+            credentials.site_id = site.content_url or ""
+            return credentials
+        return self.credentials(site)
+
+    def site_server(self, site: SiteItem) -> "Server":
+        """Returns a new Server object signed in to the site."""
+        server = type(self.parent_srv)(self.parent_srv.server_address, session_factory=self._session)
+        server.version = self.parent_srv.version
+        if self.parent_srv.http_options:
+            server.add_http_options(self.parent_srv.http_options)
+        server.auth.sign_in(self._credentials_for(site))
+        return server
+
+    def _run_site(self, fn: Callable[["Server", SiteItem], Any], site: SiteItem) -> SiteResult:
+        result = SiteResult(site)
+        started = time.perf_counter()
+        while True:
+            result.attempts += 1
+            server = None
+            try:
+                server = self.site_server(site)
+                result.value = fn(server, site)
+                result.error = None
+                break
+            except FailedSignInError as e:
+                # a 401 after signing in means the session expired while the function ran
+                result.error = e
+                if server is None or result.attempts > self.retries:
+                    break
+                logger.info(f"Session for site {site.content_url} expired, signing in again")
+            except Exception as e:
+                result.error = e
+                break
+            finally:
+                if server is not None and server.is_signed_in():
+                    try:
+                        server.auth.sign_out()
+                    except Exception as e:
+                        logger.debug(f"Could not sign out of site {site.content_url}: {e}")
+        result.seconds = time.perf_counter() - started
+        if result.error is not None:
+            logger.info(f"Failed on site {site.content_url}: {result.error}")
+        return result
+
+    def map(
+        self, fn: Callable[["Server", SiteItem], Any], sites: Optional[Iterable[SiteItem]] = None
+    ) -> MultiSiteResults:
+        """
+        Calls `fn(site_server, site)` for every site and collects what it
+        returns. An exception raised for one site is recorded in its result
+        and does not stop the others.
+
+        Parameters
+        ----------
+        fn : Callable[[Server, SiteItem], Any]
+            The function to run for each site.
+
+        sites : Iterable[SiteItem], optional
+            The sites to run it for. Every site on the server by default.
+
+        Returns
+        -------
+        MultiSiteResults
+        """
+        site_list = list(sites) if sites is not None else self.sites()
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(lambda site: self._run_site(fn, site), site_list))
+        multi_site_results = MultiSiteResults(results, time.perf_counter() - started)
+        logger.info(
+            f"Ran on {len(multi_site_results.succeeded)} of {len(results)} sites in {multi_site_results.seconds:.1f}s"
+        )
+        return multi_site_results
@@ -73,11 +73,19 @@ class Pager(Iterable[T]):
 
         self._options = request_opts or RequestOptions()
 
+    def _fetch_page(self, options: RequestOptions) -> tuple[list[T], PaginationItem]:
+        # page fetches are counted separately when the endpoint's server is being profiled
+        endpoint = getattr(self._endpoint.func, "__self__", None)
+        profiler = getattr(getattr(endpoint, "parent_srv", None), "profiler", None)
+        if profiler is None:
+            return self._endpoint(options)
+        return profiler.page(type(endpoint).__name__, partial(self._endpoint, options))
+
     def __iter__(self) -> Iterator[T]:
         options = copy.deepcopy(self._options)
         while True:
             # Fetch the first page
-            current_item_list, pagination_item = self._endpoint(options)
+            current_item_list, pagination_item = self._fetch_page(options)
 
             if pagination_item.total_available is None:
                 # This endpoint does not support pagination, drain the list and return
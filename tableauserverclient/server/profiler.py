@@ -0,0 +1,243 @@
+import threading
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from time import perf_counter
+from typing import Any, Callable, Optional
+
+# the profiler and label of the endpoint call running in this thread, if it is being profiled
+_current: ContextVar[Optional[tuple["Profiler", str]]] = ContextVar("tsc_profile", default=None)
+# set while a timed parse or request builder runs, so that the calls it makes are not counted twice
+_timing: ContextVar[bool] = ContextVar("tsc_profile_timing", default=False)
+
+_instrument_lock = threading.Lock()
+# the number of open profilers, and the methods replaced while there are any
+_open_profilers = 0
+_originals: list[tuple[type, str, Any]] = []
+
+_COLUMNS = (
+    ("calls", "calls", "{:d}"),
+    ("requests", "requests", "{:d}"),
+    ("wall", "wall s", "{:.3f}"),
+    ("server_wait", "server s", "{:.3f}"),
+    ("bytes_sent", "sent KiB", "{:.1f}"),
+    ("bytes_received", "recv KiB", "{:.1f}"),
+    ("parse", "parse s", "{:.3f}"),
+    ("build", "build s", "{:.3f}"),
+    ("objects", "objects", "{:d}"),
+)
+
+
+def _count(result: Any) -> int:
+    # from_response returns a list of items, a tuple starting with one, or a single item
+    if result is None:
+        return 0
+    if isinstance(result, tuple) and result and isinstance(result[0], list):
+        return len(result[0])
+    if isinstance(result, list):
+        return len(result)
+    return 1
+
+
+def _timed(kind: str, func: Callable, counts_objects: bool = False) -> Callable:
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        active = _current.get()
+        if active is None or _timing.get():
+            return func(*args, **kwargs)
+        token = _timing.set(True)
+        started = perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            _timing.reset(token)
+        profiler, label = active
+        objects = _count(result) if counts_objects else 0
+        profiler._add(label, **{kind: perf_counter() - started, "objects": objects})
+        return result
+
+    return wrapper
+
+
+def _replace(owner: type, name: str, method: Any) -> None:
+    _originals.append((owner, name, owner.__dict__[name]))
+    setattr(owner, name, method)
+
+
+def _instrument() -> None:
+    # Wraps the model parsers and the request builders when the first open profiler is
+    # created. The wrappers only time calls made inside a profiled endpoint call.
+    global _open_profilers
+    with _instrument_lock:
+        _open_profilers += 1
+        if _open_profilers > 1:
+            return
+        from tableauserverclient import models
+        from tableauserverclient.models import PaginationItem
+        from tableauserverclient.server.request_factory import RequestFactory
+
+        for name in dir(models):
+            cls = getattr(models, name)
+            if not isinstance(cls, type) or not cls.__module__.startswith("tableauserverclient."):
+                continue
+            method = cls.__dict__.get("from_response")
+            # the pagination block of a page is not one of the objects it returns
+            counts_objects = cls is not PaginationItem
+            if isinstance(method, (classmethod, staticmethod)):
+                _replace(cls, "from_response", type(method)(_timed("parse", method.__func__, counts_objects)))
+            elif callable(method):
+                _replace(cls, "from_response", _timed("parse", method, counts_objects))
+
+        builders = {type(member) for member in vars(RequestFactory).values()}
+        for builder in (cls for cls in builders if cls.__module__ == RequestFactory.__module__):
+            for name, method in list(vars(builder).items()):
+                if name.endswith("_req") and callable(method):
+                    _replace(builder, name, _timed("build", method))
+
+
+def _uninstrument() -> None:
+    # Restores the wrapped methods when the last open profiler is closed.
+    global _open_profilers
+    with _instrument_lock:
+        _open_profilers -= 1
+        if _open_profilers > 0:
+            return
+        while _originals:
+            owner, name, method = _originals.pop()
+            setattr(owner, name, method)
+
+
+class EndpointProfile:
+    """The time, traffic and objects attributed to one endpoint method."""
+
+    def __init__(self, label: str) -> None:
+        self.label = label
+        self.calls = 0
+        self.requests = 0
+        self.wall = 0.0
+        self.server_wait = 0.0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.parse = 0.0
+        self.build = 0.0
+        self.objects = 0
+
+    def __repr__(self):
+        return f"<EndpointProfile {self.label} calls={self.calls} wall={self.wall:.3f}s objects={self.objects}>"
+
+    def to_dict(self) -> dict[str, Any]:
+        return {column: getattr(self, column) for column, _, _ in _COLUMNS}
+
+
+class Profiler:
+    """
+    Attributes the time a script spends in the library to the endpoint
+    methods it calls, as a lighter alternative to cProfile.
+
+    For each endpoint method, such as `Workbooks.get`, the profiler counts
+    the calls and their wall time, and for the requests they make, the time
+    spent waiting for the server to answer and the bytes sent and received.
+    It also measures the time spent parsing responses with the models'
+    `from_response`, the number of objects those calls returned, and the
+    time spent building requests with `RequestFactory`. Each page fetched by
+    a Pager is counted under `Pager[<endpoint>]`.
+
+    Time is attributed to the innermost endpoint method, and the wall time
+    of a method includes the methods it calls. Work done outside an endpoint
+    method, for example on a thread the method started, is not counted.
+
+    Profile a whole script with `Server(profile=True)`, which logs the
+    report when the server signs out, is discarded or the interpreter exits,
+    or part of it with `server.profile()`.
+    While a profiler is open, the models' `from_response` and the
+    `RequestFactory` builders are wrapped to time them; the wrappers do
+    nothing outside a profiled call, and the original methods are restored
+    when the last open profiler is closed or collected. Close a profiler you
+    create directly with `close()`.
+
+    Examples
+    --------
+    >>> with server.profile() as profiler:
+    >>>     workbooks = list(TSC.Pager(server.workbooks))
+    >>> print(profiler.report())
+    """
+
+    def __init__(self) -> None:
+        _instrument()
+        self.profiles: dict[str, EndpointProfile] = {}
+        self._lock = threading.Lock()
+        # a profiler that is never closed releases the wrappers when it is collected
+        self._finalizer = weakref.finalize(self, _uninstrument)
+
+    def __repr__(self):
+        return f"<Profiler endpoints={len(self.profiles)} closed={self.closed}>"
+
+    @property
+    def closed(self) -> bool:
+        return not self._finalizer.alive
+
+    def close(self) -> None:
+        """Stops timing parsers and request builders for this profiler. The measurements are kept."""
+        self._finalizer()
+
+    def _add(self, label: str, **amounts: float) -> None:
+        with self._lock:
+            profile = self.profiles.get(label)
+            if profile is None:
+                profile = self.profiles[label] = EndpointProfile(label)
+            for name, amount in amounts.items():
+                setattr(profile, name, getattr(profile, name) + amount)
+
+    @contextmanager
+    def call(self, label: str):
+        """Attributes the work done inside the block to `label`."""
+        token = _current.set((self, label))
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            _current.reset(token)
+            self._add(label, calls=1, wall=perf_counter() - started)
+
+    def page(self, label: str, fetch: Callable[[], tuple[list, Any]]) -> tuple[list, Any]:
+        started = perf_counter()
+        result = fetch()
+        self._add(f"Pager[{label}]", calls=1, wall=perf_counter() - started, objects=_count(result))
+        return result
+
+    def add_request(self, fallback_label: str, wall: float, server_wait: float, sent: int, received: int) -> None:
+        # requests made inside a profiled call are already part of its wall time
+        active = _current.get()
+        inside = active is not None and active[0] is self
+        label = active[1] if active is not None and inside else fallback_label
+        self._add(
+            label,
+            requests=1,
+            wall=0 if inside else wall,
+            server_wait=server_wait,
+            bytes_sent=sent,
+            bytes_received=received,
+        )
+
+    def results(self) -> dict[str, dict[str, Any]]:
+        """Returns the measurements for each endpoint method."""
+        with self._lock:
+            return {label: profile.to_dict() for label, profile in self.profiles.items()}
+
+    def report(self) -> str:
+        """Returns the measurements as a table, slowest endpoint method first."""
+        results = sorted(self.results().items(), key=lambda item: item[1]["wall"], reverse=True)
+        width = max([len("endpoint")] + [len(label) for label, _ in results])
+        lines = ["  ".join([f"{'endpoint':<{width}}"] + [f"{title:>9}" for _, title, _ in _COLUMNS])]
+        for label, values in results:
+            cells = []
+            for column, _, template in _COLUMNS:
+                value = values[column] / 1024 if column.startswith("bytes") else values[column]
+                cells.append(f"{template.format(value):>9}")
+            lines.append("  ".join([f"{label:<{width}}"] + cells))
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.profiles.clear()
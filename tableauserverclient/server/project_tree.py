@@ -0,0 +1,260 @@
+import copy
+import datetime
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Optional, TYPE_CHECKING, TypeVar, Union
+
+from tableauserverclient.datetime_helpers import format_datetime
+from tableauserverclient.config import MAX_PAGE_SIZE
+from tableauserverclient.helpers.logging import logger
+from tableauserverclient.models import ProjectItem
+from tableauserverclient.server.filter import Filter
+from tableauserverclient.server.pager import Endpoint, Pager
+from tableauserverclient.server.request_options import RequestOptions
+from tableauserverclient.server.resolver import NAMES_PER_REQUEST
+
+if TYPE_CHECKING:
+    from tableauserverclient.server.server import Server
+
+T = TypeVar("T")
+
+PATH_SEPARATOR = "/"
+
+
+class ProjectTree:
+    """
+    An in-memory index of the project hierarchy of a site. The index is built
+    from a single paged sweep of the Projects endpoint and answers lookups by
+    ID and by full path, such as "Finance/Reporting/Monthly", without any
+    further requests, as well as child, descendant and ancestor queries.
+
+    `refresh` only requests the projects updated since the last refresh, so
+    keeping the index current is cheap. Projects deleted on the server are
+    only removed by a full refresh.
+
+    Parameters
+    ----------
+    server : Server
+        A signed in Server object.
+
+    Examples
+    --------
+    >>> tree = TSC.ProjectTree(server).refresh()
+    >>> monthly = tree.get_by_path("Finance/Reporting/Monthly")
+    >>> for workbook in tree.iter_content(server.workbooks, monthly):
+    >>>     print(workbook.name)
+    """
+
+    def __init__(self, server: "Server") -> None:
+        self.parent_srv = server
+        self._projects: dict[str, ProjectItem] = {}
+        self._children: dict[Optional[str], set[str]] = {}
+        self._paths: dict[str, str] = {}
+        # the IDs of the projects at each path, keyed by the names along the path and by the
+        # joined path, which projects with "/" in their names can make ambiguous
+        self._ids_by_names: dict[tuple[str, ...], list[str]] = {}
+        self._ids_by_path: dict[str, list[str]] = {}
+        self.last_updated_at: Optional[datetime.datetime] = None
+
+    def __repr__(self):
+        return f"<ProjectTree projects={len(self)} last_updated_at={self.last_updated_at}>"
+
+    def __len__(self) -> int:
+        return len(self._projects)
+
+    def __contains__(self, project: Union[ProjectItem, str]) -> bool:
+        return self._id_of(project) in self._projects
+
+    def __iter__(self) -> Iterator[ProjectItem]:
+        return iter(self._projects.values())
+
+    def refresh(self, full: bool = False) -> "ProjectTree":
+        """
+        Loads the projects from the server. The first refresh, and any refresh
+        with `full` set, reloads every project. Otherwise only the projects
+        updated since the most recent `updated_at` seen are requested.
+
+        Returns
+        -------
+        ProjectTree
+            The tree itself, so that it can be built in one expression.
+        """
+        options = RequestOptions(pagesize=MAX_PAGE_SIZE)
+        incremental = not full and self.last_updated_at is not None
+        if incremental:
+            since = format_datetime(self.last_updated_at)
+            options.filter.add(
+                Filter(RequestOptions.Field.UpdatedAt, RequestOptions.Operator.GreaterThanOrEqual, since)
+            )
+        else:
+            self._projects = {}
+
+        projects = list(Pager(self.parent_srv.projects, options))
+        for project in projects:
+            if project.id is not None:
+                self._projects[project.id] = project
+            if project.updated_at is not None and (
+                self.last_updated_at is None or project.updated_at > self.last_updated_at
+            ):
+                self.last_updated_at = project.updated_at
+        self._reindex()
+        logger.info(f"{'Updated' if incremental else 'Loaded'} {len(projects)} projects in the project tree")
+        return self
+
+    def _reindex(self) -> None:
+        self._children = {}
+        for project_id, project in self._projects.items():
+            self._children.setdefault(project.parent_id, set()).add(project_id)
+
+        self._paths = {}
+        self._ids_by_names = {}
+        self._ids_by_path = {}
+        top: tuple[str, ...] = ()
+        stack = [(project_id, top) for project_id in self._children.get(None, ())]
+        # projects whose parent is not in the tree are treated as top level
+        stack.extend(
+            (project_id, top)
+            for parent_id, children in self._children.items()
+            if parent_id is not None and parent_id not in self._projects
+            for project_id in children
+        )
+        while stack:
+            project_id, parent_names = stack.pop()
+            names = (*parent_names, self._projects[project_id].name or "")
+            path = PATH_SEPARATOR.join(names)
+            self._paths[project_id] = path
+            self._ids_by_names.setdefault(names, []).append(project_id)
+            self._ids_by_path.setdefault(path, []).append(project_id)
+            stack.extend((child_id, names) for child_id in self._children.get(project_id, ()))
+
+    @staticmethod
+    def _id_of(project: Union[ProjectItem, str, None]) -> Optional[str]:
+        return project.id if isinstance(project, ProjectItem) else project
+
+    def _require(self, project: Union[ProjectItem, str]) -> str:
+        project_id = self._id_of(project)
+        if project_id not in self._projects:
+            raise KeyError(f"Project {project_id} is not in the project tree.")
+        return project_id
+
+    def get(self, project_id: str) -> Optional[ProjectItem]:
+        return self._projects.get(project_id)
+
+    def get_by_path(self, path: Union[str, Sequence[str]]) -> Optional[ProjectItem]:
+        """
+        Returns the project at a path of project names, given either as a
+        string separated by "/" or as a sequence of names. Use a sequence when
+        project names contain "/". Raises ValueError when more than one
+        project is at the path.
+        """
+        if isinstance(path, str):
+            project_ids = self._ids_by_path.get(path.strip(PATH_SEPARATOR), [])
+        else:
+            project_ids = self._ids_by_names.get(tuple(path), [])
+        if len(project_ids) > 1:
+            raise ValueError(f"{len(project_ids)} projects are at the path {path}. Pass the names as a sequence.")
+        return self._projects[project_ids[0]] if project_ids else None
+
+    def path(self, project: Union[ProjectItem, str]) -> str:
+        return self._paths[self._require(project)]
+
+    def parent(self, project: Union[ProjectItem, str]) -> Optional[ProjectItem]:
+        return self._projects.get(self._projects[self._require(project)].parent_id or "")
+
+    def roots(self) -> list[ProjectItem]:
+        return [project for project in self._projects.values() if self.parent(project) is None]
+
+    def children(self, project: Union[ProjectItem, str]) -> list[ProjectItem]:
+        return [self._projects[child_id] for child_id in self._children.get(self._require(project), ())]
+
+    def ancestors(self, project: Union[ProjectItem, str]) -> list[ProjectItem]:
+        """Returns the ancestors of a project, starting with its parent."""
+        ancestors: list[ProjectItem] = []
+        current = self.parent(project)
+        while current is not None and len(ancestors) <= len(self._projects):
+            ancestors.append(current)
+            current = self.parent(current)
+        return ancestors
+
+    def descendants(self, project: Union[ProjectItem, str], include_self: bool = False) -> list[ProjectItem]:
+        """Returns all projects nested under a project, at any depth."""
+        project_id = self._require(project)
+        descendants = [self._projects[project_id]] if include_self else []
+        stack = list(self._children.get(project_id, ()))
+        while stack:
+            child_id = stack.pop()
+            descendants.append(self._projects[child_id])
+            stack.extend(self._children.get(child_id, ()))
+        return descendants
+
+    def iter_content(
+        self,
+        endpoint: Endpoint[T],
+        project: Union[ProjectItem, str],
+        include_descendants: bool = True,
+        req_options: Optional[RequestOptions] = None,
+    ) -> Iterator[T]:
+        """
+        Lists the workbooks, data sources, flows or other content in a project
+        and, by default, in all of its nested projects.
+
+        Content can only be filtered by project name on the server, so the
+        listing requests the names of every project in the subtree with
+        `projectName:in` filters of up to NAMES_PER_REQUEST names each, and
+        then drops the items that belong to other projects with the same
+        names. Names with commas or quotes cannot be part of an `in` filter
+        and are listed on their own. Sorting in `req_options` applies within
+        each of these listings.
+
+        Parameters
+        ----------
+        endpoint : Endpoint
+            The endpoint to list, for example server.workbooks.
+
+        project : ProjectItem | str
+            The project, or its ID, at the root of the subtree.
+
+        include_descendants : bool, default True
+            If False, only the content directly in the project is listed.
+
+        req_options : RequestOptions, optional
+            Additional filters, sorting and page size for the listing.
+
+        Yields
+        ------
+        The content items in the subtree.
+        """
+        projects = (
+            self.descendants(project, include_self=True)
+            if include_descendants
+            else [self._projects[self._require(project)]]
+        )
+        project_ids = {p.id for p in projects}
+        names = sorted({p.name for p in projects if p.name})
+
+        # commas separate the values of an in filter and quotes are dropped from them,
+        # so those names are listed on their own, as NameResolver does
+        unsafe = [name for name in names if any(c in name for c in ",'\"")]
+        batchable = [name for name in names if name not in unsafe]
+        name_filters = [
+            (
+                Filter(RequestOptions.Field.ProjectName, RequestOptions.Operator.In, batch)
+                if len(batch) > 1
+                else Filter(RequestOptions.Field.ProjectName, RequestOptions.Operator.Equals, batch[0])
+            )
+            for batch in (batchable[i : i + NAMES_PER_REQUEST] for i in range(0, len(batchable), NAMES_PER_REQUEST))
+        ]
+        name_filters += [
+            Filter(RequestOptions.Field.ProjectName, RequestOptions.Operator.Equals, name) for name in unsafe
+        ]
+
+        for name_filter in name_filters:
+            options = copy.deepcopy(req_options) if req_options is not None else RequestOptions(pagesize=MAX_PAGE_SIZE)
+            options.filter.add(name_filter)
+            for item in Pager(endpoint, options):
+                if getattr(item, "project_id", None) in project_ids:
+                    yield item
+
+    def filter_content(self, items: Iterable[T], project: Union[ProjectItem, str]) -> Iterator[T]:
+        """Yields the items from an existing listing that are in the subtree of a project."""
+        project_ids = {p.id for p in self.descendants(project, include_self=True)}
+        return (item for item in items if getattr(item, "project_id", None) in project_ids)
@@ -67,6 +67,9 @@ class QuerySet(Iterable[T], Sized):
         self.request_options = RequestOptions(pagesize=page_size or config.PAGE_SIZE)
         self._result_cache: list[T] = []
         self._pagination_item = PaginationItem()
+        self._prefetch: tuple[str, ...] = ()
+        self._prefetch_workers = 8
+        self._page_prefetched = False
 
     def __iter__(self: Self) -> Iterator[T]:
         # Not built to be re-entrant. Starts back at page 1, and empties
@@ -88,6 +91,7 @@ class QuerySet(Iterable[T], Sized):
                     raise StopIteration
             if len(self._result_cache) == 0:
                 return
+            self._prefetch_page()
             yield from self._result_cache
             # If the length of the QuerySet is unknown, continue fetching until
             # the result cache is empty.
@@ -130,6 +134,7 @@ class QuerySet(Iterable[T], Sized):
             # Fetch items from cache if present, otherwise, recursively fetch.
             k_range = range(start, stop, step)
             if all(i in page_range for i in k_range):
+                self._prefetch_page()
                 return self._result_cache[k]
             return [self[i] for i in k_range]
 
@@ -138,6 +143,7 @@ class QuerySet(Iterable[T], Sized):
 
         if k in page_range:
             # Fetch item from cache if present
+            self._prefetch_page()
             return self._result_cache[k % size]
         elif k in range(self.total_available):
             # Otherwise, check if k is even sensible to return
@@ -161,6 +167,14 @@ class QuerySet(Iterable[T], Sized):
             else:
                 self._result_cache = response
                 self._pagination_item = PaginationItem()
+            self._page_prefetched = False
+
+    def _prefetch_page(self: Self) -> None:
+        # Done when items are handed out rather than in _fetch_all, so that
+        # fetching a page only to read its pagination makes no extra requests.
+        if self._prefetch and not self._page_prefetched:
+            self.model.prefetch(self._result_cache, *self._prefetch, max_workers=self._prefetch_workers)
+            self._page_prefetched = True
 
     def __len__(self: Self) -> int:
         return sys.maxsize if self.total_available is None else self.total_available
@@ -201,6 +215,20 @@ class QuerySet(Iterable[T], Sized):
             self.request_options.sort.add(Sort(field_name, direction))
         return self
 
+    def prefetch(self: Self, *related: str, max_workers: int = 8) -> Self:
+        """
+        Populates the named related resources of each page of items as soon
+        as the page is fetched, with the requests for the page run
+        concurrently. See QuerysetEndpoint.prefetch.
+
+        >>> for workbook in server.workbooks.all().prefetch("views", "connections"):
+        ...     print(workbook.name, len(workbook.connections))
+        """
+        self.model.check_prefetch(related)
+        self._prefetch += tuple(related)
+        self._prefetch_workers = max_workers
+        return self
+
     def paginate(self: Self, **kwargs) -> Self:
         if "page_number" in kwargs:
             self.request_options.pagenumber = kwargs["page_number"]
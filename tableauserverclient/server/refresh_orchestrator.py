@@ -0,0 +1,278 @@
+import heapq
+import itertools
+import json
+import os
+import time
+from collections.abc import Iterable
+from typing import Optional, TYPE_CHECKING, Union
+
+import requests
+
+from tableauserverclient.exponential_backoff import ExponentialBackoffTimer
+from tableauserverclient.helpers.logging import logger
+from tableauserverclient.models import DatasourceItem, JobItem, WorkbookItem
+from tableauserverclient.server.endpoint.exceptions import (
+    InternalServerError,
+    MissingRequiredFieldError,
+    ServerResponseError,
+)
+
+if TYPE_CHECKING:
+    from tableauserverclient.server.server import Server
+
+RefreshableItem = Union[DatasourceItem, WorkbookItem]
+
+DEFAULT_REFRESH_PRIORITY = 50
+
+
+class RefreshHistory:
+    """
+    Keeps the most recent refresh durations (in seconds) for each content item
+    so that a RefreshOrchestrator can start the longest refreshes first. The
+    history can be saved to and loaded from a JSON file to carry it between runs.
+
+    Parameters
+    ----------
+    max_samples : int, default 10
+        The number of durations kept per item. Older durations are discarded.
+    """
+
+    def __init__(self, max_samples: int = 10) -> None:
+        self.max_samples = max_samples
+        self._durations: dict[str, list[float]] = {}
+
+    def __repr__(self):
+        return f"<RefreshHistory items={len(self._durations)} max_samples={self.max_samples}>"
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._durations
+
+    def record(self, item_id: str, duration: float) -> None:
+        samples = self._durations.setdefault(item_id, [])
+        samples.append(duration)
+        del samples[: -self.max_samples]
+
+    def durations(self, item_id: str) -> list[float]:
+        return list(self._durations.get(item_id, []))
+
+    def expected_duration(self, item_id: str) -> Optional[float]:
+        samples = self._durations.get(item_id)
+        if not samples:
+            return None
+        return sum(samples) / len(samples)
+
+    def to_dict(self) -> dict[str, list[float]]:
+        return {item_id: list(samples) for item_id, samples in self._durations.items()}
+
+    @classmethod
+    def from_dict(cls, durations: dict[str, list[float]], max_samples: int = 10) -> "RefreshHistory":
+        history = cls(max_samples=max_samples)
+        for item_id, samples in durations.items():
+            for duration in samples:
+                history.record(item_id, float(duration))
+        return history
+
+    def save(self, filepath: Union[str, os.PathLike]) -> None:
+        with open(filepath, "w") as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, filepath: Union[str, os.PathLike], max_samples: int = 10) -> "RefreshHistory":
+        if not os.path.isfile(filepath):
+            return cls(max_samples=max_samples)
+        with open(filepath) as f:
+            return cls.from_dict(json.load(f), max_samples=max_samples)
+
+
+class RefreshResult:
+    """
+    The outcome of a single extract refresh submitted by a RefreshOrchestrator.
+
+    `job` is the final state of the refresh job, or None if the refresh could
+    not be submitted, in which case `error` holds the exception raised. If the
+    job could not be polled `max_poll_errors` times in a row, `job` is its last
+    known state and `error` holds the last polling error.
+    `duration` is the backgrounder run time in seconds when the server reports
+    start and completion times, otherwise the wall-clock time since submission.
+    """
+
+    def __init__(self, item: RefreshableItem, incremental: bool, priority: int) -> None:
+        self.item = item
+        self.item_id: str = item.id or ""
+        self.incremental = incremental
+        self.priority = priority
+        self.job: Optional[JobItem] = None
+        self.error: Optional[Exception] = None
+        self.duration: Optional[float] = None
+        self.submitted_at: Optional[float] = None
+        self.poll_errors = 0
+
+    def __repr__(self):
+        return (
+            f"<RefreshResult item={self.item.id} incremental={self.incremental} "
+            f"succeeded={self.succeeded} duration={self.duration}>"
+        )
+
+    @property
+    def succeeded(self) -> bool:
+        return self.job is not None and self.job.finish_code == JobItem.FinishCode.Success
+
+
+class RefreshOrchestrator:
+    """
+    Runs extract refreshes for many workbooks and data sources while keeping a
+    bounded number of refresh jobs in flight on the server.
+
+    Items are admitted in priority order (lower values first, matching the
+    priority of Tableau extract refresh tasks). Among items with the same
+    priority, the items with the longest expected duration according to the
+    refresh history are started first, so the long refreshes do not end up
+    running alone at the end of the batch. Items without any history are
+    treated as the longest. Whenever a job completes, as reported by the Jobs
+    endpoint, its duration is recorded and the next item is admitted.
+
+    Parameters
+    ----------
+    server : Server
+        A signed in Server object.
+
+    max_concurrent_jobs : int, default 4
+        The maximum number of refresh jobs in flight at any time.
+
+    history : RefreshHistory, optional
+        Duration history used for scheduling. It is updated as jobs complete.
+
+    max_poll_errors : int, default 5
+        The number of consecutive failures to get a job's status after which
+        the job is given up on. Other jobs keep being polled, but no more
+        refreshes are started, as the job may still be running on the server
+        and starting another could exceed max_concurrent_jobs. The items that
+        were not started stay queued for a later call to run.
+
+    Examples
+    --------
+    >>> orchestrator = TSC.RefreshOrchestrator(server, max_concurrent_jobs=8)
+    >>> for datasource in TSC.Pager(server.datasources):
+    >>>     orchestrator.add(datasource, incremental=True)
+    >>> results = orchestrator.run()
+    """
+
+    def __init__(
+        self,
+        server: "Server",
+        max_concurrent_jobs: int = 4,
+        history: Optional[RefreshHistory] = None,
+        max_poll_errors: int = 5,
+    ) -> None:
+        if max_concurrent_jobs < 1:
+            raise ValueError("max_concurrent_jobs must be at least 1.")
+        if max_poll_errors < 1:
+            raise ValueError("max_poll_errors must be at least 1.")
+        self.parent_srv = server
+        self.max_concurrent_jobs = max_concurrent_jobs
+        self.history = history if history is not None else RefreshHistory()
+        self.max_poll_errors = max_poll_errors
+        self._queue: list[tuple[int, float, int, RefreshResult]] = []
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def add(self, item: RefreshableItem, priority: int = DEFAULT_REFRESH_PRIORITY, incremental: bool = False) -> None:
+        if not isinstance(item, (DatasourceItem, WorkbookItem)):
+            raise TypeError("Only workbooks and data sources can be refreshed.")
+        if not item.id:
+            error = "Item missing ID. Item must be retrieved from server first."
+            raise MissingRequiredFieldError(error)
+        expected = self.history.expected_duration(item.id)
+        longest_first = -expected if expected is not None else float("-inf")
+        result = RefreshResult(item, incremental, priority)
+        heapq.heappush(self._queue, (priority, longest_first, next(self._counter), result))
+
+    def add_all(
+        self, items: Iterable[RefreshableItem], priority: int = DEFAULT_REFRESH_PRIORITY, incremental: bool = False
+    ) -> None:
+        for item in items:
+            self.add(item, priority=priority, incremental=incremental)
+
+    def run(self, timeout: Optional[float] = None) -> list[RefreshResult]:
+        """
+        Submits every queued refresh and waits for all of them to complete.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum time in seconds to wait for a single job to complete
+            after the last time a job finished. Raises TimeoutError when exceeded.
+
+        Returns
+        -------
+        list[RefreshResult]
+            One result per item taken from the queue, in the order the
+            refreshes were started.
+        """
+        results: list[RefreshResult] = []
+        in_flight: dict[str, RefreshResult] = {}
+        backoff = ExponentialBackoffTimer(timeout=timeout)
+        # set when a job is given up on, as it may still hold a slot on the server
+        admitting = True
+
+        while (self._queue and admitting) or in_flight:
+            while self._queue and admitting and len(in_flight) < self.max_concurrent_jobs:
+                result = heapq.heappop(self._queue)[-1]
+                results.append(result)
+                self._submit(result)
+                if result.job is not None:
+                    in_flight[result.job.id] = result
+
+            if not in_flight:
+                continue
+
+            backoff.sleep()
+            for job_id, result in list(in_flight.items()):
+                try:
+                    job = self.parent_srv.jobs.get_by_id(job_id)
+                except (ServerResponseError, InternalServerError, requests.exceptions.RequestException) as e:
+                    # retried on the next tick, which the backoff spaces out further
+                    result.poll_errors += 1
+                    logger.debug(f"Could not get status of job {job_id} ({result.poll_errors}): {e}")
+                    if result.poll_errors >= self.max_poll_errors:
+                        logger.info(f"Giving up on refresh job {job_id} for {result.item.id}: {e}")
+                        result.error = e
+                        del in_flight[job_id]
+                        if admitting and self._queue:
+                            logger.info(f"Not starting the {len(self._queue)} queued refreshes")
+                        admitting = False
+                    continue
+                result.poll_errors = 0
+                if job.completed_at is None:
+                    continue
+                del in_flight[job_id]
+                self._complete(result, job)
+                # a slot opened up, so poll quickly again once the next job is admitted
+                backoff = ExponentialBackoffTimer(timeout=timeout)
+
+        return results
+
+    def _submit(self, result: RefreshResult) -> None:
+        item = result.item
+        endpoint = self.parent_srv.datasources if isinstance(item, DatasourceItem) else self.parent_srv.workbooks
+        result.submitted_at = time.time()
+        try:
+            job = endpoint.refresh(item, incremental=result.incremental)
+        except (ServerResponseError, InternalServerError) as e:
+            logger.info(f"Could not start refresh for {item.id}: {e}")
+            result.error = e
+            return
+        logger.debug(f"Started refresh job {job.id} for {item.id}")
+        result.job = job
+
+    def _complete(self, result: RefreshResult, job: JobItem) -> None:
+        result.job = job
+        if job.started_at is not None and job.completed_at is not None:
+            result.duration = (job.completed_at - job.started_at).total_seconds()
+        else:
+            result.duration = time.time() - (result.submitted_at or time.time())
+        if job.finish_code == JobItem.FinishCode.Success:
+            self.history.record(result.item_id, result.duration)
+        logger.info(f"Refresh job {job.id} for {result.item.id} finished with code {job.finish_code}")
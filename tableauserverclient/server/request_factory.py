@@ -1,11 +1,13 @@
+import shutil
+import tempfile
 import xml.etree.ElementTree as ET
-from typing import Any, Callable, Optional, TypeVar, TYPE_CHECKING, Union
+from typing import Any, Callable, IO, Optional, TypeVar, TYPE_CHECKING, Union
 from collections.abc import Iterable
 
 from typing_extensions import ParamSpec
 
 from requests.packages.urllib3.fields import RequestField
-from requests.packages.urllib3.filepost import encode_multipart_formdata
+from requests.packages.urllib3.filepost import choose_boundary, encode_multipart_formdata
 from typing_extensions import Concatenate
 
 from tableauserverclient.models import *
@@ -27,6 +29,30 @@ def _add_multipart(parts: dict) -> tuple[Any, str]:
     return xml_request, content_type
 
 
+def _stream_multipart(parts: dict) -> tuple[IO[bytes], str]:
+    # Like _add_multipart, but writes the body to a temporary file instead of memory. The data of
+    # a part may be a file object, which is copied in chunks. The caller closes the returned file.
+    boundary = choose_boundary()
+    body = tempfile.TemporaryFile()
+    try:
+        for name, (filename, data, content_type) in parts.items():
+            multipart_part = RequestField(name=name, data=b"", filename=filename)
+            multipart_part.make_multipart(content_type=content_type)
+            body.write(f"--{boundary}\r\n".encode("latin-1"))
+            body.write(multipart_part.render_headers().encode("latin-1"))
+            if isinstance(data, bytes):
+                body.write(data)
+            else:
+                shutil.copyfileobj(data, body)
+            body.write(b"\r\n")
+        body.write(f"--{boundary}--\r\n".encode("latin-1"))
+        body.seek(0)
+    except BaseException:
+        body.close()
+        raise
+    return body, f"multipart/mixed; boundary={boundary}"
+
+
 T = TypeVar("T")
 P = ParamSpec("P")
 
@@ -931,6 +957,28 @@ class UserRequest:
             user_element.attrib["authSetting"] = user_item.auth_setting
         return ET.tostring(xml_request)
 
+    def import_from_csv_req(self, csv_file: IO[bytes], users: Iterable[UserItem]) -> tuple[IO[bytes], str]:
+        xml_request = ET.Element("tsRequest")
+        for user in users:
+            if user.name is None:
+                raise ValueError(f"{user} missing name.")
+            if not user.auth_setting:
+                # the server applies its default authentication to users not listed in the payload
+                continue
+            user_element = ET.SubElement(xml_request, "user")
+            user_element.attrib["name"] = user.name
+            user_element.attrib["authSetting"] = user.auth_setting
+
+        if not len(xml_request):
+            # the server expects a payload with every import, even without per-user settings
+            ET.SubElement(xml_request, "users")
+
+        parts: dict[str, tuple[str, Union[bytes, IO[bytes]], str]] = {
+            "tableau_user_import": ("tsc_users_file.csv", csv_file, "file"),
+            "request_payload": ("", ET.tostring(xml_request), "text/xml"),
+        }
+        return _stream_multipart(parts)
+
 
 class WorkbookRequest:
     def _generate_xml(
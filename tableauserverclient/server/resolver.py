@@ -0,0 +1,203 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Optional, TYPE_CHECKING
+
+from tableauserverclient.config import MAX_PAGE_SIZE
+from tableauserverclient.helpers.logging import logger
+from tableauserverclient.server.endpoint.exceptions import ServerResponseError
+from tableauserverclient.server.filter import Filter
+from tableauserverclient.server.pager import Pager
+from tableauserverclient.server.request_options import RequestOptions
+
+if TYPE_CHECKING:
+    from tableauserverclient.server.server import Server
+
+# the number of names sent in a single name:in filter, which keeps the URL short
+NAMES_PER_REQUEST = 100
+
+
+class NameResolver:
+    """
+    Resolves the names of users, groups, projects and sites to their IDs and
+    caches the results, so that scripts that look up the same names many times
+    make one request at most per name.
+
+    Entries expire after `ttl` seconds and the least recently used entries are
+    evicted once the cache holds `max_size` names. Users, groups and projects
+    are looked up in batches with a single `name:in` filter per request; sites
+    are looked up one at a time with Sites.get_by_name. `warm` loads every name
+    of a kind from a full listing. Entries are scoped to the signed in site and
+    are dropped when the library creates, renames or deletes the item.
+
+    A server object creates its resolver on construction, available as
+    `server.resolver`.
+
+    Parameters
+    ----------
+    server : Server
+        The Server object used to look up names.
+
+    ttl : float, default 300
+        The number of seconds a resolved name is kept.
+
+    max_size : int, default 10000
+        The maximum number of names kept.
+
+    Examples
+    --------
+    >>> user_ids = server.resolver.resolve_many("users", ["alice", "bob"])
+    >>> project_id = server.resolver.resolve("projects", "Finance")
+    """
+
+    KINDS = ("users", "groups", "projects", "sites")
+
+    def __init__(self, server: "Server", ttl: float = 300, max_size: int = 10000) -> None:
+        self.parent_srv = server
+        self.ttl = ttl
+        self.max_size = max_size
+        self._cache: OrderedDict[tuple[str, str, str], tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"<NameResolver entries={len(self)} ttl={self.ttl} max_size={self.max_size}>"
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def _key(self, kind: str, name: str) -> tuple[str, str, str]:
+        if kind not in self.KINDS:
+            raise ValueError(f"Cannot resolve {kind} names. Expected one of {', '.join(self.KINDS)}.")
+        # sites are looked up across the server, everything else within the signed in site
+        scope = "" if kind == "sites" else self.parent_srv.site_id
+        # the name filter of the server ignores case, so the cache does too
+        return scope, kind, name.casefold()
+
+    def _get(self, kind: str, name: str) -> Optional[str]:
+        key = self._key(kind, name)
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            item_id, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return item_id
+
+    def store(self, kind: str, name: Optional[str], item_id: Optional[str]) -> None:
+        """Adds a name and ID to the cache, replacing any previous entry for the name."""
+        if not name or not item_id:
+            return
+        key = self._key(kind, name)
+        with self._lock:
+            self._cache[key] = (item_id, time.monotonic() + self.ttl)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+    def invalidate(self, kind: str, item_id: Optional[str] = None, name: Optional[str] = None) -> None:
+        """Drops the entries for an item ID and/or a name."""
+        if name is not None:
+            with self._lock:
+                self._cache.pop(self._key(kind, name), None)
+        if item_id is not None:
+            with self._lock:
+                for key in [k for k, (cached_id, _) in self._cache.items() if k[1] == kind and cached_id == item_id]:
+                    del self._cache[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def resolve(self, kind: str, name: str) -> str:
+        """
+        Returns the ID of the user, group, project or site with the given name.
+
+        Raises
+        ------
+        ValueError
+            If no item has the name, or several projects share it.
+        """
+        resolved = self.resolve_many(kind, [name])
+        if name not in resolved:
+            raise ValueError(f"No single {kind[:-1]} found with the name {name}.")
+        return resolved[name]
+
+    def resolve_many(self, kind: str, names: Iterable[str]) -> dict[str, str]:
+        """
+        Returns a dictionary of name to ID for all the names that exist. Names
+        that are not cached are looked up with as few requests as possible.
+        Names that match nothing are left out of the result.
+        """
+        resolved: dict[str, str] = {}
+        missing: list[str] = []
+        for name in dict.fromkeys(names):
+            item_id = self._get(kind, name)
+            if item_id is None:
+                missing.append(name)
+            else:
+                resolved[name] = item_id
+
+        if missing and kind == "sites":
+            for name in missing:
+                self._load_site(name)
+        elif missing:
+            # commas separate the values of an in filter and quotes are dropped from them,
+            # so those names are looked up on their own
+            unsafe = [name for name in missing if any(c in name for c in ",'\"")]
+            batchable = [name for name in missing if name not in unsafe]
+            for start in range(0, len(batchable), NAMES_PER_REQUEST):
+                names_batch = batchable[start : start + NAMES_PER_REQUEST]
+                operator = RequestOptions.Operator.In if len(names_batch) > 1 else RequestOptions.Operator.Equals
+                self._load(
+                    kind,
+                    Filter(
+                        RequestOptions.Field.Name, operator, names_batch if len(names_batch) > 1 else names_batch[0]
+                    ),
+                )
+            for name in unsafe:
+                self._load(kind, Filter(RequestOptions.Field.Name, RequestOptions.Operator.Equals, name))
+
+        for name in missing:
+            if (item_id := self._get(kind, name)) is not None:
+                resolved[name] = item_id
+        return resolved
+
+    def warm(self, kind: str) -> int:
+        """Loads every name of a kind from a full listing. Returns the number of names loaded."""
+        self._key(kind, "")
+        if kind == "sites":
+            count = 0
+            for site in Pager(self.parent_srv.sites):
+                self.store(kind, site.name, site.id)
+                count += 1
+            return count
+        return self._load(kind, None)
+
+    def _load(self, kind: str, name_filter: Optional[Filter]) -> int:
+        options = RequestOptions(pagesize=MAX_PAGE_SIZE)
+        if name_filter is not None:
+            options.filter.add(name_filter)
+        ids_by_name: dict[str, list[str]] = {}
+        for item in Pager(getattr(self.parent_srv, kind), options):
+            ids_by_name.setdefault(item.name.casefold(), []).append(item.id)
+        for name, ids in ids_by_name.items():
+            if len(ids) > 1:
+                # project names are only unique among siblings; see ProjectTree to resolve paths
+                logger.info(f"{len(ids)} {kind} share the name {name}, it will not be resolved")
+                self.invalidate(kind, name=name)
+                continue
+            self.store(kind, name, ids[0])
+        logger.debug(f"Resolved {len(ids_by_name)} {kind} names")
+        return len(ids_by_name)
+
+    def _load_site(self, name: str) -> None:
+        try:
+            site = self.parent_srv.sites.get_by_name(name)
+        except ServerResponseError as e:
+            logger.info(f"Could not resolve site {name}: {e}")
+            return
+        self.store("sites", site.name, site.id)
@@ -0,0 +1,322 @@
+import abc
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+from urllib.parse import urlparse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from tableauserverclient.helpers.logging import logger
+
+if TYPE_CHECKING:
+    from requests import Response
+
+
+# Reference data that rarely changes. Everything else is requested from the server every time.
+DEFAULT_TTL_POLICIES: dict[str, float] = {
+    "serverInfo": 3600,
+    "sites": 600,
+    "projects": 300,
+    "schedules": 300,
+    "groups": 300,
+}
+
+_KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+def resource_path(url: str) -> str:
+    # the path below /api/<version>/, so that entries do not depend on the REST API version used
+    path = urlparse(url).path.strip("/")
+    parts = path.split("/")
+    if len(parts) >= 2 and parts[0] == "api":
+        parts = parts[2:]
+    return "/".join(parts)
+
+
+def _scope(path: str) -> list[str]:
+    # sites/<site-id>/<resource> for site resources, <resource> for the others
+    parts = path.split("/")
+    if parts[0] == "sites" and len(parts) >= 3:
+        return parts[:3]
+    return parts[:1]
+
+
+def _digest(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()[:12]
+
+
+class ResponseCache(abc.ABC):
+    """
+    Base class for caches of REST API GET responses, for reference data such
+    as server info, sites, projects, schedules and groups that tools request
+    over and over although it rarely changes.
+
+    Assign a cache to `server.response_cache` to use it. How long a response
+    is kept depends on the resource requested, the name that follows the
+    site in the URL (for example "projects" or "groups") or follows the API
+    version for resources outside sites ("serverInfo", "sites",
+    "schedules"). Resources without a policy use `default_ttl`, and a time of
+    0 or less leaves them uncached. Streamed downloads are never cached.
+
+    When a cached response expires and the server sent an ETag or a
+    Last-Modified header with it, the next request asks the server whether
+    the resource changed, and a "304 Not Modified" answer renews the cached
+    response. Responses the server marks "Cache-Control: no-store" are not
+    kept.
+
+    Every PUT, POST, PATCH and DELETE made through the library drops the
+    cached responses for the resource it changes: a change to
+    sites/<site-id>/projects/<project-id> drops every cached projects
+    response of that site, and a change to a site drops all of its cached
+    responses. Changes made by other clients are only seen once the cached
+    responses expire.
+
+    Responses are keyed by the URL, the query parameters and the signed in
+    user, since users may see different content. `hits`, `misses` and
+    `revalidated` count the lookups.
+
+    Parameters
+    ----------
+    policies : dict[str, float], optional
+        Seconds to keep the responses of each resource. Defaults to
+        DEFAULT_TTL_POLICIES.
+
+    default_ttl : float, default 0
+        Seconds to keep the responses of resources without a policy.
+    """
+
+    def __init__(self, policies: Optional[dict[str, float]] = None, default_ttl: float = 0) -> None:
+        self.policies = dict(DEFAULT_TTL_POLICIES if policies is None else policies)
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} hits={self.hits} misses={self.misses} revalidated={self.revalidated}>"
+
+    def ttl(self, url: str) -> float:
+        scope = _scope(resource_path(url))
+        return self.policies.get(scope[-1], self.default_ttl)
+
+    @staticmethod
+    def key(url: str, params: Optional[dict] = None, user_id: Optional[str] = None) -> str:
+        payload = json.dumps({"url": url, "params": params or {}, "user": user_id}, sort_keys=True, default=str)
+        # the key starts with digests of the first part of the scope and of the whole scope,
+        # so that invalidate finds the entries of a scope from their keys alone
+        scope = _scope(resource_path(url))
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return f"{_digest(scope[0])}-{_digest('/'.join(scope))}-{digest}"
+
+    def fetch(
+        self,
+        url: str,
+        params: Optional[dict],
+        user_id: Optional[str],
+        send: Callable[[dict[str, str]], "Response"],
+    ) -> "Response":
+        """
+        Returns the cached response for the request, or the response of
+        `send`, which makes the request with the extra headers it is given.
+        """
+        ttl = self.ttl(url)
+        if ttl <= 0:
+            return send({})
+
+        key = self.key(url, params, user_id)
+        entry = self._get(key)
+        if entry is not None and entry["expires_at"] > time.time():
+            self._count("hits")
+            return _to_response(url, entry)
+
+        headers = {}
+        if entry is not None:
+            if etag := entry["headers"].get("ETag"):
+                headers["If-None-Match"] = etag
+            if last_modified := entry["headers"].get("Last-Modified"):
+                headers["If-Modified-Since"] = last_modified
+        response = send(headers)
+
+        if entry is not None and response.status_code == 304:
+            logger.debug(f"Cached response for {url} is still current")
+            self._count("revalidated")
+            entry["expires_at"] = time.time() + ttl
+            entry["headers"].update(
+                {name: response.headers[name] for name in _KEPT_HEADERS[1:] if name in response.headers}
+            )
+            self._set(key, entry)
+            return _to_response(url, entry)
+
+        self._count("misses")
+        if response.status_code == 200 and "no-store" not in response.headers.get("Cache-Control", ""):
+            self._set(
+                key,
+                {
+                    "expires_at": time.time() + ttl,
+                    "status_code": response.status_code,
+                    "headers": {name: response.headers[name] for name in _KEPT_HEADERS if name in response.headers},
+                    "content": response.content,
+                },
+            )
+        return response
+
+    def invalidate(self, url: str) -> int:
+        """Drops the cached responses for the resource at `url`. Returns the number dropped."""
+        scope = _scope(resource_path(url))
+        # a resource outside sites, or a site itself, drops every response below it
+        prefix = f"{_digest(scope[0])}-" if len(scope) == 1 else f"{_digest(scope[0])}-{_digest('/'.join(scope))}-"
+        stale = [key for key in self._keys() if key.startswith(prefix)]
+        for key in stale:
+            self._delete(key)
+        if stale:
+            logger.debug(f"Dropped {len(stale)} cached responses for {'/'.join(scope)}")
+        return len(stale)
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    @abc.abstractmethod
+    def _get(self, key: str) -> Optional[dict[str, Any]]:
+        pass
+
+    @abc.abstractmethod
+    def _set(self, key: str, entry: dict[str, Any]) -> None:
+        pass
+
+    @abc.abstractmethod
+    def _delete(self, key: str) -> None:
+        pass
+
+    @abc.abstractmethod
+    def _keys(self) -> Iterable[str]:
+        pass
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        pass
+
+
+def _to_response(url: str, entry: dict[str, Any]) -> "Response":
+    response = requests.Response()
+    response.url = url
+    response.status_code = entry["status_code"]
+    response.headers = CaseInsensitiveDict(entry["headers"])
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response._content = entry["content"]
+    return response
+
+
+class InMemoryResponseCache(ResponseCache):
+    """
+    Keeps responses in memory, evicting the least recently used response
+    once `max_size` responses are held.
+
+    >>> server.response_cache = TSC.InMemoryResponseCache(policies={"projects": 60, "groups": 60})
+    """
+
+    def __init__(
+        self, policies: Optional[dict[str, float]] = None, default_ttl: float = 0, max_size: int = 256
+    ) -> None:
+        super().__init__(policies, default_ttl)
+        self.max_size = max_size
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get(self, key: str) -> Optional[dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return dict(entry, headers=dict(entry["headers"]))
+
+    def _set(self, key: str, entry: dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def _keys(self) -> Iterable[str]:
+        with self._lock:
+            return list(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class FileResponseCache(ResponseCache):
+    """
+    Keeps responses as JSON files in a directory, so that they are shared
+    between runs and between processes. The files are readable by their
+    owner only, as they hold server content.
+
+    >>> server.response_cache = TSC.FileResponseCache("~/.cache/tsc-responses")
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, os.PathLike],
+        policies: Optional[dict[str, float]] = None,
+        default_ttl: float = 0,
+    ) -> None:
+        super().__init__(policies, default_ttl)
+        self.directory = os.path.expanduser(directory)
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _get(self, key: str) -> Optional[dict[str, Any]]:
+        try:
+            with open(self._path(key)) as f:
+                entry = json.load(f)
+            entry["content"] = base64.b64decode(entry["content"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return entry
+
+    def _set(self, key: str, entry: dict[str, Any]) -> None:
+        path = self._path(key)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump(dict(entry, content=base64.b64encode(entry["content"]).decode("ascii")), f)
+            # replacing the file in one step keeps readers from seeing a partial response
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.info(f"Could not write response cache entry {path}: {e}")
+
+    def _delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def _keys(self) -> Iterable[str]:
+        return [name[: -len(".json")] for name in os.listdir(self.directory) if name.endswith(".json")]
+
+    def clear(self) -> None:
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
@@ -1,3 +1,9 @@
+import atexit
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Optional, TYPE_CHECKING
+
 from tableauserverclient.helpers.logging import logger
 
 import requests
@@ -44,6 +50,14 @@ from tableauserverclient.server.exceptions import (
 )
 from tableauserverclient.server.endpoint.exceptions import NotSignedInError
 from tableauserverclient.namespace import Namespace
+from tableauserverclient.server.resolver import NameResolver
+from tableauserverclient.server.profiler import Profiler
+from tableauserverclient.server.response_cache import ResponseCache
+from tableauserverclient.server.session_cache import SessionCache
+from tableauserverclient.server.single_flight import SingleFlight
+
+if TYPE_CHECKING:
+    from tableauserverclient.models.tableau_auth import Credentials
 
 
 _PRODUCT_TO_REST_VERSION = {
@@ -58,6 +72,24 @@ minimum_supported_server_version = "2.3"
 default_server_version = "2.4"  # first version that dropped the legacy auth endpoint
 
 
+# the profilers of servers created with profile=True that have not been reported yet, by server address
+_exit_profilers: "weakref.WeakKeyDictionary[Profiler, str]" = weakref.WeakKeyDictionary()
+
+
+def _log_profile(server_address: str, profiler: Profiler) -> None:
+    if profiler.closed:
+        return
+    profiler.close()
+    if profiler.profiles:
+        logger.info(f"Profile of {server_address}:\n{profiler.report()}")
+
+
+@atexit.register
+def _log_exit_profiles() -> None:
+    for profiler, server_address in list(_exit_profilers.items()):
+        _log_profile(server_address, profiler)
+
+
 class Server:
     """
     In the Tableau REST API, the server (https://MY-SERVER/) is the base or core
@@ -91,6 +123,17 @@ class Server:
         and a later version of the REST API. For more information, see REST API
         Versions.
 
+    session_cache : SessionCache, optional
+        Keeps the negotiated REST API version and the session tokens between
+        runs, so that use_server_version and sign in can be skipped when a
+        valid cached value exists. See SessionCache.
+
+    profile : bool, default False
+        Measures the time, traffic and objects of each endpoint method
+        called and logs a report at the INFO level when the server signs
+        out, is discarded or the interpreter exits. See Profiler and
+        Server.profile.
+
     Examples
     --------
     >>> import tableauserverclient as TSC
@@ -121,10 +164,22 @@ class Server:
         CreateNew = "CreateNew"
         Replace = "Replace"
 
-    def __init__(self, server_address, use_server_version=False, http_options=None, session_factory=None):
+    def __init__(
+        self,
+        server_address,
+        use_server_version=False,
+        http_options=None,
+        session_factory=None,
+        session_cache=None,
+        profile=False,
+    ):
         self._auth_token = None
         self._site_id = None
         self._user_id = None
+        self.session_cache: Optional[SessionCache] = session_cache
+        # the credentials of the session kept in the session cache, used to sign in again when it expires
+        self._cached_credentials: Optional["Credentials"] = None
+        self._reauthenticate_lock = threading.Lock()
 
         # TODO: this needs to change to default to https, but without breaking existing code
         if not server_address.startswith("http://") and not server_address.startswith("https://"):
@@ -164,6 +219,22 @@ class Server:
         self.group_sets = GroupSets(self)
         self.tags = Tags(self)
         self.virtual_connections = VirtualConnections(self)
+        self.resolver = NameResolver(self)
+
+        # opt-in: identical GETs made at the same time by several threads share one request
+        self.coalesce_requests = False
+        self._single_flight = SingleFlight()
+        # opt-in cache of GET responses for reference data, see ResponseCache
+        self.response_cache: Optional[ResponseCache] = None
+        self.profiler: Optional[Profiler] = None
+        # reports the profile=True profiler when the server signs out or is discarded
+        self._profile_finalizer: Optional[weakref.finalize] = None
+        if profile:
+            profiler = self.profiler = Profiler()
+            _exit_profilers[profiler] = server_address
+            self._profile_finalizer = weakref.finalize(self, _log_profile, server_address, profiler)
+            # profilers still open when the interpreter exits are reported by _log_exit_profiles
+            self._profile_finalizer.atexit = False
 
         self._session = self._session_factory()
         self._http_options = dict()  # must set this before making a server call
@@ -209,7 +280,12 @@ class Server:
         self._user_id = None
         self._auth_token = None
         self._site_url = None
+        self._cached_credentials = None
         self._session = self._session_factory()
+        if self._profile_finalizer is not None and self._profile_finalizer.alive:
+            self._profile_finalizer()
+            if self.profiler is not None and self.profiler.closed:
+                self.profiler = None
 
     def _set_auth(self, site_id, user_id, auth_token, site_url=None):
         self._site_id = site_id
@@ -217,6 +293,22 @@ class Server:
         self._auth_token = auth_token
         self._site_url = site_url
 
+    def _reauthenticate(self, refused_token: str) -> bool:
+        # Only sessions kept in the session cache are signed in to again, as their
+        # tokens may have expired or been revoked since they were stored.
+        with self._reauthenticate_lock:
+            if self._auth_token is not None and self._auth_token != refused_token:
+                # another thread has already signed in again
+                return True
+            credentials = self._cached_credentials
+            if credentials is None or self.session_cache is None:
+                return False
+            logger.info(f"Cached session for {self.server_address} was refused, signing in again")
+            self.session_cache.invalidate_session(self.server_address, credentials)
+            self._cached_credentials = None
+            self.auth.sign_in(credentials)
+            return True
+
     def _get_legacy_version(self):
         # the serverInfo call was introduced in 2.4, earlier than that we have this different call
         response = self._session.get(self.server_address + "/auth?format=xml")
@@ -247,7 +339,33 @@ class Server:
         return version or old_version
 
     def use_server_version(self):
+        if self.session_cache is not None and (cached_version := self.session_cache.get_version(self.server_address)):
+            self.version = cached_version
+            return
+        old_version = self.version
         self.version = self._determine_highest_version()
+        # an unchanged version means the probe failed and fell back, so it is not worth keeping
+        if self.session_cache is not None and self.version != old_version:
+            self.session_cache.set_version(self.server_address, self.version)
+
+    @contextmanager
+    def profile(self):
+        """
+        Profiles the calls made inside the block and yields the Profiler, whose
+        report() breaks down the time, traffic and objects by endpoint method.
+
+        >>> with server.profile() as profiler:
+        >>>     workbooks = list(TSC.Pager(server.workbooks))
+        >>> print(profiler.report())
+        """
+        previous = self.profiler
+        profiler = self.profiler = Profiler()
+        try:
+            yield profiler
+        finally:
+            # the profiler of profile=True is closed if the server signed out inside the block
+            self.profiler = None if previous is None or previous.closed else previous
+            profiler.close()
 
     def use_highest_version(self):
         self.use_server_version()
@@ -0,0 +1,247 @@
+import hashlib
+import hmac
+import json
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+from tableauserverclient.helpers.logging import logger
+
+if TYPE_CHECKING:
+    from tableauserverclient.models.tableau_auth import Credentials
+
+
+class SessionCache:
+    """
+    Keeps the REST API version negotiated with each server and the session
+    tokens returned by sign in in a file, so that short-lived scripts can skip
+    the version probe and the sign in when a previous run left a valid
+    session behind.
+
+    Pass the cache to the Server constructor. `use_server_version` then reads
+    the version from the cache, and `Auth.sign_in` reuses a cached token for
+    the same server, credentials and site without contacting the server. A
+    cached token is not checked until it is used: if a request is refused with
+    a 401, the cached session is dropped, the client signs in again with the
+    same credentials and the request is sent once more. Signing out or
+    switching sites drops the cached session, so scripts that want to reuse a
+    session should leave it signed in.
+
+    Sessions are keyed by an HMAC of the server address and the credentials,
+    so that changed credentials never reuse an old token. The HMAC key is a
+    random value kept in a file next to the cache, readable by its owner
+    only, like the cache itself. Tokens are only written to the file when
+    `encrypt` and `decrypt` are given, for example the methods of a
+    `cryptography.fernet.Fernet` instance. Without them the cache still keeps
+    server versions in the file, but sessions are only kept in memory and are
+    shared by the servers using the same cache in one process.
+
+    Parameters
+    ----------
+    path : str | os.PathLike, default "~/.cache/tableauserverclient/sessions.json"
+        The cache file.
+
+    token_ttl : float, default 7200
+        The number of seconds a token is reused when the server does not
+        report when it expires.
+
+    encrypt : Callable[[bytes], bytes], optional
+        Encrypts the file contents before they are written.
+
+    decrypt : Callable[[bytes], bytes], optional
+        Decrypts the file contents after they are read.
+
+    Examples
+    --------
+    >>> fernet = Fernet(os.environ["TSC_CACHE_KEY"])
+    >>> cache = TSC.SessionCache(encrypt=fernet.encrypt, decrypt=fernet.decrypt)
+    >>> server = TSC.Server("https://tableau.example.com", use_server_version=True, session_cache=cache)
+    >>> server.auth.sign_in(TSC.PersonalAccessTokenAuth("ops", token, site_id="finance"))
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike] = "~/.cache/tableauserverclient/sessions.json",
+        token_ttl: float = 7200,
+        encrypt: Optional[Callable[[bytes], bytes]] = None,
+        decrypt: Optional[Callable[[bytes], bytes]] = None,
+    ) -> None:
+        if (encrypt is None) != (decrypt is None):
+            raise ValueError("encrypt and decrypt must be given together.")
+        self.path = os.path.expanduser(path)
+        self.token_ttl = token_ttl
+        self._encrypt = encrypt
+        self._decrypt = decrypt
+        self._lock = threading.Lock()
+        self._key: Optional[bytes] = None
+        # sessions of a cache without a cipher, which are never written to the file
+        self._sessions: dict[str, Any] = {}
+
+    def __repr__(self):
+        return f"<SessionCache path={self.path} encrypted={self._encrypt is not None}>"
+
+    @property
+    def key_path(self) -> str:
+        return f"{self.path}.key"
+
+    @property
+    def persists_sessions(self) -> bool:
+        return self._encrypt is not None
+
+    def _load_key(self) -> bytes:
+        # Sessions kept in memory only need a key for this process; persisted
+        # sessions need the same key in every run to be found again.
+        if not self.persists_sessions:
+            return os.urandom(32)
+        try:
+            directory = os.path.dirname(self.key_path)
+            if directory:
+                os.makedirs(directory, mode=0o700, exist_ok=True)
+            try:
+                fd = os.open(self.key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            except FileExistsError:
+                # another cache created the key first
+                with open(self.key_path, "rb") as f:
+                    key = f.read()
+                if len(key) >= 32:
+                    return key
+                raise OSError("the key file is truncated")
+            key = os.urandom(32)
+            with os.fdopen(fd, "wb") as f:
+                f.write(key)
+            return key
+        except OSError as e:
+            logger.info(f"Could not use session cache key {self.key_path}, sessions will not be reused: {e}")
+            return os.urandom(32)
+
+    def session_key(self, server_address: str, credentials: "Credentials") -> str:
+        with self._lock:
+            if self._key is None:
+                self._key = self._load_key()
+        payload = json.dumps(
+            {
+                "server": server_address.rstrip("/"),
+                "type": type(credentials).__name__,
+                "credentials": credentials.credentials,
+                "site": credentials.site_id,
+                "impersonate": credentials.user_id_to_impersonate,
+            },
+            sort_keys=True,
+        )
+        return hmac.new(self._key, payload.encode("utf-8"), hashlib.sha256).hexdigest()
+
+    def _read(self) -> dict[str, Any]:
+        try:
+            with open(self.path, "rb") as f:
+                content = f.read()
+            if self._decrypt is not None:
+                content = self._decrypt(content)
+            state = json.loads(content)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            # an unreadable cache is treated as empty rather than failing the script
+            logger.info(f"Could not read session cache {self.path}: {e}")
+            return {}
+        return state if isinstance(state, dict) else {}
+
+    def _write(self, state: dict[str, Any]) -> None:
+        content = json.dumps(state).encode("utf-8")
+        if self._encrypt is not None:
+            content = self._encrypt(content)
+        directory = os.path.dirname(self.path)
+        temp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            if directory:
+                os.makedirs(directory, mode=0o700, exist_ok=True)
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logger.info(f"Could not write session cache {self.path}: {e}")
+
+    def _update(self, section: str, key: str, value: Optional[dict[str, Any]]) -> None:
+        with self._lock:
+            if section == "sessions" and not self.persists_sessions:
+                self._sessions = self._updated(self._sessions, key, value, expire=True)
+                return
+            state = self._read()
+            entries = state.get(section, {})
+            updated = self._updated(entries, key, value, expire=section == "sessions")
+            if updated is entries and (self.persists_sessions or "sessions" not in state):
+                return
+            state[section] = updated
+            if not self.persists_sessions:
+                # drop tokens left in plain text by a cache that did not encrypt them
+                state.pop("sessions", None)
+            self._write(state)
+
+    @staticmethod
+    def _updated(entries: dict[str, Any], key: str, value: Optional[dict[str, Any]], expire: bool) -> dict[str, Any]:
+        # returns entries itself when there is nothing to change
+        if value is None and key not in entries:
+            return entries
+        entries = {k: v for k, v in entries.items() if k != key}
+        if value is not None:
+            entries[key] = value
+        if expire:
+            # expired sessions are dropped whenever the sessions are written
+            now = time.time()
+            entries = {k: v for k, v in entries.items() if isinstance(v, dict) and v.get("expires_at", 0) > now}
+        return entries
+
+    def get_version(self, server_address: str) -> Optional[str]:
+        with self._lock:
+            entry = self._read().get("versions", {}).get(server_address.rstrip("/"))
+        return entry.get("version") if isinstance(entry, dict) else None
+
+    def set_version(self, server_address: str, version: str) -> None:
+        self._update("versions", server_address.rstrip("/"), {"version": version, "updated_at": time.time()})
+
+    def get_session(self, server_address: str, credentials: "Credentials") -> Optional[dict[str, Any]]:
+        """Returns the cached site_id, user_id, site_url and token, or None if there is no unexpired session."""
+        key = self.session_key(server_address, credentials)
+        with self._lock:
+            sessions = self._read().get("sessions", {}) if self.persists_sessions else self._sessions
+            entry = sessions.get(key)
+        if not isinstance(entry, dict) or entry.get("expires_at", 0) <= time.time():
+            return None
+        return entry
+
+    def set_session(
+        self,
+        server_address: str,
+        credentials: "Credentials",
+        site_id: str,
+        user_id: str,
+        token: str,
+        site_url: Optional[str] = None,
+        expires_in: Optional[float] = None,
+    ) -> None:
+        expires_at = time.time() + (expires_in if expires_in is not None else self.token_ttl)
+        entry = {"site_id": site_id, "user_id": user_id, "token": token, "site_url": site_url, "expires_at": expires_at}
+        self._update("sessions", self.session_key(server_address, credentials), entry)
+
+    def invalidate_session(self, server_address: str, credentials: "Credentials") -> None:
+        self._update("sessions", self.session_key(server_address, credentials), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sessions = {}
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+
+
+def parse_time_to_expiration(value: Optional[str]) -> Optional[float]:
+    # estimatedTimeToExpiration is given as hours:minutes:seconds, where hours may exceed 24
+    if not value:
+        return None
+    try:
+        hours, minutes, seconds = (int(part) for part in value.split(":"))
+    except ValueError:
+        return None
+    return hours * 3600 + minutes * 60 + seconds
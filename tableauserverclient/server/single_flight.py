@@ -0,0 +1,55 @@
+import threading
+from collections.abc import Hashable
+from typing import Any, Callable, Optional
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Runs at most one call per key at a time. A caller that asks for a key
+    while a call for it is in flight waits for that call and receives its
+    result, or its exception, instead of starting another. Once the call
+    returns, the key is forgotten, so later callers start a new call.
+
+    `coalesced` counts the callers that shared another caller's call.
+    """
+
+    def __init__(self) -> None:
+        self.coalesced = 0
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"<SingleFlight in_flight={len(self._calls)} coalesced={self.coalesced}>"
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
@@ -0,0 +1,247 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from urllib.parse import unquote
+
+import requests_mock
+
+import tableauserverclient as TSC
+from tableauserverclient.server.endpoint import ExportManifest
+from tableauserverclient.server.exceptions import EndpointUnavailableError
+
+TEST_ASSET_DIR = os.path.join(os.path.dirname(__file__), "assets")
+
+POPULATE_PDF = os.path.join(TEST_ASSET_DIR, "populate_pdf.pdf")
+
+ERROR_XML = """<tsResponse xmlns="http://tableau.com/api">
+<error code="404011"><summary>Resource Not Found</summary><detail>View not found</detail></error>
+</tsResponse>"""
+
+
+CSV_HEADERS = {"Content-Type": "text/csv; charset=utf-8"}
+
+
+class StreamedBody(io.BytesIO):
+    # A response body that records whether the export file was being written before it was fully read.
+    def __init__(self, content: bytes, part_path: str) -> None:
+        super().__init__(content)
+        self.size = len(content)
+        self.part_path = part_path
+        self.written_while_reading = False
+
+    def read(self, *args, **kwargs):
+        if self.tell() < self.size and os.path.exists(self.part_path):
+            self.written_while_reading = True
+        return super().read(*args, **kwargs)
+
+
+def large_csv() -> bytes:
+    return ("Region,Sales\n" + "".join(f"Region {i},{i}\n" for i in range(50000))).encode("utf-8")
+
+
+def make_view(view_id):
+    view = TSC.ViewItem()
+    view._id = view_id
+    return view
+
+
+class BulkExportTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = TSC.Server("http://test", False)
+        self.server.version = "3.23"
+
+        # Fake sign in
+        self.server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+        self.server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+
+        self.target_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.target_dir.cleanup)
+
+    def views(self, *ids):
+        return [make_view(view_id) for view_id in ids]
+
+    def test_export_many_images(self) -> None:
+        baseurl = self.server.views.baseurl
+        with requests_mock.mock() as m:
+            m.get(f"{baseurl}/a/image", content=b"image a")
+            m.get(f"{baseurl}/b/image", content=b"image b")
+            manifest = self.server.views.export_many(self.views("a", "b"), "image", target_dir=self.target_dir.name)
+
+        self.assertIsInstance(manifest, ExportManifest)
+        self.assertEqual(["a", "b"], [result.item_id for result in manifest])
+        self.assertEqual(2, len(manifest.succeeded))
+        for result, content in zip(manifest, (b"image a", b"image b")):
+            self.assertEqual(os.path.join(self.target_dir.name, f"{result.item_id}.png"), result.path)
+            self.assertEqual(len(content), result.size)
+            with open(result.path, "rb") as f:
+                self.assertEqual(content, f.read())
+        self.assertEqual(["a.png", "b.png"], sorted(os.listdir(self.target_dir.name)))
+
+    def test_export_many_max_age_and_options(self) -> None:
+        baseurl = self.server.views.baseurl
+        options = TSC.CSVRequestOptions(maxage=5)
+        options.vf("Region", "West")
+        with requests_mock.mock() as m:
+            m.get(f"{baseurl}/a/data", content=b"x,y\n1,2\n")
+            self.server.views.export_many(self.views("a"), "csv", options, self.target_dir.name, max_age=60)
+            query = unquote(m.last_request.query)
+
+        self.assertIn("maxage=60", query)
+        self.assertIn("vf_region=west", query)
+        # the caller's options are not changed
+        self.assertEqual(5, options.max_age)
+
+    def test_export_many_streams_csv(self) -> None:
+        baseurl = self.server.views.baseurl
+        content = large_csv()
+        body = StreamedBody(content, os.path.join(self.target_dir.name, "a.csv.part"))
+        with requests_mock.mock() as m:
+            m.get(f"{baseurl}/a/data", body=body, headers=CSV_HEADERS)
+            manifest = self.server.views.export_many(self.views("a"), "csv", target_dir=self.target_dir.name)
+
+        # the body is written as it is downloaded rather than held in memory first
+        self.assertTrue(body.written_while_reading)
+        self.assertEqual(len(content), manifest.results[0].size)
+
+    def test_export_many_records_failures(self) -> None:
+        baseurl = self.server.views.baseurl
+        with requests_mock.mock() as m:
+            m.get(f"{baseurl}/a/pdf", content=b"%PDF a")
+            m.get(f"{baseurl}/missing/pdf", text=ERROR_XML, status_code=404)
+            manifest = self.server.views.export_many(
+                self.views("a", "missing"),
+                "pdf",
+                target_dir=self.target_dir.name,
+                filename=lambda view: f"report-{view.id}.pdf",
+            )
+
+        self.assertEqual(["a"], [result.item_id for result in manifest.succeeded])
+        self.assertEqual(["missing"], [result.item_id for result in manifest.failed])
+        self.assertIsInstance(manifest.failed[0].error, TSC.ServerResponseError)
+        self.assertEqual(["report-a.pdf"], os.listdir(self.target_dir.name))
+
+        manifest_path = os.path.join(self.target_dir.name, "manifest.json")
+        manifest.save(manifest_path)
+        with open(manifest_path) as f:
+            saved = json.load(f)
+        self.assertEqual(["a", "missing"], [result["item_id"] for result in saved["results"]])
+        self.assertIsNone(saved["results"][0]["error"])
+        self.assertIsNotNone(saved["results"][1]["error"])
+
+    def test_export_many_duplicates(self) -> None:
+        baseurl = self.server.views.baseurl
+        with requests_mock.mock() as m:
+            m.get(f"{baseurl}/a/image", content=b"image a")
+            manifest = self.server.views.export_many(self.views("a", "a"), "image", target_dir=self.target_dir.name)
+            self.assertEqual(1, m.call_count)
+        self.assertEqual(["a"], [result.item_id for result in manifest])
+
+        with requests_mock.mock() as m:
+            with self.assertRaises(ValueError):
+                self.server.views.export_many(
+                    self.views("a", "b"), "image", target_dir=self.target_dir.name, filename=lambda view: "same.png"
+                )
+            self.assertEqual(0, m.call_count)
+
+    def test_export_many_invalid_kind(self) -> None:
+        with self.assertRaises(ValueError):
+            self.server.views.export_many(self.views("a"), "powerpoint", target_dir=self.target_dir.name)
+
+    def test_export_many_missing_id(self) -> None:
+        with self.assertRaises(TSC.MissingRequiredFieldError):
+            self.server.views.export_many(self.views("a", None), "image", target_dir=self.target_dir.name)
+
+    def test_export_many_kind_version(self) -> None:
+        self.server.version = "3.7"
+        with self.assertRaises(EndpointUnavailableError):
+            self.server.views.export_many(self.views("a"), "excel", target_dir=self.target_dir.name)
+
+    def test_export_many_custom_views(self) -> None:
+        baseurl = self.server.custom_views.baseurl
+        custom_view = TSC.CustomViewItem(id="c")
+        with requests_mock.mock() as m:
+            m.get(f"{baseurl}/c/data", content=b"x,y\n")
+            manifest = self.server.custom_views.export_many([custom_view], "csv", target_dir=self.target_dir.name)
+
+        self.assertEqual(os.path.join(self.target_dir.name, "c.csv"), manifest.results[0].path)
+
+    def test_export_many_workbooks(self) -> None:
+        baseurl = self.server.workbooks.baseurl
+        workbook = TSC.WorkbookItem("project")
+        workbook._id = "w"
+        with open(POPULATE_PDF, "rb") as f:
+            pdf = f.read()
+        with requests_mock.mock() as m:
+            m.get(f"{baseurl}/w/pdf", content=pdf)
+            m.get(f"{baseurl}/w/powerpoint", content=b"pptx")
+            pdfs = self.server.workbooks.export_many([workbook], "pdf", target_dir=self.target_dir.name)
+            slides = self.server.workbooks.export_many([workbook], "powerpoint", target_dir=self.target_dir.name)
+
+        self.assertEqual(len(pdf), pdfs.results[0].size)
+        self.assertEqual(os.path.join(self.target_dir.name, "w.pptx"), slides.results[0].path)
+
+    def test_burst_cartesian_product(self) -> None:
+        baseurl = self.server.views.baseurl
+        view = make_view("a")
+        view._name = "Sales"
+        with requests_mock.mock() as m:
+            m.get(f"{baseurl}/a/pdf", content=b"%PDF")
+            manifest = self.server.views.burst(
+                view,
+                filters={"Region": ["East", "West", "East"]},
+                parameters={"Year": [2023, 2024]},
+                target_dir=self.target_dir.name,
+            )
+            queries = sorted(unquote(request.query) for request in m.request_history)
+
+        self.assertEqual(4, len(manifest))
+        self.assertEqual(
+            [
+                "vf_region=east&year=2023",
+                "vf_region=east&year=2024",
+                "vf_region=west&year=2023",
+                "vf_region=west&year=2024",
+            ],
+            queries,
+        )
+        self.assertEqual({"Region": "East", "Year": "2023"}, manifest.results[0].values)
+        self.assertEqual(
+            [
+                "Sales__Region-East__Year-2023.pdf",
+                "Sales__Region-East__Year-2024.pdf",
+                "Sales__Region-West__Year-2023.pdf",
+                "Sales__Region-West__Year-2024.pdf",
+            ],
+            sorted(os.listdir(self.target_dir.name)),
+        )
+
+    def test_burst_file_names(self) -> None:
+        baseurl = self.server.views.baseurl
+        with requests_mock.mock() as m:
+            m.get(f"{baseurl}/a/data", content=b"x\n")
+            manifest = self.server.views.burst(
+                make_view("a"), filters={"Customer": ["A/B", "A B"]}, kind="csv", target_dir=self.target_dir.name
+            )
+
+        names = [os.path.basename(result.path) for result in manifest]
+        self.assertEqual("a__Customer-A_B.csv", names[0])
+        self.assertRegex(names[1], r"^a__Customer-A_B-[0-9a-f]{8}\.csv$")
+
+    def test_burst_streams_csv(self) -> None:
+        baseurl = self.server.views.baseurl
+        content = large_csv()
+        body = StreamedBody(content, os.path.join(self.target_dir.name, "a__Region-East.csv.part"))
+        with requests_mock.mock() as m:
+            m.get(f"{baseurl}/a/data", body=body, headers=CSV_HEADERS)
+            manifest = self.server.views.burst(
+                make_view("a"), filters={"Region": ["East"]}, kind="csv", target_dir=self.target_dir.name
+            )
+
+        self.assertTrue(body.written_while_reading)
+        self.assertEqual(len(content), manifest.results[0].size)
+
+    def test_burst_requires_dimension(self) -> None:
+        with self.assertRaises(ValueError):
+            self.server.views.burst(make_view("a"), target_dir=self.target_dir.name)
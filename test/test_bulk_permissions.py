@@ -0,0 +1,118 @@
+import unittest
+
+import requests_mock
+
+import tableauserverclient as TSC
+from tableauserverclient.models import GroupItem, UserItem
+from tableauserverclient.server.bulk_permissions import PermissionedItem
+from ._utils import read_xml_asset
+
+PROJECT_PERMISSIONS_XML = "project_populate_permissions.xml"
+WORKBOOK_PERMISSIONS_XML = "workbook_populate_permissions.xml"
+
+GROUP_ID = "c8f2773a-c83a-11e8-8c8f-33e6d787b506"
+WORKBOOK_USER_ID = "7c37ee24-c4b1-42b6-a154-eaeab7ee330a"
+
+Allow = TSC.Permission.Mode.Allow
+Deny = TSC.Permission.Mode.Deny
+Capability = TSC.Permission.Capability
+
+
+class BulkPermissionsTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = TSC.Server("http://test", False)
+        self.server.version = "3.5"
+
+        # Fake signin
+        self.server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+        self.server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+
+        self.project = TSC.ProjectItem("Project3")
+        self.project._id = "90f09c23-440a-44ee-857c-5744a51d5b08"
+        self.workbook = TSC.WorkbookItem("project-id")
+        self.workbook._id = "21778de4-b7b9-44bc-a599-1506a2639ace"
+        self.project_url = f"{self.server.projects.baseurl}/{self.project.id}/permissions"
+        self.workbook_url = f"{self.server.workbooks.baseurl}/{self.workbook.id}/permissions"
+
+    def test_plan_minimal_changes(self) -> None:
+        group = GroupItem.as_reference(GROUP_ID)
+        desired = [
+            TSC.PermissionsRule(group, {Capability.Read: Allow}),
+            TSC.PermissionsRule(group, {Capability.Write: Deny}),
+        ]
+        with requests_mock.mock() as m:
+            m.get(self.project_url, text=read_xml_asset(PROJECT_PERMISSIONS_XML))
+            (change,) = TSC.BulkPermissions(self.server).plan([(self.project, desired)])
+
+        # Read is already allowed, Write has to flip from Allow to Deny
+        self.assertEqual([TSC.PermissionsRule(group, {Capability.Write: Deny})], change.additions)
+        self.assertEqual([TSC.PermissionsRule(group, {Capability.Write: Allow})], change.deletions)
+
+    def test_plan_no_changes(self) -> None:
+        desired = [TSC.PermissionsRule(GroupItem.as_reference(GROUP_ID), {Capability.Read: Allow})]
+        with requests_mock.mock() as m:
+            m.get(self.project_url, text=read_xml_asset(PROJECT_PERMISSIONS_XML))
+            bulk = TSC.BulkPermissions(self.server)
+            changes = bulk.plan([(self.project, desired)])
+            applied = bulk.apply(changes)
+
+        self.assertFalse(changes[0].has_changes)
+        self.assertEqual([], applied)
+
+    def test_plan_replace(self) -> None:
+        user = UserItem.as_reference(WORKBOOK_USER_ID)
+        desired = [TSC.PermissionsRule(user, {Capability.ExportImage: Allow})]
+        with requests_mock.mock() as m:
+            m.get(self.workbook_url, text=read_xml_asset(WORKBOOK_PERMISSIONS_XML))
+            (change,) = TSC.BulkPermissions(self.server).plan([(self.workbook, desired)], replace=True)
+
+        self.assertEqual([], change.additions)
+        deleted = {(rule.grantee.tag_name, capability) for rule in change.deletions for capability in rule.capabilities}
+        self.assertEqual(7, len(deleted))
+        self.assertNotIn(("user", Capability.ExportImage), deleted)
+
+    def test_sync(self) -> None:
+        group = GroupItem.as_reference(GROUP_ID)
+        targets: list[tuple[PermissionedItem, list[TSC.PermissionsRule]]] = [
+            (self.project, [TSC.PermissionsRule(group, {Capability.Write: Deny})]),
+            (self.workbook, [TSC.PermissionsRule(group, {Capability.Read: Allow})]),
+        ]
+        with requests_mock.mock() as m:
+            m.get(self.project_url, text=read_xml_asset(PROJECT_PERMISSIONS_XML))
+            m.get(self.workbook_url, text=read_xml_asset(WORKBOOK_PERMISSIONS_XML))
+            m.delete(f"{self.project_url}/groups/{GROUP_ID}/Write/Allow", status_code=204)
+            m.put(self.project_url, text=read_xml_asset(PROJECT_PERMISSIONS_XML))
+            m.put(self.workbook_url, status_code=500)
+            changes = TSC.BulkPermissions(self.server, max_workers=2).sync(targets)
+            methods = [(r.method, r.url) for r in m.request_history if r.url.startswith(self.project_url)]
+
+        self.assertTrue(changes[0].applied)
+        self.assertIsNone(changes[0].error)
+        self.assertFalse(changes[1].applied)
+        self.assertIsInstance(changes[1].error, TSC.server.endpoint.exceptions.InternalServerError)
+        # the conflicting capability is deleted before the new rule is added
+        self.assertEqual(["GET", "DELETE", "PUT"], [method for method, _ in methods])
+
+    def test_plan_fetch_error(self) -> None:
+        desired = [TSC.PermissionsRule(GroupItem.as_reference(GROUP_ID), {Capability.Read: Allow})]
+        with requests_mock.mock() as m:
+            m.get(self.project_url, status_code=500)
+            m.get(self.workbook_url, text=read_xml_asset(WORKBOOK_PERMISSIONS_XML))
+            bulk = TSC.BulkPermissions(self.server)
+            changes = bulk.plan([(self.project, desired), (self.workbook, desired)])
+            m.put(self.workbook_url, text=read_xml_asset(WORKBOOK_PERMISSIONS_XML))
+            applied = bulk.apply(changes)
+
+        self.assertIsInstance(changes[0].error, TSC.server.endpoint.exceptions.InternalServerError)
+        self.assertFalse(changes[0].has_changes)
+        self.assertIsNone(changes[1].error)
+        self.assertTrue(changes[1].has_changes)
+        self.assertEqual([changes[1]], applied)
+
+    def test_unsupported_item(self) -> None:
+        with self.assertRaises(TypeError):
+            TSC.BulkPermissions(self.server).plan([(TSC.UserItem("user"), [])])  # type: ignore[list-item]
+
+    def test_missing_id(self) -> None:
+        with self.assertRaises(TSC.MissingRequiredFieldError):
+            TSC.BulkPermissions(self.server).plan([(TSC.ProjectItem("new"), [])])
@@ -0,0 +1,66 @@
+import gzip
+import os
+import tempfile
+import unittest
+
+import requests
+import requests_mock
+
+import tableauserverclient as TSC
+from tableauserverclient.server.exceptions import UnrecordedRequestError
+from ._utils import read_xml_asset
+
+SIGN_IN_XML = read_xml_asset("auth_sign_in.xml")
+WORKBOOK_GET_XML = read_xml_asset("workbook_get.xml")
+
+TOKEN = "eIX6mvFsqyansa4KqEI1UwOpS8ggRs2l"
+SITE_ID = "6b7179ba-b82b-4f0f-91ed-812074ac5da6"
+
+
+class CassetteTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, "crawl.jsonl.gz")
+
+    def mock_session(self):
+        adapter = requests_mock.Adapter()
+        adapter.register_uri("POST", "http://test/api/3.10/auth/signin", text=SIGN_IN_XML)
+        adapter.register_uri("GET", f"http://test/api/3.10/sites/{SITE_ID}/workbooks", text=WORKBOOK_GET_XML)
+        session = requests.session()
+        session.mount("http://", adapter)
+        return session
+
+    def crawl(self, session_factory):
+        server = TSC.Server("http://test", False, session_factory=session_factory)
+        server.version = "3.10"
+        server.auth.sign_in(TSC.TableauAuth("admin", "hunter2"))
+        workbooks, _ = server.workbooks.get()
+        return server, workbooks
+
+    def test_record_and_replay(self) -> None:
+        with TSC.Cassette(self.path) as cassette:
+            _, recorded = self.crawl(cassette.recorder(self.mock_session))
+        self.assertEqual(2, cassette.recorded)
+
+        with gzip.open(self.path, "rb") as f:
+            content = f.read()
+        self.assertNotIn(b"hunter2", content)
+        self.assertNotIn(TOKEN.encode(), content)
+
+        cassette = TSC.Cassette(self.path)
+        server, replayed = self.crawl(cassette.player())
+        self.assertEqual([w.id for w in recorded], [w.id for w in replayed])
+        self.assertEqual(SITE_ID, server.site_id)
+        self.assertEqual("********", server.auth_token)
+        # the last response for a request is repeated once the recorded ones run out
+        server.workbooks.get()
+        self.assertEqual(3, cassette.replayed)
+
+    def test_unrecorded_request(self) -> None:
+        with TSC.Cassette(self.path) as cassette:
+            self.crawl(cassette.recorder(self.mock_session))
+
+        server, _ = self.crawl(TSC.Cassette(self.path).player())
+        with self.assertRaises(UnrecordedRequestError):
+            server.projects.get()
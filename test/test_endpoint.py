@@ -53,6 +53,15 @@ class TestEndpoint(unittest.TestCase):
 
             self.assertFalse(response._content_consumed)
 
+    def test_get_request_stream_text(self) -> None:
+        url = "http://test/"
+        endpoint = TSC.server.Endpoint(self.server)
+        with requests_mock.mock() as m:
+            m.get(url, text="Region,Sales\n", headers={"Content-Type": "text/csv; charset=utf-8"})
+            response = endpoint.get_request(url, parameters={"stream": True})
+
+            self.assertFalse(response._content_consumed)
+
     def test_binary_log_truncated(self):
         class FakeResponse:
             headers = {"Content-Type": "application/octet-stream"}
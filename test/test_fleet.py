@@ -0,0 +1,76 @@
+import threading
+import unittest
+
+import requests_mock
+
+import tableauserverclient as TSC
+from ._utils import read_xml_asset
+
+SERVER_INFO_XML = read_xml_asset("server_info_get.xml")
+SIGN_IN_XML = read_xml_asset("auth_sign_in.xml")
+SIGN_IN_ERROR_XML = read_xml_asset("auth_sign_in_error.xml")
+
+
+class FleetTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.fleet = TSC.Fleet(max_workers=4)
+        for name in ("prod", "dev"):
+            self.fleet.add(name, TSC.Server(f"http://{name}", False), TSC.TableauAuth("admin", "password"))
+
+    def mock_servers(self, m, *names):
+        for name in names:
+            m.get(f"http://{name}/api/2.4/serverInfo", text=SERVER_INFO_XML)
+            m.post(f"http://{name}/api/3.10/auth/signin", text=SIGN_IN_XML)
+            m.post(f"http://{name}/api/3.10/auth/signout", text="")
+
+    def test_connect_map_sign_out(self) -> None:
+        with requests_mock.mock() as m:
+            self.mock_servers(m, "prod", "dev")
+            with self.fleet:
+                self.assertTrue(all(server.is_signed_in() for server in self.fleet.servers.values()))
+                report = self.fleet.map(lambda server: server.server_address)
+            signed_out = [r.netloc for r in m.request_history if r.path.endswith("/signout")]
+
+        self.assertEqual({"prod": "http://prod", "dev": "http://dev"}, report.values)
+        self.assertEqual(["prod", "dev"], [result.name for result in report])
+        self.assertEqual(["dev", "prod"], sorted(signed_out))
+        self.assertFalse(any(server.is_signed_in() for server in self.fleet.servers.values()))
+
+    def test_connect_reports_failures(self) -> None:
+        with requests_mock.mock() as m:
+            self.mock_servers(m, "prod")
+            m.get("http://dev/api/2.4/serverInfo", text=SERVER_INFO_XML)
+            m.post("http://dev/api/3.10/auth/signin", text=SIGN_IN_ERROR_XML, status_code=401)
+            report = self.fleet.connect()
+            mapped = self.fleet.map(lambda server: "ok")
+
+        self.assertEqual({"prod": "3.10"}, report.values)
+        self.assertIsInstance(report["dev"].error, TSC.FailedSignInError)
+        self.assertEqual({"prod": "ok"}, mapped.values)
+        self.assertIsInstance(mapped["dev"].error, TSC.NotSignedInError)
+
+    def test_map_timeout(self) -> None:
+        release = threading.Event()
+        fleet = TSC.Fleet(timeout=0.1)
+        for name in ("slow", "fast"):
+            server = TSC.Server(f"http://{name}", False)
+            server._auth_token = "token"
+            fleet.add(name, server, TSC.TableauAuth("admin", "password"))
+
+        def check(server):
+            if server.server_address == "http://slow":
+                release.wait(5)
+            return "done"
+
+        try:
+            report = fleet.map(check)
+        finally:
+            release.set()
+
+        self.assertEqual({"fast": "done"}, report.values)
+        self.assertTrue(report["slow"].timed_out)
+        self.assertLess(report.seconds, 5)
+
+    def test_add_duplicate(self) -> None:
+        with self.assertRaises(ValueError):
+            self.fleet.add("prod", TSC.Server("http://other", False), TSC.TableauAuth("admin", "password"))
@@ -171,6 +171,52 @@ class GroupTests(unittest.TestCase):
             m.put(f"{self.baseurl}/{group.id}/users/remove")
             self.server.groups.remove_users(group, users)
 
+    def test_sync_members(self) -> None:
+        self.server.version = "3.21"
+        self.baseurl = self.server.groups.baseurl
+        group = TSC.GroupItem("test")
+        group._id = "e7833b48-c6f7-47b5-a2a7-36e7dd232758"
+        desired = ["new-user-1", "new-user-2", "new-user-3"]
+
+        with requests_mock.mock() as m:
+            m.get(
+                f"{self.baseurl}/{group.id}/users?pageNumber=1&pageSize=1000",
+                text=Path(POPULATE_USERS).read_text(),
+                complete_qs=True,
+            )
+            m.put(f"{self.baseurl}/{group.id}/users/remove")
+            m.post(f"{self.baseurl}/{group.id}/users", text=ADD_USERS.read_text())
+            added, removed = self.server.groups.sync_members(group, desired, batch_size=2)
+            bodies = [(r.method, r.body) for r in m.request_history[1:]]
+
+        self.assertEqual(desired, added)
+        self.assertEqual(["dd2239f6-ddf1-4107-981a-4cf94e415794"], removed)
+        self.assertEqual(["PUT", "POST", "POST"], [method for method, _ in bodies])
+        self.assertIn(b"dd2239f6-ddf1-4107-981a-4cf94e415794", bodies[0][1])
+        self.assertIn(b"new-user-1", bodies[1][1])
+        self.assertIn(b"new-user-2", bodies[1][1])
+        self.assertIn(b"new-user-3", bodies[2][1])
+
+    def test_sync_members_no_changes(self) -> None:
+        self.server.version = "3.21"
+        self.baseurl = self.server.groups.baseurl
+        group = TSC.GroupItem("test")
+        group._id = "e7833b48-c6f7-47b5-a2a7-36e7dd232758"
+        member = TSC.UserItem("alice")
+        member._id = "dd2239f6-ddf1-4107-981a-4cf94e415794"
+
+        with requests_mock.mock() as m:
+            m.get(f"{self.baseurl}/{group.id}/users", text=Path(POPULATE_USERS).read_text())
+            added, removed = self.server.groups.sync_members(group, [member])
+            self.assertEqual(1, m.call_count)
+
+        self.assertEqual(([], []), (added, removed))
+
+    def test_sync_members_missing_id(self) -> None:
+        self.server.version = "3.21"
+        group = TSC.GroupItem("test")
+        self.assertRaises(TSC.MissingRequiredFieldError, self.server.groups.sync_members, group, ["user"])
+
     def test_add_user_before_populating(self) -> None:
         with open(GET_XML, "rb") as f:
             get_xml_response = f.read().decode("utf-8")
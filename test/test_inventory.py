@@ -0,0 +1,121 @@
+import sqlite3
+import unittest
+from urllib.parse import unquote
+
+import requests_mock
+
+import tableauserverclient as TSC
+from ._utils import read_xml_asset
+
+SITE_ID = "dad65087-b08b-4603-af4e-2887b8aafc67"
+
+EMPTY_WORKBOOKS_XML = "workbook_get_empty.xml"
+
+
+class ContentInventoryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = TSC.Server("http://test", False)
+        self.server.version = "3.10"
+
+        # Fake signin
+        self.server._site_id = SITE_ID
+        self.server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+
+        self.inventory = TSC.ContentInventory(self.server)
+        self.db = self.inventory.connection
+
+    def tearDown(self) -> None:
+        self.inventory.close()
+
+    def mock_all(self, m) -> None:
+        m.get(self.server.projects.baseurl, text=read_xml_asset("project_get_hierarchy.xml"))
+        m.get(self.server.workbooks.baseurl, text=read_xml_asset("workbook_get.xml"))
+        m.get(self.server.views.baseurl, text=read_xml_asset("view_get_usage.xml"))
+        m.get(self.server.datasources.baseurl, text=read_xml_asset("datasource_get.xml"))
+        m.get(self.server.users.baseurl, text=read_xml_asset("user_get.xml"))
+        m.get(self.server.groups.baseurl, text=read_xml_asset("group_get.xml"))
+
+    def test_full_sync(self) -> None:
+        with requests_mock.mock() as m:
+            self.mock_all(m)
+            counts = self.inventory.sync()
+            views_query = unquote(m.request_history[2].query)
+
+        self.assertEqual({"projects": 5, "workbooks": 2, "views": 2, "datasources": 2, "users": 2, "groups": 3}, counts)
+        self.assertIn("includeusagestatistics=true", views_query)
+        for table, count in counts.items():
+            self.assertEqual(count, self.db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0])
+
+        tags = self.db.execute("SELECT tag FROM tags WHERE content_type = 'workbooks' ORDER BY tag").fetchall()
+        self.assertEqual([("Safari",), ("Sample",)], tags)
+        self.assertIsNotNone(self.db.execute("SELECT SUM(total_views) FROM views").fetchone()[0])
+        self.assertEqual("2020-01-05T10:00:00Z", self.inventory.watermark("projects"))
+        self.assertIsNone(self.inventory.watermark("users"))
+
+    def test_incremental_sync(self) -> None:
+        with requests_mock.mock() as m:
+            self.mock_all(m)
+            self.inventory.sync(["workbooks"])
+            watermark = self.inventory.watermark("workbooks")
+
+            m.get(self.server.workbooks.baseurl, text=read_xml_asset(EMPTY_WORKBOOKS_XML))
+            counts = self.inventory.sync(["workbooks"])
+            query = unquote(m.last_request.query)
+
+        self.assertEqual({"workbooks": 0}, counts)
+        assert watermark is not None
+        self.assertIn(f"updatedat:gte:{watermark.lower()}", query)
+        # rows are kept until a full sync shows the items are gone
+        self.assertEqual(2, self.db.execute("SELECT COUNT(*) FROM workbooks").fetchone()[0])
+        self.assertEqual(watermark, self.inventory.watermark("workbooks"))
+
+    def test_views_usage_and_last_viewed(self) -> None:
+        views_xml = read_xml_asset("view_get_usage.xml")
+        query = "SELECT name, total_views, last_viewed_at, synced_at FROM views ORDER BY name"
+        with requests_mock.mock() as m:
+            m.get(self.server.views.baseurl, text=views_xml)
+            self.inventory.sync(["views"])
+            first = self.db.execute(query).fetchall()
+            m.get(self.server.views.baseurl, text=views_xml.replace('totalViewCount="7"', 'totalViewCount="9"'))
+            self.inventory.sync(["views"])
+            second = self.db.execute(query).fetchall()
+            views_query = unquote(m.last_request.query)
+            self.inventory.sync(["views"])
+            third = self.db.execute(query).fetchall()
+
+        # there is nothing to compare the counts to on the first sync
+        self.assertEqual([None, None], [row[2] for row in first])
+        # usage is refreshed even though the views were not updated
+        self.assertNotIn("updatedat", views_query)
+        self.assertEqual([9, 13], [row[1] for row in second])
+        self.assertEqual(second[0][3], second[0][2])
+        self.assertIsNone(second[1][2])
+        # the time is kept until the count goes up again
+        self.assertEqual(second[0][2], third[0][2])
+
+    def test_full_sync_removes_deleted(self) -> None:
+        with requests_mock.mock() as m:
+            self.mock_all(m)
+            self.inventory.sync(["workbooks"])
+            m.get(self.server.workbooks.baseurl, text=read_xml_asset(EMPTY_WORKBOOKS_XML))
+            self.inventory.sync(["workbooks"], full=True)
+
+        self.assertEqual(0, self.db.execute("SELECT COUNT(*) FROM workbooks").fetchone()[0])
+        self.assertEqual(0, self.db.execute("SELECT COUNT(*) FROM tags").fetchone()[0])
+
+    def test_sites_are_kept_apart(self) -> None:
+        with requests_mock.mock() as m:
+            self.mock_all(m)
+            self.inventory.sync(["groups"])
+            self.server._site_id = "other-site"
+            m.get(self.server.groups.baseurl, text=read_xml_asset("group_get.xml"))
+            self.inventory.sync(["groups"])
+
+        self.assertEqual(6, self.db.execute("SELECT COUNT(*) FROM groups").fetchone()[0])
+
+    def test_existing_connection_and_unknown_resource(self) -> None:
+        connection = sqlite3.connect(":memory:")
+        inventory = TSC.ContentInventory(self.server, connection)
+        self.assertIs(connection, inventory.connection)
+        with self.assertRaises(ValueError):
+            inventory.sync(["flows"])
@@ -6,6 +6,7 @@ import requests_mock
 
 import tableauserverclient as TSC
 from tableauserverclient.server.endpoint.exceptions import GraphQLError
+from tableauserverclient.server.endpoint.metadata_endpoint import find_page_info, get_page_info, merge_data
 
 TEST_ASSET_DIR = os.path.join(os.path.dirname(__file__), "assets")
 
@@ -100,3 +101,116 @@ class MetadataTests(unittest.TestCase):
             with self.assertRaises(GraphQLError) as e:
                 self.server.metadata.query("fake query", abort_on_error=True)
                 self.assertListEqual(e.error, EXPECTED_DICT_ERROR)
+
+    def mock_pages(self, m) -> None:
+        pages = []
+        for path in (METADATA_PAGE_1, METADATA_PAGE_2, METADATA_PAGE_3):
+            with open(path, "rb") as f:
+                pages.append({"text": f.read().decode(), "status_code": 200})
+        m.post(self.baseurl, pages)
+
+    def test_iter_pages_is_lazy(self):
+        with requests_mock.mock() as m:
+            self.mock_pages(m)
+            pages = self.server.metadata.iter_pages("fake query endCursor hasNextPage", variables={"first": 1})
+            self.assertEqual(0, m.call_count)
+            first = next(pages)
+            self.assertEqual(1, m.call_count)
+            rest = list(pages)
+            second_variables = m.request_history[1].json()["variables"]
+
+        self.assertTrue(first["data"]["publishedDatasourcesConnection"]["pageInfo"]["hasNextPage"])
+        self.assertEqual(2, len(rest))
+        self.assertEqual(
+            first["data"]["publishedDatasourcesConnection"]["pageInfo"]["endCursor"], second_variables["afterToken"]
+        )
+
+    def test_iter_nodes(self):
+        with requests_mock.mock() as m:
+            self.mock_pages(m)
+            nodes = list(
+                self.server.metadata.iter_nodes(
+                    "fake query endCursor hasNextPage", "publishedDatasourcesConnection.nodes", {"first": 1}
+                )
+            )
+
+        self.assertEqual(
+            [
+                "0039e5d5-25fa-196b-c66e-c0675839e0b0",
+                "00b191ce-6055-aff5-e275-c26610c8c4d6",
+                "02f3e4d8-856a-da36-f6c5-c900945c57b9",
+            ],
+            [node["id"] for node in nodes],
+        )
+
+    def test_iter_pages_validates_eagerly(self):
+        with self.assertRaises(TSC.server.endpoint.exceptions.InvalidGraphQLQuery):
+            self.server.metadata.iter_pages("fake query")
+
+    def test_iter_pages_abort_on_error(self):
+        with open(METADATA_QUERY_ERROR, "rb") as f:
+            response_json = json.loads(f.read().decode())
+        with requests_mock.mock() as m:
+            m.post(self.baseurl, json=response_json)
+            pages = self.server.metadata.iter_pages("fake query endCursor hasNextPage", abort_on_error=True)
+            with self.assertRaises(GraphQLError):
+                next(pages)
+
+    def test_get_page_info(self):
+        page_info = {"hasNextPage": True, "endCursor": "abc"}
+        nodes = [{"id": str(i), "pageInfo": {"hasNextPage": False, "endCursor": "node"}} for i in range(3)]
+        result = {"data": {"fieldsConnection": {"nodes": nodes, "pageInfo": page_info}}}
+
+        self.assertIs(page_info, find_page_info(result))
+        self.assertIs(page_info, find_page_info(result, "fieldsConnection"))
+        self.assertIs(page_info, find_page_info(result, "fieldsConnection.pageInfo"))
+        self.assertIsNone(find_page_info(result, "missing"))
+        self.assertEqual((True, "abc"), get_page_info(result))
+
+        # pageInfo inside a list is still found by searching the whole result
+        nested = {"data": {"sites": [{"fieldsConnection": {"pageInfo": page_info}}]}}
+        self.assertEqual((True, "abc"), get_page_info(nested))
+
+    def test_json_loads_hook(self):
+        decoded = []
+
+        def json_loads(content):
+            decoded.append(content)
+            return json.loads(content)
+
+        self.server.metadata.json_loads = json_loads
+        with requests_mock.mock() as m:
+            self.mock_pages(m)
+            pages = list(
+                self.server.metadata.iter_pages(
+                    "fake query endCursor hasNextPage", {"first": 1}, page_info_path="publishedDatasourcesConnection"
+                )
+            )
+
+        self.assertEqual(3, len(pages))
+        self.assertEqual(3, len(decoded))
+
+    def test_query_batches(self):
+        def respond(request, context):
+            ids = request.json()["variables"]["ids"]
+            if "bad" in ids:
+                return {"data": {"tables": []}, "errors": EXPECTED_DICT_ERROR}
+            return {"data": {"tables": [{"id": id_} for id_ in ids]}}
+
+        ids = ["a", "b", "c", "bad", "d", "a"]
+        with requests_mock.mock() as m:
+            m.post(self.baseurl, json=respond)
+            results = self.server.metadata.query_batches(
+                "query t($ids: [ID]) { tables(filter: {idWithin: $ids}) { id } }", ids, batch_size=2, max_workers=2
+            )
+            self.assertEqual(3, m.call_count)
+
+        self.assertEqual(["a", "b", "d"], [table["id"] for table in results.data["tables"]])
+        ((batch, error),) = results.errors
+        self.assertEqual(["c", "bad"], batch)
+        self.assertIsInstance(error, GraphQLError)
+
+    def test_merge_data(self):
+        merged = merge_data({}, {"a": [1], "conn": {"nodes": [1], "totalCount": 2}, "b": 1})
+        merge_data(merged, {"a": [2], "conn": {"nodes": [2]}, "b": 2})
+        self.assertEqual({"a": [1, 2], "conn": {"nodes": [1, 2], "totalCount": 2}, "b": 2}, merged)
@@ -0,0 +1,109 @@
+import os
+import stat
+import tempfile
+import unittest
+from unittest import mock
+
+import requests_mock
+
+import tableauserverclient as TSC
+
+RESULT = {"data": {"tables": [{"id": "a"}]}}
+ERROR_RESULT = {"data": None, "errors": [{"message": "Reached time limit"}]}
+
+
+class MetadataCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = TSC.Server("http://test", False)
+        self.server.version = "3.9"
+
+        # Fake signin
+        self.server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+        self.server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+
+        self.metadata = self.server.metadata
+        self.baseurl = self.metadata.baseurl
+
+    def test_memory_cache_hits(self) -> None:
+        cache = TSC.InMemoryMetadataCache()
+        self.metadata.cache = cache
+        with requests_mock.mock() as m:
+            m.post(self.baseurl, json=RESULT)
+            first = self.metadata.query("query { tables { id } }", {"b": 1, "a": 2})
+            first["data"]["tables"].append({"id": "changed"})
+            second = self.metadata.query("query {\n    tables { id }\n}", {"a": 2, "b": 1})
+            self.metadata.query("query { tables { id } }", {"a": 3})
+            self.assertEqual(2, m.call_count)
+
+        self.assertEqual(RESULT, second)
+        self.assertEqual((1, 2), (cache.hits, cache.misses))
+
+    def test_errors_and_parameters_are_not_cached(self) -> None:
+        self.metadata.cache = TSC.InMemoryMetadataCache()
+        with requests_mock.mock() as m:
+            m.post(self.baseurl, json=ERROR_RESULT)
+            self.metadata.query("query")
+            self.metadata.query("query")
+            m.post(self.baseurl, json=RESULT)
+            self.metadata.query("query", parameters={"timeout": 5})
+            self.metadata.query("query", parameters={"timeout": 5})
+            self.assertEqual(4, m.call_count)
+        self.assertEqual(0, len(self.metadata.cache))
+
+    def test_users_do_not_share_entries(self) -> None:
+        self.metadata.cache = TSC.InMemoryMetadataCache()
+        with requests_mock.mock() as m:
+            m.post(self.baseurl, json=RESULT)
+            self.server._user_id = "alice"
+            self.metadata.query("query")
+            self.server._user_id = "bob"
+            self.metadata.query("query")
+            self.server._user_id = "alice"
+            self.metadata.query("query")
+            self.assertEqual(2, m.call_count)
+
+    def test_lru_and_ttl(self) -> None:
+        cache = TSC.InMemoryMetadataCache(ttl=10, max_size=2)
+        with mock.patch("time.monotonic", return_value=0):
+            for query in ("a", "b", "c"):
+                cache.set(query, None, RESULT)
+            self.assertIsNone(cache.get("a"))
+            self.assertEqual(RESULT, cache.get("b"))
+        with mock.patch("time.monotonic", return_value=11):
+            self.assertIsNone(cache.get("c"))
+
+    def test_file_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            self.metadata.cache = TSC.FileMetadataCache(directory)
+            with requests_mock.mock() as m:
+                m.post(self.baseurl, json=RESULT)
+                self.metadata.query("query")
+                # a new cache on the same directory sees the stored response
+                self.metadata.cache = TSC.FileMetadataCache(directory)
+                self.assertEqual(RESULT, self.metadata.query("query"))
+                self.assertEqual(1, m.call_count)
+
+            if os.name == "posix":
+                for name in os.listdir(directory):
+                    self.assertEqual(0o600, stat.S_IMODE(os.stat(os.path.join(directory, name)).st_mode))
+
+            self.metadata.cache.clear()
+            self.assertIsNone(self.metadata.cache.get("query"))
+
+    def test_cleared_when_status_changes(self) -> None:
+        self.metadata.cache = TSC.InMemoryMetadataCache()
+        self.metadata.cache_check_interval = 0
+        backfill = self.metadata.control_baseurl + "/backfill/status"
+        eventing = self.metadata.control_baseurl + "/eventing/status"
+        with requests_mock.mock() as m:
+            m.post(self.baseurl, json=RESULT)
+            m.get(backfill, json={"active": False})
+            m.get(eventing, json={"lastEventTime": 1})
+            self.metadata.query("query")
+            self.metadata.query("query")
+            self.assertEqual(1, sum(r.method == "POST" for r in m.request_history))
+            m.get(eventing, json={"lastEventTime": 2})
+            self.metadata.query("query")
+
+        posts = [r for r in m.request_history if r.method == "POST"]
+        self.assertEqual(2, len(posts))
@@ -0,0 +1,76 @@
+import io
+import unittest
+from unittest import mock
+
+import tableauserverclient as TSC
+from tableauserverclient.server.endpoint.exceptions import InternalServerError, ServerResponseError
+
+
+class MockTableauServerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.mock = TSC.MockTableauServer(sites=2, users=250, workbooks=20, job_duration=0.1)
+        self.mock.serve()
+        self.addCleanup(self.mock.shutdown)
+        self.server = TSC.Server(self.mock.address, use_server_version=True)
+        self.server.auth.sign_in(TSC.TableauAuth("admin", "password", site_id="site1"))
+
+    def test_pagination(self) -> None:
+        users = list(TSC.Pager(self.server.users, TSC.RequestOptions(pagesize=40)))
+
+        self.assertEqual("3.24", self.server.version)
+        self.assertEqual(250, len({user.id for user in users}))
+        self.assertEqual(self.mock.sites[1]["id"], self.server.site_id)
+
+    def test_filter_and_sort(self) -> None:
+        viewers = list(self.server.users.filter(site_role="Viewer").order_by("-name"))
+        names = [user.name for user in viewers]
+
+        self.assertTrue(viewers)
+        self.assertTrue(all(user.site_role == "Viewer" for user in viewers))
+        self.assertEqual(sorted(names, reverse=True), names)
+
+    def test_filter_list_field(self) -> None:
+        workbooks = list(self.server.workbooks.filter(tags="finance"))
+
+        self.assertTrue(workbooks)
+        self.assertTrue(all("finance" in workbook.tags for workbook in workbooks))
+
+    def test_refresh_job_completes(self) -> None:
+        workbook = self.server.workbooks.get()[0][0]
+        job = self.server.workbooks.refresh(workbook)
+        self.assertIsNone(job.completed_at)
+
+        job = self.server.jobs.wait_for_job(job, timeout=10)
+        self.assertEqual(TSC.JobItem.FinishCode.Success, job.finish_code)
+        self.assertEqual(workbook.id, job.workbook_id)
+
+    def test_chunked_publish(self) -> None:
+        project = self.server.projects.get()[0][0]
+        workbook = TSC.WorkbookItem(project.id, name="Uploaded")
+        file = io.BytesIO(bytes.fromhex("504b0304") + b"\0" * 4096)
+        with mock.patch("tableauserverclient.server.endpoint.workbooks_endpoint.FILESIZE_LIMIT", 1024):
+            published = self.server.workbooks.publish(workbook, file, "CreateNew")
+
+        self.assertEqual("Uploaded", published.name)
+        self.assertEqual(project.id, published.project_id)
+        self.assertEqual(1, len(self.server.workbooks.filter(name="Uploaded")))
+
+    def test_injected_errors(self) -> None:
+        self.mock.throttle_rate = 1
+        with self.assertRaises(ServerResponseError) as context:
+            self.server.users.get()
+        self.assertEqual("429000", context.exception.code)
+
+        self.mock.throttle_rate = 0
+        self.mock.error_rate = 1
+        with self.assertRaises(InternalServerError):
+            self.server.users.get()
+        self.assertEqual(2, self.mock.injected_errors)
+
+    def test_signed_out_token_is_refused(self) -> None:
+        token = self.server.auth_token
+        self.server.auth.sign_out()
+        self.server._auth_token = token
+        self.server._site_id = self.mock.sites[1]["id"]
+        with self.assertRaises(TSC.FailedSignInError):
+            self.server.users.get()
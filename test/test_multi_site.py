@@ -0,0 +1,117 @@
+import re
+import threading
+import unittest
+
+import requests_mock
+
+import tableauserverclient as TSC
+from ._utils import read_xml_asset
+
+SIGN_IN_XML = read_xml_asset("auth_sign_in.xml")
+SIGN_IN_ERROR_XML = read_xml_asset("auth_sign_in_error.xml")
+SITE_GET_XML = read_xml_asset("site_get.xml")
+
+
+class MultiSiteExecutorTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = TSC.Server("http://test", False)
+        self.server.version = "3.10"
+
+        # Fake sign in
+        self.server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+        self.server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+
+        self.auth_url = self.server.auth.baseurl
+        self.credentials = TSC.TableauAuth("admin", "password")
+
+    def sign_in_sites(self, m):
+        signed_in = []
+
+        def sign_in(request, context):
+            signed_in.append(re.search(r'contentUrl="([^"]*)"', request.text).group(1))
+            return SIGN_IN_XML
+
+        m.post(f"{self.auth_url}/signin", text=sign_in)
+        m.post(f"{self.auth_url}/signout", text="")
+        return signed_in
+
+    def test_map_all_sites(self) -> None:
+        thread_ids = set()
+
+        def site_name(site_server, site):
+            thread_ids.add(threading.get_ident())
+            self.assertIsNot(self.server, site_server)
+            self.assertEqual("3.10", site_server.version)
+            self.assertEqual("eIX6mvFsqyansa4KqEI1UwOpS8ggRs2l", site_server.auth_token)
+            return site.name
+
+        with requests_mock.mock() as m:
+            m.get(self.server.sites.baseurl, text=SITE_GET_XML)
+            signed_in = self.sign_in_sites(m)
+            results = TSC.MultiSiteExecutor(self.server, self.credentials, max_workers=2).map(site_name)
+            sign_outs = [r for r in m.request_history if r.path.endswith("/signout")]
+
+        self.assertEqual({"": "Default", "Samples": "Samples"}, results.values)
+        self.assertEqual(["", "Samples"], sorted(signed_in))
+        self.assertEqual(2, len(sign_outs))
+        # the credentials passed in are not changed
+        self.assertEqual("", self.credentials.site_id)
+
+    def test_map_records_failures(self) -> None:
+        sites = [TSC.SiteItem("One", "one"), TSC.SiteItem("Two", "two")]
+
+        def fail_on_two(site_server, site):
+            if site.content_url == "two":
+                raise ValueError("broken")
+            return 1
+
+        with requests_mock.mock() as m:
+            self.sign_in_sites(m)
+            results = TSC.MultiSiteExecutor(self.server, self.credentials).map(fail_on_two, sites)
+
+        self.assertEqual({"one": 1}, results.values)
+        self.assertEqual(["two"], [result.site.content_url for result in results.failed])
+        self.assertIsInstance(results.failed[0].error, ValueError)
+
+    def test_map_signs_in_again_after_expiry(self) -> None:
+        calls = []
+
+        def expire_once(site_server, site):
+            calls.append(site.content_url)
+            if len(calls) == 1:
+                raise TSC.FailedSignInError("401002", "Unauthorized Access", "Session expired")
+            return "done"
+
+        with requests_mock.mock() as m:
+            signed_in = self.sign_in_sites(m)
+            results = TSC.MultiSiteExecutor(self.server, self.credentials).map(
+                expire_once, [TSC.SiteItem("One", "one")]
+            )
+
+        self.assertEqual({"one": "done"}, results.values)
+        self.assertEqual(2, results.results[0].attempts)
+        self.assertEqual(["one", "one"], signed_in)
+
+    def test_map_sign_in_failure(self) -> None:
+        with requests_mock.mock() as m:
+            m.post(f"{self.auth_url}/signin", text=SIGN_IN_ERROR_XML, status_code=401)
+            results = TSC.MultiSiteExecutor(self.server, self.credentials).map(
+                lambda site_server, site: None, [TSC.SiteItem("One", "one")]
+            )
+
+        self.assertEqual(1, results.results[0].attempts)
+        self.assertIsInstance(results.results[0].error, TSC.FailedSignInError)
+
+    def test_credentials_function(self) -> None:
+        def credentials(site):
+            return TSC.PersonalAccessTokenAuth(f"token-{site.content_url}", "secret", site.content_url)
+
+        with requests_mock.mock() as m:
+            m.post(f"{self.auth_url}/signin", text=SIGN_IN_XML)
+            m.post(f"{self.auth_url}/signout", text="")
+            TSC.MultiSiteExecutor(self.server, credentials).map(
+                lambda site_server, site: None, [TSC.SiteItem("One", "one")]
+            )
+            body = m.request_history[0].text
+
+        self.assertIn('personalAccessTokenName="token-one"', body)
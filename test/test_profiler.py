@@ -0,0 +1,133 @@
+import gc
+import unittest
+
+import requests_mock
+
+import tableauserverclient as TSC
+from tableauserverclient.server.profiler import EndpointProfile
+from tableauserverclient.server.request_factory import RequestFactory
+from tableauserverclient.server.server import _log_exit_profiles
+from ._utils import read_xml_asset
+
+WORKBOOK_GET_XML = read_xml_asset("workbook_get.xml")
+USER_GET_PAGE_XML = """<?xml version='1.0' encoding='UTF-8'?>
+<tsResponse xmlns="http://tableau.com/api">
+  <pagination pageNumber="{page}" pageSize="1" totalAvailable="2" />
+  <users>
+    <user id="user-{page}" name="user{page}" siteRole="Viewer" />
+  </users>
+</tsResponse>
+"""
+
+
+class ProfilerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = TSC.Server("http://test", False)
+        self.server.version = "3.10"
+
+        # Fake signin
+        self.server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+        self.server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+
+    def test_endpoint_call(self) -> None:
+        with requests_mock.mock() as m:
+            m.get(self.server.workbooks.baseurl, text=WORKBOOK_GET_XML)
+            with self.server.profile() as profiler:
+                self.server.workbooks.get()
+            # calls made after the block are not profiled
+            self.server.workbooks.get()
+
+        self.assertIsNone(self.server.profiler)
+        results = profiler.results()
+        self.assertEqual(["Workbooks.get"], list(results))
+        workbooks = results["Workbooks.get"]
+        self.assertEqual(1, workbooks["calls"])
+        self.assertEqual(1, workbooks["requests"])
+        self.assertEqual(2, workbooks["objects"])
+        self.assertEqual(len(WORKBOOK_GET_XML.encode()), workbooks["bytes_received"])
+        self.assertGreater(workbooks["wall"], 0)
+        self.assertGreaterEqual(workbooks["wall"], workbooks["parse"])
+        self.assertIn("Workbooks.get", profiler.report())
+
+    def test_request_builder(self) -> None:
+        workbook = TSC.WorkbookItem("project-id", name="Sales")
+        workbook._id = "3cc6cd06-89ce-4fdc-b935-5294135d6d42"
+        with requests_mock.mock() as m:
+            m.put(f"{self.server.workbooks.baseurl}/{workbook.id}", text=WORKBOOK_GET_XML)
+            with self.server.profile() as profiler:
+                self.server.workbooks.update(workbook)
+
+        results = profiler.results()["Workbooks.update"]
+        self.assertEqual(1, results["requests"])
+        self.assertGreater(results["bytes_sent"], 0)
+        self.assertGreater(results["build"], 0)
+
+    def test_pager(self) -> None:
+        with requests_mock.mock() as m:
+            for page in (1, 2):
+                m.get(
+                    f"{self.server.users.baseurl}?pageNumber={page}",
+                    text=USER_GET_PAGE_XML.format(page=page),
+                    complete_qs=False,
+                )
+            with self.server.profile() as profiler:
+                users = list(TSC.Pager(self.server.users, TSC.RequestOptions(pagesize=1)))
+
+        self.assertEqual(["user-1", "user-2"], [user.id for user in users])
+        results = profiler.results()
+        self.assertEqual(2, results["Pager[Users]"]["calls"])
+        self.assertEqual(2, results["Pager[Users]"]["objects"])
+        self.assertEqual(2, results["Users.get"]["requests"])
+
+    def test_profile_option(self) -> None:
+        server = TSC.Server("http://test", False, profile=True)
+        self.assertIsInstance(server.profiler, TSC.Profiler)
+        self.assertIsNone(TSC.Server("http://test", False).profiler)
+        profiler = server.profiler
+        assert profiler is not None
+        profiler.profiles["Workbooks.get"] = EndpointProfile("Workbooks.get")
+        with self.assertLogs("TSC", "INFO") as logs:
+            _log_exit_profiles()
+
+        self.assertTrue(profiler.closed)
+        self.assertIn("Workbooks.get", logs.output[0])
+
+    def test_profile_option_sign_out(self) -> None:
+        server = TSC.Server("http://test", False, profile=True)
+        server.version = "3.10"
+        server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+        server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+        profiler = server.profiler
+        assert profiler is not None
+        with requests_mock.mock() as m:
+            m.post("http://test/api/3.10/auth/signout", text="")
+            with self.assertLogs("TSC", "INFO") as logs:
+                server.auth.sign_out()
+
+        self.assertTrue(profiler.closed)
+        self.assertIsNone(server.profiler)
+        self.assertTrue(any("Auth.sign_out" in line for line in logs.output))
+
+    def test_profile_option_discarded(self) -> None:
+        server = TSC.Server("http://test", False, profile=True)
+        profiler = server.profiler
+        assert profiler is not None
+        profiler.profiles["Workbooks.get"] = EndpointProfile("Workbooks.get")
+        with self.assertLogs("TSC", "INFO") as logs:
+            del server
+            gc.collect()
+
+        self.assertTrue(profiler.closed)
+        self.assertIn("Workbooks.get", logs.output[0])
+
+    def test_methods_are_restored(self) -> None:
+        from_response = TSC.WorkbookItem.__dict__["from_response"]
+        update_req = RequestFactory.Workbook.__class__.__dict__["update_req"]
+        with self.server.profile():
+            with self.server.profile():
+                self.assertTrue(hasattr(TSC.WorkbookItem.__dict__["from_response"].__func__, "__wrapped__"))
+            # still wrapped for the outer profiler
+            self.assertTrue(hasattr(TSC.WorkbookItem.__dict__["from_response"].__func__, "__wrapped__"))
+
+        self.assertIs(from_response, TSC.WorkbookItem.__dict__["from_response"])
+        self.assertIs(update_req, RequestFactory.Workbook.__class__.__dict__["update_req"])
@@ -30,6 +30,15 @@ class ProjectTests(unittest.TestCase):
 
         self.baseurl = self.server.projects.baseurl
 
+    def test_prefetch_default_permissions(self) -> None:
+        project = TSC.ProjectItem("test")
+        project._id = "9dbd2263-16b5-46e1-9c43-a76bb8ab65fb"
+        with requests_mock.mock() as m:
+            # default permissions are not stored on the project under their populate name
+            with self.assertRaises(ValueError):
+                self.server.projects.prefetch([project], "workbook_default_permissions")
+            self.assertEqual(0, m.call_count)
+
     def test_get(self) -> None:
         with open(GET_XML, "rb") as f:
             response_xml = f.read().decode("utf-8")
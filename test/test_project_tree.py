@@ -0,0 +1,127 @@
+import unittest
+from unittest import mock
+from urllib.parse import unquote, unquote_plus
+
+import requests_mock
+
+import tableauserverclient as TSC
+from ._utils import read_xml_asset
+
+HIERARCHY_XML = "project_get_hierarchy.xml"
+
+FINANCE_ID = "1d0304cd-3796-429f-b815-7258370b9b74"
+REPORTING_ID = "4cc52973-5e3a-4d1f-a4fb-5b5f73796edf"
+MONTHLY_ID = "9a8b7c6d-0000-4d1f-a4fb-5b5f73796edf"
+OTHER_REPORTING_ID = "5b6c7d8e-1111-4d1f-a4fb-5b5f73796edf"
+
+UPDATED_XML = """<?xml version='1.0' encoding='UTF-8'?>
+<tsResponse xmlns="http://tableau.com/api">
+    <pagination pageNumber="1" pageSize="1000" totalAvailable="1" />
+    <projects>
+        <project id="{id}" name="Monthly Close" parentProjectId="{parent}" updatedAt="2020-02-01T10:00:00Z" />
+    </projects>
+</tsResponse>
+"""
+
+WORKBOOKS_XML = """<?xml version='1.0' encoding='UTF-8'?>
+<tsResponse xmlns="http://tableau.com/api">
+    <pagination pageNumber="1" pageSize="1000" totalAvailable="3" />
+    <workbooks>
+        <workbook id="wb-1" name="In Reporting"><project id="{reporting}" name="Reporting" /></workbook>
+        <workbook id="wb-2" name="In Monthly"><project id="{monthly}" name="Monthly" /></workbook>
+        <workbook id="wb-3" name="Same Name"><project id="{other}" name="Reporting" /></workbook>
+    </workbooks>
+</tsResponse>
+""".format(
+    reporting=REPORTING_ID, monthly=MONTHLY_ID, other=OTHER_REPORTING_ID
+)
+
+
+class ProjectTreeTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = TSC.Server("http://test", False)
+        self.server.version = "3.10"
+
+        # Fake signin
+        self.server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+        self.server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+
+        self.baseurl = self.server.projects.baseurl
+
+    def build(self) -> TSC.ProjectTree:
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, text=read_xml_asset(HIERARCHY_XML))
+            return TSC.ProjectTree(self.server).refresh()
+
+    def test_lookups(self) -> None:
+        tree = self.build()
+
+        self.assertEqual(5, len(tree))
+        self.assertEqual(MONTHLY_ID, getattr(tree.get_by_path("Finance/Reporting/Monthly"), "id", None))
+        self.assertEqual(MONTHLY_ID, getattr(tree.get_by_path(["Finance", "Reporting", "Monthly"]), "id", None))
+        self.assertEqual(OTHER_REPORTING_ID, getattr(tree.get_by_path("Reporting"), "id", None))
+        self.assertIsNone(tree.get_by_path("Finance/Missing"))
+        self.assertEqual("Finance/Reporting/Monthly", tree.path(MONTHLY_ID))
+        self.assertEqual([REPORTING_ID, FINANCE_ID], [p.id for p in tree.ancestors(MONTHLY_ID)])
+        self.assertEqual({REPORTING_ID, MONTHLY_ID}, {p.id for p in tree.descendants(FINANCE_ID)})
+        finance = tree.get(FINANCE_ID)
+        assert finance is not None
+        self.assertEqual([REPORTING_ID], [p.id for p in tree.children(finance)])
+        self.assertEqual(3, len(tree.roots()))
+        with self.assertRaises(KeyError):
+            tree.path("missing")
+
+    def test_names_with_separator(self) -> None:
+        other = f'id="{OTHER_REPORTING_ID}" name="Reporting"'
+        response = read_xml_asset(HIERARCHY_XML).replace(other, f'id="{OTHER_REPORTING_ID}" name="Finance/Reporting"')
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, text=response)
+            tree = TSC.ProjectTree(self.server).refresh()
+
+        self.assertEqual(OTHER_REPORTING_ID, getattr(tree.get_by_path(["Finance/Reporting"]), "id", None))
+        self.assertEqual(REPORTING_ID, getattr(tree.get_by_path(["Finance", "Reporting"]), "id", None))
+        self.assertEqual(MONTHLY_ID, getattr(tree.get_by_path("Finance/Reporting/Monthly"), "id", None))
+        with self.assertRaises(ValueError):
+            tree.get_by_path("Finance/Reporting")
+
+    def test_incremental_refresh(self) -> None:
+        tree = self.build()
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, text=UPDATED_XML.format(id=MONTHLY_ID, parent=OTHER_REPORTING_ID))
+            tree.refresh()
+            query = unquote(m.last_request.query)
+
+        self.assertIn("updatedat:gte:2020-01-05t10:00:00z", query)
+        self.assertEqual(5, len(tree))
+        self.assertEqual("Reporting/Monthly Close", tree.path(MONTHLY_ID))
+        self.assertEqual([], tree.descendants(REPORTING_ID))
+        assert tree.last_updated_at is not None
+        self.assertEqual(2020, tree.last_updated_at.year)
+        self.assertEqual(2, tree.last_updated_at.month)
+
+    def test_iter_content(self) -> None:
+        tree = self.build()
+        with requests_mock.mock() as m:
+            m.get(self.server.workbooks.baseurl, text=WORKBOOKS_XML)
+            workbooks = list(tree.iter_content(self.server.workbooks, FINANCE_ID))
+            query = unquote(m.last_request.query)
+
+        self.assertIn("projectname:in:[finance,monthly,reporting]", query)
+        self.assertEqual(["wb-1", "wb-2"], [w.id for w in workbooks])
+        self.assertEqual(["wb-2"], [w.id for w in tree.filter_content(workbooks, MONTHLY_ID)])
+
+    def test_iter_content_batches_names(self) -> None:
+        tree = self.build()
+        monthly = tree.get(MONTHLY_ID)
+        assert monthly is not None
+        monthly.name = "Bob's, Monthly"
+        with requests_mock.mock() as m:
+            m.get(self.server.workbooks.baseurl, text=WORKBOOKS_XML)
+            with mock.patch("tableauserverclient.server.project_tree.NAMES_PER_REQUEST", 1):
+                list(tree.iter_content(self.server.workbooks, FINANCE_ID))
+            queries = [unquote_plus(r.query) for r in m.request_history]
+
+        self.assertEqual(3, len(queries))
+        self.assertIn("projectname:eq:finance", queries[0])
+        self.assertIn("projectname:eq:reporting", queries[1])
+        self.assertIn("projectname:eq:bob's, monthly", queries[2])
@@ -0,0 +1,175 @@
+import os
+import tempfile
+import unittest
+
+import requests_mock
+
+import tableauserverclient as TSC
+from ._utils import mocked_time
+
+JOB_XML = """<?xml version='1.0' encoding='UTF-8'?>
+<tsResponse xmlns="http://tableau.com/api">
+  <job id="{job_id}" mode="Asynchronous" type="RefreshExtract" createdAt="2020-03-05T22:05:32Z" {extra}/>
+</tsResponse>
+"""
+
+COMPLETED = 'startedAt="2020-03-05T22:05:40Z" completedAt="2020-03-05T22:06:40Z" finishCode="{code}"'
+
+
+def job_xml(job_id: str, completed: bool = True, finish_code: int = 0) -> str:
+    extra = COMPLETED.format(code=finish_code) if completed else ""
+    return JOB_XML.format(job_id=job_id, extra=extra)
+
+
+def make_datasource(id_: str) -> TSC.DatasourceItem:
+    datasource = TSC.DatasourceItem("project-id")
+    datasource._id = id_
+    return datasource
+
+
+class RefreshOrchestratorTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = TSC.Server("http://test", False)
+        self.server.version = "3.1"
+
+        # Fake signin
+        self.server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+        self.server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+
+        self.ds_baseurl = self.server.datasources.baseurl
+        self.wb_baseurl = self.server.workbooks.baseurl
+        self.jobs_baseurl = self.server.jobs.baseurl
+
+    def mock_refresh(self, m, baseurl: str, item_id: str, **kwargs) -> None:
+        m.post(f"{baseurl}/{item_id}/refresh", status_code=202, text=job_xml(f"job-{item_id}", completed=False))
+        m.get(f"{self.jobs_baseurl}/job-{item_id}", text=job_xml(f"job-{item_id}", **kwargs))
+
+    def test_longest_first_within_priority(self) -> None:
+        history = TSC.RefreshHistory()
+        history.record("short", 10)
+        history.record("long", 500)
+        orchestrator = TSC.RefreshOrchestrator(self.server, max_concurrent_jobs=1, history=history)
+        for id_ in ("short", "long", "unknown"):
+            orchestrator.add(make_datasource(id_))
+        orchestrator.add(make_datasource("urgent"), priority=1)
+
+        with mocked_time(), requests_mock.mock() as m:
+            for id_ in ("short", "long", "unknown", "urgent"):
+                self.mock_refresh(m, self.ds_baseurl, id_)
+            results = orchestrator.run()
+
+        self.assertEqual(["urgent", "unknown", "long", "short"], [r.item.id for r in results])
+        self.assertTrue(all(r.succeeded for r in results))
+        self.assertEqual(0, len(orchestrator))
+
+    def test_concurrency_cap(self) -> None:
+        orchestrator = TSC.RefreshOrchestrator(self.server, max_concurrent_jobs=2)
+        orchestrator.add_all(make_datasource(id_) for id_ in ("a", "b", "c"))
+
+        with mocked_time(), requests_mock.mock() as m:
+            for id_ in ("a", "b", "c"):
+                self.mock_refresh(m, self.ds_baseurl, id_)
+            orchestrator.run()
+            methods = [r.method for r in m.request_history]
+
+        # the third refresh is only submitted after a job was seen to complete
+        self.assertEqual(["POST", "POST", "GET"], methods[:3])
+        self.assertEqual(3, methods.count("POST"))
+
+    def test_incremental_and_workbooks(self) -> None:
+        workbook = TSC.WorkbookItem("project-id")
+        workbook._id = "wb"
+        orchestrator = TSC.RefreshOrchestrator(self.server)
+        orchestrator.add(workbook, incremental=True)
+
+        with mocked_time(), requests_mock.mock() as m:
+            self.mock_refresh(m, self.wb_baseurl, "wb")
+            results = orchestrator.run()
+            body = m.request_history[0].body
+
+        self.assertIn(b'incremental="true"', body)
+        assert results[0].job is not None
+        self.assertEqual("job-wb", results[0].job.id)
+
+    def test_records_history(self) -> None:
+        orchestrator = TSC.RefreshOrchestrator(self.server)
+        orchestrator.add(make_datasource("ok"))
+        orchestrator.add(make_datasource("failed"))
+
+        with mocked_time(), requests_mock.mock() as m:
+            self.mock_refresh(m, self.ds_baseurl, "ok")
+            self.mock_refresh(m, self.ds_baseurl, "failed", finish_code=1)
+            results = {r.item.id: r for r in orchestrator.run()}
+
+        self.assertEqual(60, results["ok"].duration)
+        self.assertEqual([60], orchestrator.history.durations("ok"))
+        self.assertFalse(results["failed"].succeeded)
+        self.assertNotIn("failed", orchestrator.history)
+
+    def test_submit_error(self) -> None:
+        orchestrator = TSC.RefreshOrchestrator(self.server)
+        orchestrator.add(make_datasource("broken"))
+
+        with mocked_time(), requests_mock.mock() as m:
+            m.post(f"{self.ds_baseurl}/broken/refresh", status_code=500)
+            results = orchestrator.run()
+
+        self.assertIsNone(results[0].job)
+        self.assertIsInstance(results[0].error, TSC.server.endpoint.exceptions.InternalServerError)
+
+    def test_poll_errors(self) -> None:
+        orchestrator = TSC.RefreshOrchestrator(self.server, max_poll_errors=3)
+        orchestrator.add(make_datasource("flaky"))
+        orchestrator.add(make_datasource("lost"))
+
+        with mocked_time(), requests_mock.mock() as m:
+            self.mock_refresh(m, self.ds_baseurl, "flaky")
+            self.mock_refresh(m, self.ds_baseurl, "lost")
+            m.get(
+                f"{self.jobs_baseurl}/job-flaky",
+                [{"status_code": 500}, {"status_code": 500}, {"text": job_xml("job-flaky")}],
+            )
+            m.get(f"{self.jobs_baseurl}/job-lost", status_code=500)
+            results = {r.item.id: r for r in orchestrator.run()}
+            lost_polls = sum(1 for r in m.request_history if r.path.endswith("/job-lost"))
+
+        self.assertTrue(results["flaky"].succeeded)
+        self.assertIsNone(results["flaky"].error)
+        self.assertFalse(results["lost"].succeeded)
+        self.assertIsInstance(results["lost"].error, TSC.server.endpoint.exceptions.InternalServerError)
+        self.assertEqual(3, lost_polls)
+
+    def test_poll_errors_stop_admissions(self) -> None:
+        orchestrator = TSC.RefreshOrchestrator(self.server, max_concurrent_jobs=1, max_poll_errors=2)
+        orchestrator.add_all(make_datasource(id_) for id_ in ("lost", "next"))
+
+        with mocked_time(), requests_mock.mock() as m:
+            self.mock_refresh(m, self.ds_baseurl, "lost")
+            self.mock_refresh(m, self.ds_baseurl, "next")
+            m.get(f"{self.jobs_baseurl}/job-lost", status_code=500)
+            results = orchestrator.run()
+            submitted = [r.path for r in m.request_history if r.method == "POST"]
+
+        # the lost job may still be running, so starting the next one could exceed the cap
+        self.assertEqual(["lost"], [r.item.id for r in results])
+        self.assertEqual(1, len(submitted))
+        self.assertEqual(1, len(orchestrator))
+
+    def test_rejects_other_items(self) -> None:
+        orchestrator = TSC.RefreshOrchestrator(self.server)
+        with self.assertRaises(TypeError):
+            orchestrator.add(TSC.ViewItem())  # type: ignore[arg-type]
+
+    def test_history_round_trip(self) -> None:
+        history = TSC.RefreshHistory(max_samples=2)
+        for duration in (1, 2, 3):
+            history.record("item", duration)
+        self.assertEqual([2, 3], history.durations("item"))
+        self.assertEqual(2.5, history.expected_duration("item"))
+
+        with tempfile.TemporaryDirectory() as td:
+            path = os.path.join(td, "history.json")
+            history.save(path)
+            loaded = TSC.RefreshHistory.load(path)
+            self.assertEqual([2, 3], loaded.durations("item"))
+            self.assertIsNone(TSC.RefreshHistory.load(os.path.join(td, "missing.json")).expected_duration("x"))
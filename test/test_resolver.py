@@ -0,0 +1,89 @@
+import unittest
+from unittest import mock
+from urllib.parse import unquote
+
+import requests_mock
+
+import tableauserverclient as TSC
+from ._utils import read_xml_asset
+
+ALICE_ID = "dd2239f6-ddf1-4107-981a-4cf94e415794"
+BOB_ID = "2a47bbf8-8900-4ebb-b0a4-2723bd7c46c3"
+FINANCE_ID = "1d0304cd-3796-429f-b815-7258370b9b74"
+
+
+class NameResolverTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = TSC.Server("http://test", False)
+        self.server.version = "3.10"
+
+        # Fake signin
+        self.server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+        self.server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+
+        self.resolver = self.server.resolver
+
+    def test_batches_and_caches(self) -> None:
+        with requests_mock.mock() as m:
+            m.get(self.server.users.baseurl, text=read_xml_asset("user_get.xml"))
+            resolved = self.resolver.resolve_many("users", ["alice", "Bob", "carol"])
+            query = unquote(m.last_request.query)
+            self.assertEqual(ALICE_ID, self.resolver.resolve("users", "alice"))
+            self.assertEqual(1, m.call_count)
+
+        self.assertIn("name:in:[alice,bob,carol]", query)
+        self.assertEqual({"alice": ALICE_ID, "Bob": BOB_ID}, resolved)
+
+    def test_names_ignore_case(self) -> None:
+        with requests_mock.mock() as m:
+            m.get(self.server.users.baseurl, text=read_xml_asset("user_get.xml"))
+            self.assertEqual(BOB_ID, self.resolver.resolve("users", "bob"))
+            # the server matched bob to Bob, so later lookups in any case are cached
+            self.assertEqual({"BOB": BOB_ID, "bob": BOB_ID}, self.resolver.resolve_many("users", ["BOB", "bob"]))
+            self.assertEqual(1, m.call_count)
+
+    def test_unknown_and_ambiguous_names(self) -> None:
+        with requests_mock.mock() as m:
+            m.get(self.server.projects.baseurl, text=read_xml_asset("project_get_hierarchy.xml"))
+            self.assertEqual(4, self.resolver.warm("projects"))
+            with self.assertRaises(ValueError):
+                self.resolver.resolve("projects", "Reporting")
+        self.assertEqual(FINANCE_ID, self.resolver.resolve("projects", "Finance"))
+        with self.assertRaises(ValueError):
+            self.resolver.resolve("workbooks", "Superstore")
+
+    def test_ttl_and_lru(self) -> None:
+        resolver = TSC.NameResolver(self.server, ttl=10, max_size=2)
+        with mock.patch("time.monotonic", return_value=100):
+            resolver.store("users", "a", "1")
+            resolver.store("users", "b", "2")
+            self.assertEqual({"a": "1"}, resolver.resolve_many("users", ["a"]))
+            resolver.store("users", "c", "3")
+            # b was the least recently used
+            self.assertEqual(["a", "c"], sorted(key[2] for key in resolver._cache))
+        with mock.patch("time.monotonic", return_value=111), requests_mock.mock() as m:
+            m.get(self.server.users.baseurl, text=read_xml_asset("user_get_empty.xml"))
+            self.assertEqual({}, resolver.resolve_many("users", ["a"]))
+
+    def test_invalidated_by_endpoints(self) -> None:
+        self.resolver.store("projects", "Finance", FINANCE_ID)
+        self.resolver.store("users", "alice", ALICE_ID)
+        with requests_mock.mock() as m:
+            m.put(f"{self.server.projects.baseurl}/{FINANCE_ID}", text=read_xml_asset("project_update.xml"))
+            m.delete(f"{self.server.users.baseurl}/{ALICE_ID}", status_code=204)
+            m.post(self.server.users.baseurl, text=read_xml_asset("user_add.xml"))
+            project = TSC.ProjectItem("Test Project")
+            project._id = FINANCE_ID
+            self.server.projects.update(project)
+            self.server.users.remove(ALICE_ID)
+            new_user = self.server.users.add(TSC.UserItem("Cassie", TSC.UserItem.Roles.Viewer))
+
+        self.assertEqual(1, len(self.resolver))
+        self.assertEqual(new_user.id, self.resolver.resolve("users", "Cassie"))
+
+    def test_sites(self) -> None:
+        with requests_mock.mock() as m:
+            m.get(f"{self.server.sites.baseurl}/testsite?key=name", text=read_xml_asset("site_get_by_name.xml"))
+            self.assertEqual("0626857c-1def-4503-a7d8-7907c3ff9d9f", self.resolver.resolve("sites", "testsite"))
+            self.resolver.resolve("sites", "testsite")
+            self.assertEqual(1, m.call_count)
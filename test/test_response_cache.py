@@ -0,0 +1,111 @@
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import requests_mock
+
+import tableauserverclient as TSC
+from ._utils import read_xml_asset
+
+PROJECT_GET_XML = read_xml_asset("project_get.xml")
+PROJECT_UPDATE_XML = read_xml_asset("project_update.xml")
+WORKBOOK_GET_XML = read_xml_asset("workbook_get.xml")
+SERVER_INFO_XML = read_xml_asset("server_info_get.xml")
+
+PROJECT_ID = "1d0304cd-3796-429f-b815-7258370b9b74"
+
+
+class ResponseCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = self.new_server(TSC.InMemoryResponseCache())
+
+    def new_server(self, cache):
+        server = TSC.Server("http://test", False)
+        server.version = "3.10"
+
+        # Fake signin
+        server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+        server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+        server._user_id = "5de011f8-5aa9-4d5b-b991-f462c8dd6bb7"
+        server.response_cache = cache
+        return server
+
+    def test_reference_data_is_cached(self) -> None:
+        with requests_mock.mock() as m:
+            m.get(self.server.projects.baseurl, text=PROJECT_GET_XML)
+            m.get(self.server.workbooks.baseurl, text=WORKBOOK_GET_XML)
+            first, _ = self.server.projects.get()
+            second, _ = self.server.projects.get()
+            self.server.workbooks.get()
+            self.server.workbooks.get()
+            self.server._user_id = "another-user"
+            self.server.projects.get()
+
+        calls = [r.path.rsplit("/", 1)[-1] for r in m.request_history]
+        self.assertEqual(["projects", "workbooks", "workbooks", "projects"], calls)
+        self.assertEqual([p.id for p in first], [p.id for p in second])
+        self.assertEqual(1, self.server.response_cache.hits)
+
+    def test_changes_invalidate(self) -> None:
+        with requests_mock.mock() as m:
+            m.get(self.server.projects.baseurl, text=PROJECT_GET_XML)
+            m.put(f"{self.server.projects.baseurl}/{PROJECT_ID}", text=PROJECT_UPDATE_XML)
+            self.server.projects.get()
+            project = TSC.ProjectItem("Test Project")
+            project._id = PROJECT_ID
+            self.server.projects.update(project)
+            self.server.projects.get()
+
+        self.assertEqual(["GET", "PUT", "GET"], [r.method for r in m.request_history])
+        self.assertEqual(2, self.server.response_cache.misses)
+
+    def test_expired_response_is_revalidated(self) -> None:
+        self.server.response_cache = TSC.InMemoryResponseCache(policies={"serverInfo": 0.05})
+        with requests_mock.mock() as m:
+            m.get(
+                self.server.server_info.baseurl,
+                [
+                    {"text": SERVER_INFO_XML, "headers": {"ETag": '"v1"'}},
+                    {"status_code": 304, "text": ""},
+                ],
+            )
+            self.server.server_info.get()
+            time.sleep(0.1)
+            info = self.server.server_info.get()
+
+        self.assertEqual("3.10", info.rest_api_version)
+        self.assertEqual('"v1"', m.last_request.headers["If-None-Match"])
+        self.assertEqual(1, self.server.response_cache.revalidated)
+
+    def test_file_cache_is_shared(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            with requests_mock.mock() as m:
+                m.get(self.server.projects.baseurl, text=PROJECT_GET_XML)
+                self.new_server(TSC.FileResponseCache(directory)).projects.get()
+                projects, _ = self.new_server(TSC.FileResponseCache(directory)).projects.get()
+
+        self.assertEqual(1, m.call_count)
+        self.assertEqual(3, len(projects))
+
+    def test_file_cache_invalidates_from_file_names(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            cache = TSC.FileResponseCache(directory)
+            server = self.new_server(cache)
+            with requests_mock.mock() as m:
+                m.get(server.projects.baseurl, text=PROJECT_GET_XML)
+                m.get(server.server_info.baseurl, text=SERVER_INFO_XML)
+                server.projects.get()
+                server.server_info.get()
+
+            # the entries of a resource are found without reading any of them
+            with mock.patch("json.load", side_effect=AssertionError):
+                self.assertEqual(1, cache.invalidate(f"{server.projects.baseurl}/{PROJECT_ID}"))
+                self.assertEqual(0, cache.invalidate(f"{server.projects.baseurl}/{PROJECT_ID}"))
+            with requests_mock.mock() as m:
+                m.get(server.projects.baseurl, text=PROJECT_GET_XML)
+                server.projects.get()
+            with mock.patch("json.load", side_effect=AssertionError):
+                # a change to the site drops its responses but not the server info
+                self.assertEqual(1, cache.invalidate(f"{server.baseurl}/sites/{server.site_id}"))
+                self.assertEqual(1, cache.invalidate(server.server_info.baseurl))
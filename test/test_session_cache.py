@@ -0,0 +1,157 @@
+import base64
+import os
+import stat
+import tempfile
+import unittest
+
+import requests_mock
+
+import tableauserverclient as TSC
+from ._utils import read_xml_asset
+
+SERVER_INFO_XML = read_xml_asset("server_info_get.xml")
+SIGN_IN_XML = read_xml_asset("auth_sign_in.xml")
+SIGN_IN_ERROR_XML = read_xml_asset("auth_sign_in_error.xml")
+WORKBOOK_GET_XML = read_xml_asset("workbook_get.xml")
+
+SITE_ID = "6b7179ba-b82b-4f0f-91ed-812074ac5da6"
+TOKEN = "eIX6mvFsqyansa4KqEI1UwOpS8ggRs2l"
+
+
+class SessionCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, "sessions.json")
+        self.cache = TSC.SessionCache(self.path)
+        self.credentials = TSC.PersonalAccessTokenAuth("ops", "secret", site_id="Samples")
+
+    def new_server(self, use_server_version=False):
+        return TSC.Server("http://test", use_server_version=use_server_version, session_cache=self.cache)
+
+    def test_version_is_cached(self) -> None:
+        with requests_mock.mock() as m:
+            m.get("http://test/api/2.4/serverInfo", text=SERVER_INFO_XML)
+            first = self.new_server(use_server_version=True)
+            second = self.new_server(use_server_version=True)
+
+        self.assertEqual("3.10", first.version)
+        self.assertEqual("3.10", second.version)
+        self.assertEqual(1, m.call_count)
+
+    def test_sign_in_is_cached(self) -> None:
+        with requests_mock.mock() as m:
+            m.post("http://test/api/2.4/auth/signin", text=SIGN_IN_XML)
+            self.new_server().auth.sign_in(self.credentials)
+            server = self.new_server()
+            server.auth.sign_in(self.credentials)
+
+        self.assertEqual(1, m.call_count)
+        self.assertEqual(TOKEN, server.auth_token)
+        self.assertEqual(SITE_ID, server.site_id)
+        self.assertEqual("Samples", server.site_url)
+        # without a cipher the session is only kept in memory
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_version_file_is_private(self) -> None:
+        self.cache.set_version("http://test", "3.10")
+        self.assertEqual(0o600, stat.S_IMODE(os.stat(self.path).st_mode))
+
+    def test_plain_text_sessions_are_dropped(self) -> None:
+        with open(self.path, "w") as f:
+            f.write(f'{{"sessions": {{"key": {{"token": "{TOKEN}", "expires_at": 1e12}}}}}}')
+        self.cache.set_version("http://test", "3.10")
+        with open(self.path) as f:
+            self.assertNotIn(TOKEN, f.read())
+        self.assertEqual("3.10", self.cache.get_version("http://test"))
+
+    def test_changed_credentials_sign_in(self) -> None:
+        with requests_mock.mock() as m:
+            m.post("http://test/api/2.4/auth/signin", text=SIGN_IN_XML)
+            self.new_server().auth.sign_in(self.credentials)
+            self.new_server().auth.sign_in(TSC.PersonalAccessTokenAuth("ops", "rotated", site_id="Samples"))
+            self.new_server().auth.sign_in(TSC.PersonalAccessTokenAuth("ops", "secret", site_id="Other"))
+
+        self.assertEqual(3, m.call_count)
+
+    def test_expired_token_signs_in_again(self) -> None:
+        self.cache.set_session("http://test", self.credentials, SITE_ID, "user", "stale-token", "Samples")
+        server = self.new_server()
+        server.auth.sign_in(self.credentials)
+        self.assertEqual("stale-token", server.auth_token)
+
+        with requests_mock.mock() as m:
+            m.post("http://test/api/2.4/auth/signin", text=SIGN_IN_XML)
+            m.get(
+                server.workbooks.baseurl,
+                [{"text": SIGN_IN_ERROR_XML, "status_code": 401}, {"text": WORKBOOK_GET_XML}],
+            )
+            workbooks, _ = server.workbooks.get()
+
+        self.assertEqual(2, len(workbooks))
+        self.assertEqual(TOKEN, server.auth_token)
+        tokens = [r.headers.get("x-tableau-auth") for r in m.request_history if r.method == "GET"]
+        self.assertEqual(["stale-token", TOKEN], tokens)
+        session = self.cache.get_session("http://test", self.credentials)
+        assert session is not None
+        self.assertEqual(TOKEN, session["token"])
+
+    def test_token_replaced_by_another_thread(self) -> None:
+        self.cache.set_session("http://test", self.credentials, SITE_ID, "user", "stale-token", "Samples")
+        server = self.new_server()
+        server.auth.sign_in(self.credentials)
+        server._auth_token = TOKEN
+
+        with requests_mock.mock() as m:
+            self.assertTrue(server._reauthenticate("stale-token"))
+
+        self.assertEqual(0, m.call_count)
+        self.assertEqual(TOKEN, server.auth_token)
+
+    def test_unauthorized_without_cache_is_raised(self) -> None:
+        server = TSC.Server("http://test", False)
+        server._site_id = SITE_ID
+        server._auth_token = "token"
+        with requests_mock.mock() as m:
+            m.get(server.workbooks.baseurl, text=SIGN_IN_ERROR_XML, status_code=401)
+            with self.assertRaises(TSC.FailedSignInError):
+                server.workbooks.get()
+
+    def test_sign_out_drops_session(self) -> None:
+        with requests_mock.mock() as m:
+            m.post("http://test/api/2.4/auth/signin", text=SIGN_IN_XML)
+            m.post("http://test/api/2.4/auth/signout", text="")
+            server = self.new_server()
+            server.auth.sign_in(self.credentials)
+            server.auth.sign_out()
+
+        self.assertIsNone(self.cache.get_session("http://test", self.credentials))
+
+    def test_expiration_from_response(self) -> None:
+        response = SIGN_IN_XML.replace(f'token="{TOKEN}"', f'token="{TOKEN}" estimatedTimeToExpiration="000:00:00"')
+        with requests_mock.mock() as m:
+            m.post("http://test/api/2.4/auth/signin", text=response)
+            self.new_server().auth.sign_in(self.credentials)
+
+        self.assertIsNone(self.cache.get_session("http://test", self.credentials))
+
+    def test_encrypted(self) -> None:
+        def encrypt(content):
+            return base64.b64encode(content[::-1])
+
+        def decrypt(content):
+            return base64.b64decode(content)[::-1]
+
+        cache = TSC.SessionCache(self.path, encrypt=encrypt, decrypt=decrypt)
+        cache.set_session("http://test", self.credentials, SITE_ID, "user", TOKEN, "Samples")
+        with open(self.path, "rb") as f:
+            self.assertNotIn(TOKEN.encode(), f.read())
+        self.assertEqual(0o600, stat.S_IMODE(os.stat(cache.key_path).st_mode))
+        # a later run finds the session with the same key
+        session = TSC.SessionCache(self.path, encrypt=encrypt, decrypt=decrypt).get_session(
+            "http://test", self.credentials
+        )
+        assert session is not None
+        self.assertEqual(TOKEN, session["token"])
+        # a cache without the key reads nothing rather than failing
+        self.assertIsNone(TSC.SessionCache(self.path).get_session("http://test", self.credentials))
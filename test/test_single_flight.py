@@ -0,0 +1,121 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import requests_mock
+
+import tableauserverclient as TSC
+from tableauserverclient.server.single_flight import SingleFlight
+from ._utils import read_xml_asset
+
+USER_GET_BY_ID_XML = read_xml_asset("user_get_by_id.xml")
+USER_ID = "dd2239f6-ddf1-4107-981a-4cf94e415794"
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Condition not met in time")
+        time.sleep(0.001)
+
+
+class SingleFlightTests(unittest.TestCase):
+    def test_concurrent_calls_share_result(self) -> None:
+        single_flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            release.wait(5)
+            return "result"
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(single_flight.do, "key", slow) for _ in range(4)]
+            wait_for(lambda: single_flight.coalesced == 3)
+            release.set()
+            results = [future.result() for future in futures]
+
+        self.assertEqual(["result"] * 4, results)
+        self.assertEqual(1, len(calls))
+        # the key is forgotten once the call returns
+        self.assertEqual("again", single_flight.do("key", lambda: "again"))
+
+    def test_error_is_shared(self) -> None:
+        single_flight = SingleFlight()
+        release = threading.Event()
+
+        def failing():
+            release.wait(5)
+            raise ValueError("failed")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(single_flight.do, "key", failing) for _ in range(2)]
+            wait_for(lambda: single_flight.coalesced == 1)
+            release.set()
+            for future in futures:
+                with self.assertRaises(ValueError):
+                    future.result()
+
+
+class CoalescedRequestTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = TSC.Server("http://test", False)
+        self.server.version = "3.10"
+        self.server.coalesce_requests = True
+
+        # Fake sign in
+        self.server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+        self.server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+
+    def test_identical_gets_are_coalesced(self) -> None:
+        release = threading.Event()
+
+        def respond(request, context):
+            release.wait(5)
+            return USER_GET_BY_ID_XML
+
+        with requests_mock.mock() as m:
+            m.get(f"{self.server.users.baseurl}/{USER_ID}", text=respond)
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                futures = [executor.submit(self.server.users.get_by_id, USER_ID) for _ in range(5)]
+                wait_for(lambda: self.server._single_flight.coalesced == 4)
+                release.set()
+                users = [future.result() for future in futures]
+
+        self.assertEqual(1, m.call_count)
+        self.assertEqual({USER_ID}, {user.id for user in users})
+        # every caller gets its own model object
+        self.assertEqual(5, len({id(user) for user in users}))
+
+    def test_coalescing_is_off_by_default(self) -> None:
+        self.server = TSC.Server("http://test", False)
+        self.server.version = "3.10"
+        self.server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+        self.server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+        self.assertFalse(self.server.coalesce_requests)
+        with requests_mock.mock() as m:
+            m.get(f"{self.server.users.baseurl}/{USER_ID}", text=USER_GET_BY_ID_XML)
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                users = list(executor.map(lambda _: self.server.users.get_by_id(USER_ID), range(3)))
+
+        self.assertEqual(3, m.call_count)
+        self.assertEqual(0, self.server._single_flight.coalesced)
+        self.assertEqual(3, len(users))
+
+    def test_streamed_gets_are_not_coalesced(self) -> None:
+        calls = []
+
+        def do(key, fn):
+            calls.append(key)
+            return fn()
+
+        self.server._single_flight.do = do  # type: ignore[method-assign]
+        with requests_mock.mock() as m:
+            m.get(f"{self.server.users.baseurl}/{USER_ID}", text=USER_GET_BY_ID_XML)
+            self.server.users.get_request(f"{self.server.users.baseurl}/{USER_ID}", parameters={"stream": True})
+            self.server.users.get_request(f"{self.server.users.baseurl}/{USER_ID}")
+
+        self.assertEqual(1, len(calls))
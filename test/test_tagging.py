@@ -228,3 +228,65 @@ def test_tags_batch_delete(get_server) -> None:
         tag_result = server.tags.batch_delete(tags, content)
 
     assert set(tag_result) == set(tags)
+
+
+def test_tag_buffer_batches(get_server) -> None:
+    server = get_server
+    workbooks = [make_workbook() for _ in range(3)]
+    table = make_table()
+    with requests_mock.mock() as m:
+        m.put(f"{server.tags.baseurl}:batchCreate", text=add_tag_xml_response_factory(["a"]))
+        m.put(f"{server.tags.baseurl}:batchDelete", text=add_tag_xml_response_factory(["b"]))
+        with server.tags.buffer(batch_size=2) as tag_buffer:
+            tag_buffer.add(workbooks, "a")
+            tag_buffer.add(table, ["a", "b"])
+            # deleting a pending tag cancels the addition
+            tag_buffer.delete(table, "b")
+            assert len(tag_buffer) == 4
+        history = [(r.method, r.url.split(":")[-1], r.body) for r in m.request_history]
+
+    deletes = [body for _, url, body in history if url == "batchDelete"]
+    creates = [body for _, url, body in history if url == "batchCreate"]
+    assert history[0][1] == "batchDelete"
+    assert len(deletes) == 1
+    assert len(creates) == 2
+    assert b'label="b"' not in b"".join(creates)
+    assert all(body.count(b"<content ") <= 2 for body in creates)
+    assert all(workbook.tags == {"a"} for workbook in workbooks)
+    assert tag_buffer.errors == []
+    assert len(tag_buffer) == 0
+
+
+def test_tag_buffer_records_errors(get_server) -> None:
+    server = get_server
+    workbook = make_workbook()
+    with requests_mock.mock() as m:
+        m.put(f"{server.tags.baseurl}:batchCreate", status_code=500)
+        tag_buffer = server.tags.buffer()
+        tag_buffer.add(workbook, "a")
+        tag_buffer.flush()
+
+    ((operation, tags, items, error),) = tag_buffer.errors
+    assert (operation, tags, items) == ("add", frozenset({"a"}), [workbook])
+    assert isinstance(error, TSC.server.endpoint.exceptions.InternalServerError)
+    assert workbook.tags == set()
+
+
+def test_tag_buffer_per_item_fallback(get_server) -> None:
+    server = get_server
+    server.version = "3.8"
+    workbook = make_workbook()
+    datasource = make_datasource()
+    column = TSC.ColumnItem("column")
+    column._id = str(uuid.uuid4())
+    with requests_mock.mock() as m:
+        m.put(f"{server.workbooks.baseurl}/{workbook.id}/tags", text=add_tag_xml_response_factory(["a"]))
+        m.delete(f"{server.datasources.baseurl}/{datasource.id}/tags/b", status_code=204)
+        with server.tags.buffer(max_workers=2) as tag_buffer:
+            tag_buffer.add([workbook, column], "a")
+            tag_buffer.delete(datasource, "b")
+
+    assert workbook.tags == {"a"}
+    ((operation, _, items, error),) = tag_buffer.errors
+    assert items == [column]
+    assert isinstance(error, TSC.server.exceptions.EndpointUnavailableError)
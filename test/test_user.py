@@ -16,6 +16,7 @@ ADD_XML = os.path.join(TEST_ASSET_DIR, "user_add.xml")
 POPULATE_WORKBOOKS_XML = os.path.join(TEST_ASSET_DIR, "user_populate_workbooks.xml")
 GET_FAVORITES_XML = os.path.join(TEST_ASSET_DIR, "favorites_get.xml")
 POPULATE_GROUPS_XML = os.path.join(TEST_ASSET_DIR, "user_populate_groups.xml")
+IMPORT_XML = os.path.join(TEST_ASSET_DIR, "user_import.xml")
 
 USERNAMES = os.path.join(TEST_ASSET_DIR, "Data", "usernames.csv")
 USERS = os.path.join(TEST_ASSET_DIR, "Data", "user_details.csv")
@@ -223,13 +224,89 @@ class UserTests(unittest.TestCase):
             m.post(self.server.users.baseurl, text=response_xml)
             user_list, failures = self.server.users.create_from_file(USERNAMES)
         assert user_list[0].name == "Cassie", user_list
-        assert failures == [], failures
+        # the last two usernames in the file are invalid and never sent to the server
+        assert len(user_list) == 5, user_list
+        assert [user.name for user, _ in failures] == ["in@v@lid", "in valid"], failures
 
     def test_get_users_from_file(self):
         with open(ADD_XML, "rb") as f:
             response_xml = f.read().decode("utf-8")
+        with open(UPDATE_XML, "rb") as f:
+            update_xml = f.read().decode("utf-8")
         with requests_mock.mock() as m:
             m.post(self.server.users.baseurl, text=response_xml)
+            m.put(self.server.users.baseurl + "/4cc4c17f-898a-4de4-abed-a1681c673ced", text=update_xml)
             users, failures = self.server.users.create_from_file(USERS)
+            update_body = m.request_history[-1].body
         assert users[0].name == "Cassie", users
         assert failures == []
+        # display name, email and password are set with an update after the add
+        assert b'password="pword"' in update_body, update_body
+        assert b'email="email"' in update_body, update_body
+
+    def test_import_from_file_report(self):
+        with open(ADD_XML, "rb") as f:
+            response_xml = f.read().decode("utf-8")
+        with requests_mock.mock() as m:
+            m.post(self.server.users.baseurl, [{"text": response_xml}, {"status_code": 409, "text": ""}] * 5)
+            report = self.server.users.import_from_file(USERNAMES, max_workers=1)
+        statuses = [result.status for result in report]
+        self.assertEqual(["Created", "Failed"] * 2 + ["Created", "Invalid", "Invalid"], statuses)
+        self.assertEqual([1, 2, 3, 4, 5, 6, 7], [result.line_number for result in report])
+        self.assertEqual(3, len(report.created))
+        self.assertEqual(2, len(report.failed))
+        self.assertEqual("in valid", report.invalid[1].name)
+        self.assertIsNone(report.job)
+
+    def test_import_from_file_partially_applied(self):
+        with open(ADD_XML, "rb") as f:
+            response_xml = f.read().decode("utf-8")
+        with requests_mock.mock() as m:
+            m.post(self.server.users.baseurl, text=response_xml)
+            m.put(self.server.users.baseurl + "/4cc4c17f-898a-4de4-abed-a1681c673ced", status_code=500)
+            report = self.server.users.import_from_file(USERS)
+        result = report.results[0]
+        self.assertEqual("PartiallyApplied", result.status)
+        self.assertEqual("4cc4c17f-898a-4de4-abed-a1681c673ced", result.user.id)
+        self.assertIsInstance(result.error, TSC.server.endpoint.exceptions.InternalServerError)
+        self.assertEqual([result], report.partially_applied)
+        self.assertEqual([], report.created)
+
+    def test_import_from_file_as_job(self):
+        self.server.version = "3.15"
+        with open(IMPORT_XML, "rb") as f:
+            response_xml = f.read().decode("utf-8")
+        bodies = []
+
+        def read_body(request, context):
+            # the body is streamed from a temporary file that is closed after the request
+            bodies.append(request.body.read())
+            return response_xml
+
+        with requests_mock.mock() as m:
+            m.post(self.server.users.baseurl + "/import", text=read_body)
+            report = self.server.users.import_from_file(USERS)
+            request = m.request_history[0]
+        self.assertEqual("f2b3ee0e-70b5-4f4b-8c43-0e7ee6a07a5c", report.job.id)
+        self.assertEqual(["Queued"], [result.status for result in report])
+        self.assertTrue(request.headers["content-type"].startswith("multipart/mixed"))
+        boundary = request.headers["content-type"].partition("boundary=")[2].encode()
+        self.assertIn(b"\r\n\r\nusername,pword,,explorer,none,yes,email\r\n--" + boundary, bodies[0])
+        # no user has an auth setting, but the payload is still sent
+        self.assertIn(b'name="request_payload"', bodies[0])
+        self.assertIn(b"<tsRequest><users /></tsRequest>", bodies[0])
+        self.assertTrue(bodies[0].endswith(b"--" + boundary + b"--\r\n"))
+
+    def test_prefetch_favorites(self):
+        user = TSC.UserItem("alice", "Viewer")
+        user._id = "dd2239f6-ddf1-4107-981a-4cf94e415794"
+        with requests_mock.mock() as m:
+            # favorites are fetched eagerly by populate_favorites, groups are read through a Pager
+            for name in ("favorites", "groups"):
+                with self.assertRaises(ValueError):
+                    self.server.users.prefetch([user], name)
+            self.assertEqual(0, m.call_count)
+
+    def test_import_from_file_requires_csv(self):
+        with self.assertRaises(ValueError):
+            self.server.users.import_from_file("users.txt")
@@ -1,3 +1,4 @@
+import io
 import os
 import unittest
 
@@ -6,6 +7,7 @@ import requests_mock
 import tableauserverclient as TSC
 from tableauserverclient import UserItem, GroupItem, PermissionsRule
 from tableauserverclient.datetime_helpers import format_datetime
+from tableauserverclient.server.endpoint.bulk_export import csv_batches
 
 TEST_ASSET_DIR = os.path.join(os.path.dirname(__file__), "assets")
 
@@ -233,6 +235,54 @@ class ViewTests(unittest.TestCase):
             csv_file = b"".join(single_view.csv)
             self.assertEqual(response, csv_file)
 
+    def test_iter_csv_batches(self) -> None:
+        response = '\ufeffRegion,Note\nEast,plain\nWest,"two\nlines"\nNorth,caf\u00e9\n'.encode("utf-8")
+        with requests_mock.mock() as m:
+            m.get(self.baseurl + "/d79634e1-6063-4ec9-95ff-50acbf609ff5/data?maxAge=1", content=response)
+            single_view = TSC.ViewItem()
+            single_view._id = "d79634e1-6063-4ec9-95ff-50acbf609ff5"
+            request_option = TSC.CSVRequestOptions(maxage=1)
+            batches = list(self.server.views.iter_csv_batches(single_view, request_option, batch_rows=2))
+
+        self.assertEqual(
+            [
+                [{"Region": "East", "Note": "plain"}, {"Region": "West", "Note": "two\nlines"}],
+                [{"Region": "North", "Note": "caf\u00e9"}],
+            ],
+            batches,
+        )
+
+    def test_iter_csv_batches_streams(self) -> None:
+        content = "Region,Sales\n" + "".join(f"Region {i},{i}\n" for i in range(20000))
+        body = io.BytesIO(content.encode("utf-8"))
+        with requests_mock.mock() as m:
+            m.get(
+                self.baseurl + "/d79634e1-6063-4ec9-95ff-50acbf609ff5/data",
+                body=body,
+                headers={"Content-Type": "text/csv; charset=utf-8"},
+            )
+            single_view = TSC.ViewItem()
+            single_view._id = "d79634e1-6063-4ec9-95ff-50acbf609ff5"
+            batches = self.server.views.iter_csv_batches(single_view, batch_rows=10)
+            first = next(batches)
+            # the first batch is yielded before the rest of the body is downloaded
+            self.assertLess(body.tell(), len(content))
+            self.assertEqual({"Region": "Region 0", "Sales": "0"}, first[0])
+            self.assertEqual(20000, len(first) + sum(len(batch) for batch in batches))
+
+    def test_iter_csv_batches_split_chunks(self) -> None:
+        content = "Region,Sales\n" + "".join(f"Caf\u00e9 {i},{i}\n" for i in range(25))
+        data = content.encode("utf-8")
+        # single byte chunks split the multi-byte characters and the lines
+        chunks = (data[i : i + 1] for i in range(len(data)))
+        batches = list(csv_batches(chunks, 10, converter=len))
+        self.assertEqual([10, 10, 5], batches)
+
+    def test_iter_csv_batches_missing_id(self) -> None:
+        single_view = TSC.ViewItem()
+        single_view._id = None
+        self.assertRaises(TSC.MissingRequiredFieldError, self.server.views.iter_csv_batches, single_view)
+
     def test_populate_image_missing_id(self) -> None:
         single_view = TSC.ViewItem()
         single_view._id = None
@@ -367,6 +367,49 @@ class WorkbookTests(unittest.TestCase):
             self.assertEqual("4506225a-0d32-4ab1-82d3-c24e85f7afba", single_workbook.connections[0].datasource_id)
             self.assertEqual("World Indicators", single_workbook.connections[0].datasource_name)
 
+    def test_prefetch(self) -> None:
+        with open(POPULATE_VIEWS_XML, "rb") as f:
+            views_xml = f.read().decode("utf-8")
+        with open(POPULATE_CONNECTIONS_XML, "rb") as f:
+            connections_xml = f.read().decode("utf-8")
+        with requests_mock.mock() as m:
+            m.get(re.compile(r"/workbooks/[^/]+/views"), text=views_xml)
+            m.get(re.compile(r"/workbooks/[^/]+/connections"), text=connections_xml)
+            workbooks = []
+            for workbook_id in ("a", "b", "c"):
+                workbook = TSC.WorkbookItem("test")
+                workbook._id = workbook_id
+                workbooks.append(workbook)
+            self.server.workbooks.prefetch(workbooks, "views", "connections", max_workers=2)
+            self.assertEqual(6, m.call_count)
+
+            for workbook in workbooks:
+                self.assertEqual(3, len(workbook.views))
+                self.assertEqual("dataengine", workbook.connections[0].connection_type)
+            self.assertEqual(6, m.call_count)
+
+    def test_prefetch_queryset(self) -> None:
+        with open(GET_XML, "rb") as f:
+            get_xml = f.read().decode("utf-8")
+        with open(POPULATE_CONNECTIONS_XML, "rb") as f:
+            connections_xml = f.read().decode("utf-8")
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, text=get_xml)
+            m.get(re.compile(r"/workbooks/[^/]+/connections"), text=connections_xml)
+            workbooks = list(self.server.workbooks.all().prefetch("connections"))
+            requests_made = m.call_count
+
+            self.assertEqual(2, len(workbooks))
+            for workbook in workbooks:
+                self.assertEqual("37ca6ced-58d7-4dcf-99dc-f0a85223cbef", workbook.connections[0].id)
+            self.assertEqual(requests_made, m.call_count)
+            connection_requests = [r.path for r in m.request_history if r.path.endswith("/connections")]
+            self.assertEqual(2, len(connection_requests))
+
+    def test_prefetch_unknown(self) -> None:
+        with self.assertRaises(ValueError):
+            self.server.workbooks.all().prefetch("owners")
+
     def test_populate_permissions(self) -> None:
         with open(POPULATE_PERMISSIONS_XML, "rb") as f:
             response_xml = f.read().decode("utf-8")